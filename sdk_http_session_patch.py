@@ -0,0 +1,103 @@
+"""
+Shared HTTP session for the Boomi SDK.
+
+The Boomi SDK's HttpHandler sends every API call through the module-level
+``requests.request()``, which builds and tears down a throwaway
+``requests.Session`` per call: no keep-alive, so each tool call pays a fresh
+TCP + TLS handshake to api.boomi.com. This module points the handler at one
+process-wide ``requests.Session`` instead, so connections are pooled and
+reused across calls and across Boomi client instances.
+
+The shared session refuses to store cookies: it serves every account and
+user in the process, and nothing may leak from one caller's responses into
+another's requests. No retries are added (the SDK also issues non-idempotent
+POSTs); proxies/env settings behave as with ``requests.request``.
+
+JSON request bodies (the SDK hands them over as ``json=``) are pre-encoded
+with orjson when it is installed, instead of requests' stdlib json.dumps;
+bodies orjson cannot encode fall through to requests unchanged.
+
+Set BOOMI_SDK_SHARED_SESSION_DISABLE=true to keep the SDK's per-call
+behaviour.
+"""
+
+import atexit
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from types import SimpleNamespace
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# orjson ships with requirements-cloud.txt only; without it, JSON bodies are
+# encoded by requests as before.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("boomi.sdk_http_session")
+
+# Connections kept per host. Tool calls run in FastMCP's worker threads, so
+# size the pool for a handful of concurrent calls to the same API host.
+POOL_MAXSIZE = 20
+
+_lock = threading.Lock()
+_session = None
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+                atexit.register(_session.close)
+    return _session
+
+
+def _encode_json_body(kwargs: dict) -> dict:
+    """Swap a ``json=`` body for orjson-encoded ``data=`` bytes, if possible."""
+    body = kwargs.get("json")
+    if orjson is None or body is None or kwargs.get("data") is not None:
+        return kwargs
+    try:
+        encoded = orjson.dumps(body)
+    except TypeError:  # orjson.JSONEncodeError; let requests handle it
+        return kwargs
+    headers = CaseInsensitiveDict(kwargs.get("headers") or {})
+    headers.setdefault("Content-Type", "application/json")
+    kwargs = {k: v for k, v in kwargs.items() if k != "json"}
+    kwargs["data"] = encoded
+    kwargs["headers"] = headers
+    return kwargs
+
+
+def apply_sdk_http_session_patch():
+    """Route the Boomi SDK's HttpHandler through the shared session.
+
+    Idempotent. Only the handler module's ``requests`` reference is replaced;
+    the global ``requests`` module is untouched.
+    """
+    from boomi.net.request_chain.handlers import http_handler
+
+    if getattr(http_handler.requests, "_boomi_shared_session", False):
+        return
+
+    def request(method, url, **kwargs):
+        return get_shared_session().request(method, url, **_encode_json_body(kwargs))
+
+    http_handler.requests = SimpleNamespace(request=request, _boomi_shared_session=True)
+    logger.info("Boomi SDK HTTP calls use a shared keep-alive session")
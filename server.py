@@ -15,15 +15,30 @@ When BOOMI_LOCAL is not set (production):
 - Runs in HTTP mode via server_http.py
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from html import escape as html_escape
 from enum import Enum
 from typing import Any, Dict
 from pathlib import Path
 
+# orjson ships with requirements-cloud.txt only; fall back to the stdlib json
+# module when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decoder for the JSON-string tool arguments (config, filters, patch, ...).
+# orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError, so
+# callers guard with ``except (ValueError, TypeError)`` whichever is active.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Wire the `boomi.*` logger tree to stderr at INFO so the
 # refresh-token/cache/storage-healing patches' boot + runtime lines reach
 # Cloud Logging. Scoped to "boomi" only so uvicorn/fastmcp/motor INFO
@@ -45,6 +60,37 @@ if not _boomi_log.handlers:
     _boomi_log.addHandler(_h)
     _boomi_log.setLevel(logging.INFO)
 
+# Logger for the tool wrappers below. A child of the "boomi" tree, so records
+# go through the handler configured above; `_log.exception(...)` only renders
+# the traceback when the record is actually emitted.
+_log = logging.getLogger("boomi.server")
+# Optional per-process override for the tool-wrapper logger only (e.g.
+# BOOMI_MCP_LOG_LEVEL=WARNING to silence per-call INFO lines). Unset keeps the
+# "boomi" tree's INFO level, so the patch modules' lines are unaffected.
+_log_level_override = os.getenv("BOOMI_MCP_LOG_LEVEL", "").strip().upper()
+if _log_level_override:
+    try:
+        _log.setLevel(_log_level_override)
+    except ValueError:
+        _log.warning("Ignoring invalid BOOMI_MCP_LOG_LEVEL=%r", _log_level_override)
+
+# Per-module "... loaded/registered successfully" lines only help a human
+# starting the server by hand. MCP hosts spawn it with stdio on pipes, so skip
+# them there (and under -O) instead of writing ~80 lines on every spawn.
+_VERBOSE_STARTUP = __debug__ and sys.stderr.isatty()
+
+
+def _startup_info(msg: str) -> None:
+    if _VERBOSE_STARTUP:
+        _log.info(msg)
+
+
+# Tool wrappers return structured error dicts, so FastMCP only renders a
+# traceback for the rare exception that escapes one. Rich tracebacks make that
+# path slow and flood stderr; default them off (before fastmcp reads its
+# settings) unless the operator opts back in.
+os.environ.setdefault("FASTMCP_ENABLE_RICH_TRACEBACKS", "false")
+
 from fastmcp import FastMCP
 
 # --- Mode Detection ---
@@ -75,6 +121,19 @@ async def run_strict_startup_probes() -> None:
                 f"{type(exc).__name__}: {exc}"
             ) from exc
 
+# Shared httpx client for the web portal's outbound OAuth calls (token
+# exchange). Created lazily by the web routes so it binds to the serving loop;
+# closed from the HTTP lifespan (server_http.py) via close_web_http_client().
+_web_http_client = None
+
+
+async def close_web_http_client() -> None:
+    """Close the shared web-portal httpx client, if one was created."""
+    global _web_http_client
+    client, _web_http_client = _web_http_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 # --- Boomi Docs KB feature flag ---
 # Master switch for the optional documentation retrieval layer. When false (the
 # default) no KB modules are imported and no KB tools/resource are registered,
@@ -198,20 +257,16 @@ def _gotcha_hint(func):
 # Additional imports for production mode
 if not LOCAL_MODE:
     import secrets
-    import hashlib
     import base64
     from typing import Optional
     from fastmcp.server.dependencies import get_access_token
 
-# --- Add boomi-python to path ---
+# --- Add src (first) and a sibling boomi-python checkout to path ---
+# One stat per directory and a single sys.path splice (same resulting order as
+# inserting boomi-python, then src, at index 0).
 boomi_python_path = Path(__file__).parent.parent / "boomi-python" / "src"
-if boomi_python_path.exists():
-    sys.path.insert(0, str(boomi_python_path))
-
-# --- Add src to path ---
 src_path = Path(__file__).parent / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
+sys.path[:0] = [p for p in (str(src_path), str(boomi_python_path)) if os.path.isdir(p)]
 
 try:
     from boomi import Boomi
@@ -222,6 +277,13 @@ except ImportError as e:
     print(f"       Run: pip install git+https://github.com/RenEra-ai/boomi-python.git")
     sys.exit(1)
 
+# Pool the SDK's HTTPS connections instead of one throwaway session per call.
+if os.getenv("BOOMI_SDK_SHARED_SESSION_DISABLE", "").lower() not in ("true", "1", "yes"):
+    from sdk_http_session_patch import apply_sdk_http_session_patch
+    apply_sdk_http_session_patch()
+
+from boomi_mcp.utils.ttl_cache import TTLCache
+
 # --- Secrets Backend (conditional) ---
 if LOCAL_MODE:
     try:
@@ -250,7 +312,7 @@ else:
 # --- Trading Partner Tools ---
 try:
     from boomi_mcp.categories.components.trading_partners import manage_trading_partner_action
-    print(f"[INFO] Trading partner tools loaded successfully")
+    _startup_info("Trading partner tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import trading partner tools: {e}")
     manage_trading_partner_action = None
@@ -258,7 +320,7 @@ except ImportError as e:
 # --- Process Tools ---
 try:
     from boomi_mcp.categories.components.processes import manage_process_action
-    print(f"[INFO] Process tools loaded successfully")
+    _startup_info("Process tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import process tools: {e}")
     manage_process_action = None
@@ -266,7 +328,7 @@ except ImportError as e:
 # --- Organization Tools ---
 try:
     from boomi_mcp.categories.components.organizations import manage_organization_action
-    print(f"[INFO] Organization tools loaded successfully")
+    _startup_info("Organization tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import organization tools: {e}")
     manage_organization_action = None
@@ -274,7 +336,7 @@ except ImportError as e:
 # --- Component Query Tools ---
 try:
     from boomi_mcp.categories.components.query_components import query_components_action
-    print(f"[INFO] Component query tools loaded successfully")
+    _startup_info("Component query tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import component query tools: {e}")
     query_components_action = None
@@ -282,7 +344,7 @@ except ImportError as e:
 # --- Component Management Tools ---
 try:
     from boomi_mcp.categories.components.manage_component import manage_component_action
-    print(f"[INFO] Component management tools loaded successfully")
+    _startup_info("Component management tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import component management tools: {e}")
     manage_component_action = None
@@ -290,7 +352,7 @@ except ImportError as e:
 # --- Component Analysis Tools ---
 try:
     from boomi_mcp.categories.components.analyze_component import analyze_component_action
-    print(f"[INFO] Component analysis tools loaded successfully")
+    _startup_info("Component analysis tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import component analysis tools: {e}")
     analyze_component_action = None
@@ -301,7 +363,7 @@ try:
         prepare_component_edit_action,
         apply_component_edit_action,
     )
-    print(f"[INFO] Safe component edit workflow loaded successfully")
+    _startup_info("Safe component edit workflow loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import safe component edit workflow: {e}")
     prepare_component_edit_action = None
@@ -310,7 +372,7 @@ except ImportError as e:
 # --- Connector Tools ---
 try:
     from boomi_mcp.categories.components.connectors import manage_connector_action
-    print(f"[INFO] Connector tools loaded successfully")
+    _startup_info("Connector tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import connector tools: {e}")
     manage_connector_action = None
@@ -320,7 +382,7 @@ try:
     from boomi_mcp.categories.components.connection_reuse import (
         suggest_connection_reuse_action,
     )
-    print(f"[INFO] Connection reuse discovery tool loaded successfully")
+    _startup_info("Connection reuse discovery tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import connection reuse discovery tool: {e}")
     suggest_connection_reuse_action = None
@@ -328,7 +390,7 @@ except ImportError as e:
 # --- Marketplace Recipe Search Tool (Issue #84, M7.4) ---
 try:
     from boomi_mcp.categories.marketplace import search_marketplace_recipes_action
-    print(f"[INFO] Marketplace recipe search tool loaded successfully")
+    _startup_info("Marketplace recipe search tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import marketplace recipe search tool: {e}")
     search_marketplace_recipes_action = None
@@ -336,7 +398,7 @@ except ImportError as e:
 # --- Existing-Profile Index Discovery Tool (Issue #95, M7.5) ---
 try:
     from boomi_mcp.categories.profile_index import index_profile_component_action
-    print(f"[INFO] index_profile_component discovery tool loaded successfully")
+    _startup_info("index_profile_component discovery tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import index_profile_component tool: {e}")
     index_profile_component_action = None
@@ -349,7 +411,7 @@ try:
         discover_odata_metadata_action,
         discover_db_schema_action,
     )
-    print(f"[INFO] Schema discovery tools loaded successfully")
+    _startup_info("Schema discovery tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import schema discovery tools: {e}")
     discover_openapi_spec_action = None
@@ -360,7 +422,7 @@ except ImportError as e:
 # --- Folder Tools ---
 try:
     from boomi_mcp.categories.folders import manage_folders_action
-    print(f"[INFO] Folder tools loaded successfully")
+    _startup_info("Folder tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import folder tools: {e}")
     manage_folders_action = None
@@ -368,7 +430,7 @@ except ImportError as e:
 # --- Monitoring Tools ---
 try:
     from boomi_mcp.categories.monitoring import monitor_platform_action
-    print(f"[INFO] Monitoring tools loaded successfully")
+    _startup_info("Monitoring tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import monitoring tools: {e}")
     monitor_platform_action = None
@@ -376,7 +438,7 @@ except ImportError as e:
 # --- Schema Template Tools ---
 try:
     from boomi_mcp.categories.meta_tools import get_schema_template_action
-    print(f"[INFO] Schema template tools loaded successfully")
+    _startup_info("Schema template tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import schema template tools: {e}")
     get_schema_template_action = None
@@ -384,7 +446,7 @@ except ImportError as e:
 # --- Generic API Invoker ---
 try:
     from boomi_mcp.categories.meta_tools import invoke_api
-    print(f"[INFO] Generic API invoker loaded successfully")
+    _startup_info("Generic API invoker loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import generic API invoker: {e}")
     invoke_api = None
@@ -392,7 +454,7 @@ except ImportError as e:
 # --- List Capabilities ---
 try:
     from boomi_mcp.categories.meta_tools import list_capabilities_action
-    print(f"[INFO] List capabilities loaded successfully")
+    _startup_info("List capabilities loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import list capabilities: {e}")
     list_capabilities_action = None
@@ -404,7 +466,7 @@ try:
         PLAN_INTEGRATION_DESIGN_OUTPUT_SCHEMA,
     )
     from fastmcp.tools.tool import ToolResult
-    print(f"[INFO] Plan integration design loaded successfully")
+    _startup_info("Plan integration design loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import plan integration design: {e}")
     plan_integration_design_action = None
@@ -412,7 +474,7 @@ except ImportError as e:
 # --- Environment Tools ---
 try:
     from boomi_mcp.categories.environments import manage_environments_action
-    print(f"[INFO] Environment tools loaded successfully")
+    _startup_info("Environment tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import environment tools: {e}")
     manage_environments_action = None
@@ -420,7 +482,7 @@ except ImportError as e:
 # --- Runtime Tools ---
 try:
     from boomi_mcp.categories.runtimes import manage_runtimes_action
-    print(f"[INFO] Runtime tools loaded successfully")
+    _startup_info("Runtime tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import runtime tools: {e}")
     manage_runtimes_action = None
@@ -428,7 +490,7 @@ except ImportError as e:
 # --- Deployment Tools ---
 try:
     from boomi_mcp.categories.deployment.packages import manage_deployment_action
-    print(f"[INFO] Deployment tools loaded successfully")
+    _startup_info("Deployment tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import deployment tools: {e}")
     manage_deployment_action = None
@@ -436,7 +498,7 @@ except ImportError as e:
 # --- Deployment Orchestration Tool (issue #64) ---
 try:
     from boomi_mcp.categories.deployment import orchestrate_deploy_action
-    print(f"[INFO] Deployment orchestration tool loaded successfully")
+    _startup_info("Deployment orchestration tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import deployment orchestration tool: {e}")
     orchestrate_deploy_action = None
@@ -444,7 +506,7 @@ except ImportError as e:
 # --- Execution Tools ---
 try:
     from boomi_mcp.categories.execution import execute_process_action
-    print(f"[INFO] Execution tools loaded successfully")
+    _startup_info("Execution tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import execution tools: {e}")
     execute_process_action = None
@@ -452,7 +514,7 @@ except ImportError as e:
 # --- Shared Resources Tools ---
 try:
     from boomi_mcp.categories.shared_resources import manage_shared_resources_action
-    print(f"[INFO] Shared resources tools loaded successfully")
+    _startup_info("Shared resources tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import shared resources tools: {e}")
     manage_shared_resources_action = None
@@ -460,7 +522,7 @@ except ImportError as e:
 # --- Troubleshooting Tools ---
 try:
     from boomi_mcp.categories.troubleshooting import troubleshoot_execution_action
-    print(f"[INFO] Troubleshooting tools loaded successfully")
+    _startup_info("Troubleshooting tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import troubleshooting tools: {e}")
     troubleshoot_execution_action = None
@@ -468,7 +530,7 @@ except ImportError as e:
 # --- Schedule Tools ---
 try:
     from boomi_mcp.categories.schedules import manage_schedules_action
-    print(f"[INFO] Schedule tools loaded successfully")
+    _startup_info("Schedule tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import schedule tools: {e}")
     manage_schedules_action = None
@@ -476,7 +538,7 @@ except ImportError as e:
 # --- Account Tools ---
 try:
     from boomi_mcp.categories.account import manage_account_action
-    print(f"[INFO] Account tools loaded successfully")
+    _startup_info("Account tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import account tools: {e}")
     manage_account_action = None
@@ -484,7 +546,7 @@ except ImportError as e:
 # --- Listener Tools ---
 try:
     from boomi_mcp.categories.listeners import manage_listeners_action
-    print(f"[INFO] Listener tools loaded successfully")
+    _startup_info("Listener tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import listener tools: {e}")
     manage_listeners_action = None
@@ -492,7 +554,7 @@ except ImportError as e:
 # --- Integration Pack Tools ---
 try:
     from boomi_mcp.categories.integration_packs import manage_integration_packs_action
-    print(f"[INFO] Integration pack tools loaded successfully")
+    _startup_info("Integration pack tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import integration pack tools: {e}")
     manage_integration_packs_action = None
@@ -500,7 +562,7 @@ except ImportError as e:
 # --- Account Group Tools ---
 try:
     from boomi_mcp.categories.account_groups import manage_account_groups_action
-    print(f"[INFO] Account group tools loaded successfully")
+    _startup_info("Account group tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import account group tools: {e}")
     manage_account_groups_action = None
@@ -508,7 +570,7 @@ except ImportError as e:
 # --- Integration Builder Tool ---
 try:
     from boomi_mcp.categories.integration_builder import build_integration_action
-    print(f"[INFO] Integration builder tool loaded successfully")
+    _startup_info("Integration builder tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import integration builder tool: {e}")
     build_integration_action = None
@@ -521,7 +583,7 @@ try:
         build_from_archetype_action,
         compose_archetypes_action,
     )
-    print("[INFO] Integration authoring tools loaded successfully")
+    _startup_info("Integration authoring tools loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import integration authoring tools: {e}")
     list_integration_archetypes_action = None
@@ -532,7 +594,7 @@ except ImportError as e:
 # --- Transformation Review Tool (Issue #46) ---
 try:
     from boomi_mcp.categories.transformation_review import review_transformation_action
-    print("[INFO] Transformation review tool loaded successfully")
+    _startup_info("Transformation review tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import transformation review tool: {e}")
     review_transformation_action = None
@@ -540,7 +602,7 @@ except ImportError as e:
 # --- Profile Inference Discovery Tool (Issue #47) ---
 try:
     from boomi_mcp.categories.integration_authoring import infer_profile_fields_action
-    print("[INFO] Profile inference tool loaded successfully")
+    _startup_info("Profile inference tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import profile inference tool: {e}")
     infer_profile_fields_action = None
@@ -548,20 +610,15 @@ except ImportError as e:
 # --- Existing Integration Import Tool (Issue #48) ---
 try:
     from boomi_mcp.categories.integration_import import import_integration_draft_action
-    print("[INFO] Integration import tool loaded successfully")
+    _startup_info("Integration import tool loaded successfully")
 except ImportError as e:
     print(f"[WARNING] Failed to import integration import tool: {e}")
     import_integration_draft_action = None
 
 
-def _sanitize_error_msg(msg: str) -> str:
-    """Strip URLs and file paths from error messages to prevent information leaks."""
-    import re
-    # Strip http(s) URLs
-    msg = re.sub(r'https?://[^\s\'")\]}>]+', '<redacted-url>', msg)
-    # Strip file paths that look like absolute paths
-    msg = re.sub(r'(/[a-zA-Z0-9_./-]{3,})', '<redacted-path>', msg)
-    return msg
+# Strip URLs and file paths from error messages to prevent information leaks.
+# Shared with the category modules; its patterns are compiled once at import.
+from boomi_mcp.sanitize import sanitize_error_msg as _sanitize_error_msg
 
 
 def _extract_api_error_msg(e) -> str:
@@ -600,7 +657,9 @@ def _serialize_sdk_object(obj):
 def put_secret(sub: str, profile: str, payload: Dict[str, str]):
     """Store credentials for a user profile."""
     secrets_backend.put_secret(sub, profile, payload)
-    print(f"[INFO] Stored credentials for {sub}:{profile} (username: {payload.get('username', '')[:10]}***)")
+    # Guarded so the username slice is skipped entirely above INFO.
+    if _log.isEnabledFor(logging.INFO):
+        _log.info("Stored credentials for %s:%s (username: %s***)", sub, profile, payload.get("username", "")[:10])
 
 
 class DisabledProfileError(ValueError):
@@ -641,6 +700,18 @@ def _is_profile_disabled(sub: str, profile: str) -> bool:
         return False
 
 
+def _is_listed_profile_disabled(sub: str, entry: Dict[str, Any]) -> bool:
+    """Disabled flag for a list_profiles() entry.
+
+    Uses the flag when the backend's listing already carries it (the local
+    file backend does, from the same read), so listing N profiles doesn't
+    cost N more secret reads; otherwise falls back to _is_profile_disabled.
+    """
+    if "disabled" in entry:
+        return bool(entry["disabled"])
+    return _is_profile_disabled(sub, entry["profile"])
+
+
 def list_profiles(sub: str):
     """List all profiles for a user."""
     return secrets_backend.list_profiles(sub)
@@ -651,6 +722,77 @@ def delete_profile(sub: str, profile: str):
     secrets_backend.delete_profile(sub, profile)
 
 
+# --- Boomi SDK client reuse ---
+# Building a Boomi client wires up ~100 service objects, and every tool call
+# used to build a fresh one from the stored credentials. Clients are reused per
+# credential set instead. Keys carry a digest of the password (never the
+# password itself), so changed credentials map to a new client.
+#
+# Because the keys are derived from the credentials themselves, storing or
+# deleting a profile needs no explicit invalidation: new credentials can never
+# hit an entry built from old ones, and a deleted profile can no longer be
+# resolved to credentials at all. Stale entries just age out.
+_SDK_CACHE = TTLCache(max_size=64, ttl_seconds=600)
+# Serialized get_account results. Agents call boomi_account_info repeatedly to
+# reconfirm the account, and set_boomi_credentials' validation call warms it too.
+_ACCOUNT_CACHE = TTLCache(max_size=64, ttl_seconds=300)
+
+
+def _creds_key(creds: Dict[str, str]) -> tuple:
+    """Cache key for a credential set: account, user, password digest, base_url."""
+    return (
+        creds["account_id"],
+        creds["username"],
+        hashlib.blake2b(creds["password"].encode("utf-8"), digest_size=16).digest(),
+        creds.get("base_url") or "",
+    )
+
+
+def _sdk_for(creds: Dict[str, str], timeout: int = 30000):
+    """Return a Boomi client for *creds*, reusing a cached one when possible.
+
+    ``timeout`` is in milliseconds (the SDK's unit).
+    """
+    key = _creds_key(creds) + (timeout,)
+    sdk = _SDK_CACHE.get(key)
+    if sdk is not None:
+        return sdk
+    sdk_params = {
+        "account_id": creds["account_id"],
+        "username": creds["username"],
+        "password": creds["password"],
+        "timeout": timeout,
+    }
+    # Only add base_url if explicitly provided (not None)
+    if creds.get("base_url"):
+        sdk_params["base_url"] = creds["base_url"]
+    sdk = Boomi(**sdk_params)
+    _SDK_CACHE.set(key, sdk)
+    return sdk
+
+
+def _get_account_cached(creds: Dict[str, str], timeout: int = 30000) -> tuple:
+    """get_account for *creds*, served from a 300s cache when fresh.
+
+    A cache hit needs no SDK client; on a miss the client comes from
+    _sdk_for(creds, timeout).
+
+    Returns ``(info, from_cache)``: ``info`` is the account serialized with
+    _serialize_sdk_object (done once per fetch, not per cache hit), or None
+    when the response carried no attributes. Callers must copy ``info``
+    before modifying it. Failed calls are not cached, and a None ``info``
+    is fetched again on the next call.
+    """
+    key = _creds_key(creds)
+    info = _ACCOUNT_CACHE.get(key)
+    if info is not None:
+        return info, True
+    result = _sdk_for(creds, timeout).account.get_account(id_=creds["account_id"])
+    info = _serialize_sdk_object(result) if hasattr(result, "__dict__") else None
+    _ACCOUNT_CACHE.set(key, info)
+    return info, False
+
+
 # --- OAuth Setup (production only) ---
 if not LOCAL_MODE:
     from fastmcp.server.auth.providers.google import GoogleProvider
@@ -930,15 +1072,18 @@ def list_boomi_profiles():
     """
     try:
         subject = get_current_user()
-        print(f"[INFO] list_boomi_profiles called by user: {subject}")
+        _log.info("list_boomi_profiles called by user: %s", subject)
 
-        profiles = list_profiles(subject)
         # Hide disabled profiles from the LLM entirely — a disabled profile must
         # not be visible to or usable by MCP.
-        profiles = [p for p in profiles if not _is_profile_disabled(subject, p["profile"])]
-        print(f"[INFO] Found {len(profiles)} profiles for {subject}")
+        names = [
+            p["profile"]
+            for p in list_profiles(subject)
+            if not _is_listed_profile_disabled(subject, p)
+        ]
+        _log.info("Found %d profiles for %s", len(names), subject)
 
-        if not profiles:
+        if not names:
             result = {
                 "_success": True,
                 "profiles": [],
@@ -950,14 +1095,14 @@ def list_boomi_profiles():
 
         result = {
             "_success": True,
-            "profiles": [p["profile"] for p in profiles],
-            "count": len(profiles),
+            "profiles": names,
+            "count": len(names),
         }
         if not LOCAL_MODE:
             result["web_portal"] = "https://boomi.renera.ai/"
         return result
     except Exception as e:
-        print(f"[ERROR] Failed to list profiles: {e}")
+        _log.error("Failed to list profiles: %s", e)
         return {
             "_success": False,
             "error": f"Failed to list profiles: {str(e)}"
@@ -1008,9 +1153,9 @@ def boomi_account_info(profile: str):
     """
     try:
         subject = get_current_user()
-        print(f"[INFO] boomi_account_info called by user: {subject}, profile: {profile}")
+        _log.info("boomi_account_info called by user: %s, profile: %s", subject, profile)
     except Exception as e:
-        print(f"[ERROR] Failed to get user subject: {e}")
+        _log.error("Failed to get user subject: %s", e)
         return {
             "_success": False,
             "error": f"Authentication failed: {str(e)}"
@@ -1019,25 +1164,27 @@ def boomi_account_info(profile: str):
     # Try to get stored credentials
     try:
         creds = get_secret(subject, profile)
-        print(f"[INFO] Successfully retrieved stored credentials for {subject}:{profile}")
-        print(f"[INFO] Account ID: {creds.get('account_id')}, Username: {creds.get('username', '')[:20]}...")
+        account_id = creds["account_id"]
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Successfully retrieved stored credentials for %s:%s", subject, profile)
+            _log.info("Account ID: %s, Username: %s...", account_id, creds.get("username", "")[:20])
     except DisabledProfileError as e:
-        print(f"[INFO] Profile '{profile}' is disabled for {subject}")
+        _log.info("Profile '%s' is disabled for %s", profile, subject)
         return {
             "_success": False,
             "error": str(e),
         }
     except ValueError as e:
-        print(f"[ERROR] Profile '{profile}' not found for user {subject}: {e}")
+        _log.error("Profile '%s' not found for user %s: %s", profile, subject, e)
 
         # List available profiles, excluding disabled ones — disabled profiles
         # are hidden from MCP, so they must not leak through this suggestion list.
         available_profiles = [
             p["profile"]
             for p in list_profiles(subject)
-            if not _is_profile_disabled(subject, p["profile"])
+            if not _is_listed_profile_disabled(subject, p)
         ]
-        print(f"[INFO] Available profiles for {subject}: {available_profiles}")
+        _log.info("Available profiles for %s: %s", subject, available_profiles)
 
         result = {
             "_success": False,
@@ -1048,38 +1195,26 @@ def boomi_account_info(profile: str):
             result["web_portal"] = "https://boomi-mcp-server-126964451821.us-central1.run.app/"
         return result
     except Exception as e:
-        print(f"[ERROR] Unexpected error retrieving credentials: {e}")
+        _log.error("Unexpected error retrieving credentials: %s", e)
         return {
             "_success": False,
             "error": f"Failed to retrieve credentials: {str(e)}"
         }
 
-    print(f"[INFO] Calling Boomi API for {subject}:{profile} (account: {creds['account_id']})")
+    _log.info("Calling Boomi API for %s:%s (account: %s)", subject, profile, account_id)
 
-    # Initialize Boomi SDK
     try:
-        sdk_params = {
-            "account_id": creds["account_id"],
-            "username": creds["username"],
-            "password": creds["password"],
-            "timeout": 30000,  # 30 seconds (SDK uses milliseconds)
-        }
-
-        # Only add base_url if explicitly provided (not None)
-        if creds.get("base_url"):
-            sdk_params["base_url"] = creds["base_url"]
-
-        sdk = Boomi(**sdk_params)
+        # Call the same endpoint the sample demonstrates (SDK client built
+        # or reused only on a cache miss)
+        info, cached = _get_account_cached(creds)
 
-        # Call the same endpoint the sample demonstrates
-        result = sdk.account.get_account(id_=creds["account_id"])
-
-        # Convert to plain dict for transport (recursive for nested SDK objects)
-        if hasattr(result, "__dict__"):
-            out = _serialize_sdk_object(result)
+        if info is not None:
+            out = dict(info)
             out["_success"] = True
             out["_note"] = "Account data retrieved successfully"
-            print(f"[INFO] Successfully retrieved account info for {creds['account_id']}")
+            if cached:
+                out["_cached"] = True
+            _log.info("Successfully retrieved account info for %s", account_id)
             return out
 
         return {
@@ -1089,25 +1224,61 @@ def boomi_account_info(profile: str):
         }
 
     except ApiError as e:
-        print(f"[ERROR] Boomi API call failed: {e}")
+        _log.error("Boomi API call failed: %s", e)
         return {
             "_success": False,
             "error": _extract_api_error_msg(e),
-            "account_id": creds["account_id"],
+            "account_id": account_id,
             "_note": "Check credentials and API access permissions"
         }
     except Exception as e:
-        print(f"[ERROR] Boomi API call failed: {e}")
+        _log.error("Boomi API call failed: %s", e)
         return {
             "_success": False,
             "error": str(e),
-            "account_id": creds["account_id"],
+            "account_id": account_id,
             "_note": "Check credentials and API access permissions"
         }
 
 
 # --- Trading Partner MCP Tools ---
 if manage_trading_partner_action:
+    def _tp_pg_params(resource_id, config_data):
+        params = {}
+        if resource_id:
+            params["resource_id"] = resource_id
+        if config_data:
+            params.update(config_data)
+        return params
+
+    # action -> builder of manage_trading_partner_action kwargs from
+    # (resource_id, parsed config or None when no config was given). Also the
+    # authoritative set of non-org actions the tool accepts.
+    _TP_PARAM_BUILDERS = {
+        "list": lambda rid, c: {"filters": c} if c else {},
+        "get": lambda rid, c: {"partner_id": rid},
+        "create": lambda rid, c: {"request_data": c},
+        "update": lambda rid, c: {"partner_id": rid, "updates": c or {}},
+        "delete": lambda rid, c: {"partner_id": rid},
+        "analyze_usage": lambda rid, c: {"partner_id": rid},
+        "pg_list": _tp_pg_params,
+        "pg_get": _tp_pg_params,
+        "pg_create": _tp_pg_params,
+        "pg_update": _tp_pg_params,
+        "pg_delete": _tp_pg_params,
+    }
+
+    # org_* action -> manage_organization_action kwargs, built from
+    # (resource_id, parsed config or {}). The "org_" prefix is stripped before
+    # the organization module is called.
+    _ORG_PARAM_BUILDERS = {
+        "org_list": lambda rid, c: {"filters": c} if c else {},
+        "org_get": lambda rid, c: {"organization_id": rid},
+        "org_create": lambda rid, c: {"request_data": c},
+        "org_update": lambda rid, c: {"organization_id": rid, "updates": c},
+        "org_delete": lambda rid, c: {"organization_id": rid},
+    }
+
     @mcp.tool()
     @_kb_hint
     def manage_trading_partner(
@@ -1276,98 +1447,67 @@ if manage_trading_partner_action:
         if action == "list_options":
             return manage_trading_partner_action(None, profile, action)
 
+        # Unknown actions fail fast, before any credential lookup; the action
+        # module's error lists the valid actions.
+        org_builder = _ORG_PARAM_BUILDERS.get(action)
+        if org_builder is None and action not in _TP_PARAM_BUILDERS:
+            if action.startswith("org_"):
+                if not manage_organization_action:
+                    return {"_success": False, "error": "Organization module not available"}
+                return manage_organization_action(None, profile, action[4:])
+            return manage_trading_partner_action(None, profile, action)
+
         # Parse config JSON
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_trading_partner called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_trading_partner called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             # Get credentials
             creds = get_secret(subject, profile)
 
             # Initialize Boomi SDK
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             # Organization sub-actions
-            if action.startswith("org_"):
+            if org_builder is not None:
                 if not manage_organization_action:
                     return {"_success": False, "error": "Organization module not available"}
-                org_action = action[4:]  # "org_list" -> "list"
-                org_params = {}
-                if org_action == "list":
-                    if config_data:
-                        org_params["filters"] = config_data
-                elif org_action == "get":
-                    org_params["organization_id"] = resource_id
-                elif org_action == "create":
-                    org_params["request_data"] = config_data
-                elif org_action == "update":
-                    org_params["organization_id"] = resource_id
-                    org_params["updates"] = config_data
-                elif org_action == "delete":
-                    org_params["organization_id"] = resource_id
-                return manage_organization_action(sdk, profile, org_action, **org_params)
-
-            # Build parameters based on action
-            params = {}
-
-            if action == "list":
-                if config_data:
-                    params["filters"] = config_data
-
-            elif action == "get":
-                params["partner_id"] = resource_id
-
-            elif action == "create":
-                params["request_data"] = config_data if config else None
-
-            elif action == "update":
-                params["partner_id"] = resource_id
-                params["updates"] = config_data
-
-            elif action == "delete":
-                params["partner_id"] = resource_id
-
-            elif action == "analyze_usage":
-                params["partner_id"] = resource_id
-
-            # Processing group sub-actions
-            elif action.startswith("pg_"):
-                if resource_id:
-                    params["resource_id"] = resource_id
-                if config_data:
-                    params.update(config_data)
+                org_params = org_builder(resource_id, config_data)
+                return manage_organization_action(sdk, profile, action[4:], **org_params)
 
+            params = _TP_PARAM_BUILDERS[action](resource_id, config_data if config else None)
             return manage_trading_partner_action(sdk, profile, action, **params)
 
         except ApiError as e:
-            print(f"[ERROR] Failed to {action} trading partner: {e}")
+            _log.error("Failed to %s trading partner: %s", action, e)
             return {"_success": False, "error": _extract_api_error_msg(e)}
         except Exception as e:
-            print(f"[ERROR] Failed to {action} trading partner: {e}")
+            _log.error("Failed to %s trading partner: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Trading partner tool registered successfully (1 consolidated tool)")
+    _startup_info("Trading partner tool registered successfully (1 consolidated tool)")
 
 
 # --- Process MCP Tools ---
 if manage_process_action:
+    # Read-only action -> manage_process_action kwargs, built from
+    # (process_id, parsed filters or None). create/update/delete have no
+    # builder: they get no params and manage_process_action returns
+    # ACTION_UNSUPPORTED.
+    _PROCESS_PARAM_BUILDERS = {
+        "list": lambda pid, f: {"filters": f} if f is not None else {},
+        "get": lambda pid, f: {"process_id": pid},
+    }
+
     @mcp.tool()
     @_kb_hint
     def manage_process(
@@ -1417,51 +1557,36 @@ if manage_process_action:
                 process_id="abc-123-def"
             )
         """
+        builder = _PROCESS_PARAM_BUILDERS.get(action)
+
+        # Parse list filters JSON
+        filters_data = None
+        if filters and action == "list":
+            try:
+                filters_data = _json_loads(filters)
+            except (ValueError, TypeError) as e:
+                return {"_success": False, "error": f"Invalid filters (must be a JSON string): {e}"}
+            if not isinstance(filters_data, dict):
+                return {"_success": False, "error": "filters must be a JSON object, not " + type(filters_data).__name__}
+
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_process called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_process called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             # Get credentials
             creds = get_secret(subject, profile)
 
             # Initialize Boomi SDK
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
-            # Build parameters based on action. Only the read-only list/get
-            # actions take parameters; create/update/delete fall through with
-            # no params and manage_process_action returns ACTION_UNSUPPORTED.
-            params = {}
-
-            if action == "list":
-                if filters:
-                    try:
-                        params["filters"] = json.loads(filters)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        return {"_success": False, "error": f"Invalid filters (must be a JSON string): {e}"}
-                    if not isinstance(params["filters"], dict):
-                        return {"_success": False, "error": "filters must be a JSON object, not " + type(params["filters"]).__name__}
-
-            elif action == "get":
-                params["process_id"] = process_id
-
-            # Call the action function
+            params = builder(process_id, filters_data) if builder else {}
             return manage_process_action(sdk, profile, action, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} process: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s process", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Process tool registered successfully (read-only list/get)")
+    _startup_info("Process tool registered successfully (read-only list/get)")
 
 
 
@@ -1552,37 +1677,29 @@ if monitor_platform_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] monitor_platform called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("monitor_platform called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             # Get credentials
             creds = get_secret(subject, profile)
 
             # Initialize Boomi SDK
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return monitor_platform_action(sdk, profile, action, config_data=config_data, creds=creds)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} monitor_platform: {e}")
+            _log.error("Failed to %s monitor_platform: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Monitoring tool registered successfully (1 consolidated tool)")
+    _startup_info("Monitoring tool registered successfully (1 consolidated tool)")
 
 
 # --- Component Query MCP Tools ---
@@ -1643,8 +1760,8 @@ if query_components_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
@@ -1653,27 +1770,19 @@ if query_components_action:
         ids_list = None
         if component_ids:
             try:
-                ids_list = json.loads(component_ids)
-            except (json.JSONDecodeError, TypeError) as e:
+                ids_list = _json_loads(component_ids)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid component_ids (must be a JSON array): {e}"}
             if not isinstance(ids_list, list):
                 return {"_success": False, "error": "component_ids must be a JSON array"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] query_components called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("query_components called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if action == "list":
@@ -1698,10 +1807,10 @@ if query_components_action:
             return query_components_action(sdk, profile, action, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} query_components: {e}")
+            _log.error("Failed to %s query_components: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Component query tool registered successfully (1 consolidated tool)")
+    _startup_info("Component query tool registered successfully (1 consolidated tool)")
 
 
 # --- Component Management MCP Tools ---
@@ -1754,27 +1863,19 @@ if manage_component_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_component called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_component called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if action == "create":
@@ -1791,10 +1892,10 @@ if manage_component_action:
             return manage_component_action(sdk, profile, action, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_component: {e}")
+            _log.error("Failed to %s manage_component: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Component management tool registered successfully (1 consolidated tool)")
+    _startup_info("Component management tool registered successfully (1 consolidated tool)")
 
 
 # --- Component Analysis MCP Tools ---
@@ -1851,27 +1952,19 @@ if analyze_component_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] analyze_component called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("analyze_component called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if action == "where_used":
@@ -1892,10 +1985,10 @@ if analyze_component_action:
             return analyze_component_action(sdk, profile, action, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} analyze_component: {e}")
+            _log.error("Failed to %s analyze_component: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Component analysis tool registered successfully (1 consolidated tool)")
+    _startup_info("Component analysis tool registered successfully (1 consolidated tool)")
 
 
 # --- Safe Existing-Component Edit Workflow MCP Tools (M9.7 / #97) ---
@@ -1945,35 +2038,27 @@ if prepare_component_edit_action:
             diff, confirmation_token, base_version, update_mode, and no_change flag.
         """
         try:
-            patch_data = json.loads(patch)
-        except (json.JSONDecodeError, TypeError) as e:
+            patch_data = _json_loads(patch)
+        except (ValueError, TypeError) as e:
             return {"_success": False, "error": f"Invalid patch (must be a JSON string): {e}", "boomi_mutation": False}
         if not isinstance(patch_data, dict):
             return {"_success": False, "error": "patch must be a JSON object, not " + type(patch_data).__name__, "boomi_mutation": False}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] prepare_component_edit called by user: {subject}, profile: {profile}, component: {component_id}")
+            _log.info("prepare_component_edit called by user: %s, profile: %s, component: %s", subject, profile, component_id)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return prepare_component_edit_action(sdk, profile, component_id, patch_data, max_diff_lines)
 
         except Exception as e:
-            print(f"[ERROR] Failed to prepare_component_edit: {e}")
+            _log.error("Failed to prepare_component_edit: %s", e)
             return {"_success": False, "error": str(e), "boomi_mutation": False}
 
-    print("[INFO] Safe component edit (prepare) tool registered successfully")
+    _startup_info("Safe component edit (prepare) tool registered successfully")
 
 
 if apply_component_edit_action:
@@ -2009,8 +2094,8 @@ if apply_component_edit_action:
             base_version, new_version, version_comparison, and update_mode.
         """
         try:
-            patch_data = json.loads(patch)
-        except (json.JSONDecodeError, TypeError) as e:
+            patch_data = _json_loads(patch)
+        except (ValueError, TypeError) as e:
             return {"_success": False, "error": f"Invalid patch (must be a JSON string): {e}", "boomi_mutation": False}
         if not isinstance(patch_data, dict):
             return {"_success": False, "error": "patch must be a JSON object, not " + type(patch_data).__name__, "boomi_mutation": False}
@@ -2033,29 +2118,21 @@ if apply_component_edit_action:
 
         try:
             subject = get_current_user()
-            print(f"[INFO] apply_component_edit called by user: {subject}, profile: {profile}, component: {component_id}")
+            _log.info("apply_component_edit called by user: %s, profile: %s, component: %s", subject, profile, component_id)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return apply_component_edit_action(
                 sdk, profile, component_id, patch_data, confirmation_token, confirm_apply, max_diff_lines
             )
 
         except Exception as e:
-            print(f"[ERROR] Failed to apply_component_edit: {e}")
+            _log.error("Failed to apply_component_edit: %s", e)
             return {"_success": False, "error": str(e), "boomi_mutation": False}
 
-    print("[INFO] Safe component edit (apply) tool registered successfully")
+    _startup_info("Safe component edit (apply) tool registered successfully")
 
 
 # --- Connector MCP Tools ---
@@ -2112,27 +2189,19 @@ if manage_connector_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_connector called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_connector called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if action == "list_types":
@@ -2154,10 +2223,10 @@ if manage_connector_action:
             return manage_connector_action(sdk, profile, action, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_connector: {e}")
+            _log.error("Failed to %s manage_connector: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Connector tool registered successfully (1 consolidated tool)")
+    _startup_info("Connector tool registered successfully (1 consolidated tool)")
 
 
 # --- Connection Reuse Discovery MCP Tool (Issue #83, M7.3) ---
@@ -2206,19 +2275,11 @@ if suggest_connection_reuse_action:
         """
         try:
             subject = get_current_user()
-            print(f"[INFO] suggest_connection_reuse called by user: {subject}, profile: {profile}, connector_type: {connector_type}")
+            _log.info("suggest_connection_reuse called by user: %s, profile: %s, connector_type: %s", subject, profile, connector_type)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return suggest_connection_reuse_action(
                 sdk,
@@ -2236,7 +2297,7 @@ if suggest_connection_reuse_action:
             # credential (the no-credential-material contract holds by construction;
             # profile/connector_type already identify which call failed).
             etype = type(e).__name__
-            print(f"[ERROR] Failed to suggest_connection_reuse: unexpected {etype}")
+            _log.error("Failed to suggest_connection_reuse: unexpected %s", etype)
             return {
                 "_success": False,
                 "error": f"suggest_connection_reuse failed (unexpected {etype}).",
@@ -2249,7 +2310,7 @@ if suggest_connection_reuse_action:
                 "raw_xml_exposed": False,
             }
 
-    print("[INFO] suggest_connection_reuse tool registered successfully")
+    _startup_info("suggest_connection_reuse tool registered successfully")
 
 
 # --- Marketplace Recipe Search MCP Tool (Issue #84, M7.4) ---
@@ -2297,7 +2358,7 @@ if search_marketplace_recipes_action:
             # envelope for every failure mode, but any unexpected wrapper-level
             # error still returns the same leak-proof shape (type name only).
             etype = type(e).__name__
-            print(f"[ERROR] search_marketplace_recipes failed: unexpected {etype}")
+            _log.error("search_marketplace_recipes failed: unexpected %s", etype)
             return {
                 "_success": False,
                 "error_code": "MARKETPLACE_GRAPHQL_UNAVAILABLE",
@@ -2310,7 +2371,7 @@ if search_marketplace_recipes_action:
                 "open_world": True,
             }
 
-    print("[INFO] search_marketplace_recipes tool registered successfully")
+    _startup_info("search_marketplace_recipes tool registered successfully")
 
 
 # --- Integration Builder MCP Tool ---
@@ -2357,34 +2418,26 @@ if build_integration_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] build_integration called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("build_integration called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return build_integration_action(sdk, profile, action, config=config_data)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} build_integration: {e}")
+            _log.error("Failed to %s build_integration: %s", action, e)
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Integration builder tool registered successfully")
+    _startup_info("Integration builder tool registered successfully")
 
 
 # --- V3 Integration Authoring MCP Tools (Issue #18) ---
@@ -2407,7 +2460,7 @@ if list_integration_archetypes_action:
         """
         return list_integration_archetypes_action(query=query, tags=tags)
 
-    print("[INFO] list_integration_archetypes tool registered successfully")
+    _startup_info("list_integration_archetypes tool registered successfully")
 
     @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
     def get_integration_archetype(name: str):
@@ -2421,7 +2474,7 @@ if list_integration_archetypes_action:
         """
         return get_integration_archetype_action(name=name)
 
-    print("[INFO] get_integration_archetype tool registered successfully")
+    _startup_info("get_integration_archetype tool registered successfully")
 
     @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
     def build_from_archetype(name: str, parameters: dict = None):
@@ -2438,7 +2491,7 @@ if list_integration_archetypes_action:
         """
         return build_from_archetype_action(name=name, parameters=parameters)
 
-    print("[INFO] build_from_archetype tool registered successfully")
+    _startup_info("build_from_archetype tool registered successfully")
 
     @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False})
     def compose_archetypes(parts: list, options: dict = None):
@@ -2466,7 +2519,7 @@ if list_integration_archetypes_action:
         """
         return compose_archetypes_action(parts=parts, options=options)
 
-    print("[INFO] compose_archetypes tool registered successfully")
+    _startup_info("compose_archetypes tool registered successfully")
 
 
 # --- Transformation Review MCP Tool (Issue #46) ---
@@ -2522,14 +2575,14 @@ if review_transformation_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "action": action, **_flags, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "action": action, **_flags, "error": "config must be a JSON object, not " + type(config_data).__name__}
         return review_transformation_action(action, config=config_data)
 
-    print("[INFO] review_transformation tool registered successfully")
+    _startup_info("review_transformation tool registered successfully")
 
 
 # --- Profile Inference Discovery MCP Tool (Issue #47) ---
@@ -2578,7 +2631,7 @@ if infer_profile_fields_action:
         """
         return infer_profile_fields_action(source_type, artifact, options=options)
 
-    print("[INFO] infer_profile_fields tool registered successfully")
+    _startup_info("infer_profile_fields tool registered successfully")
 
 
 # --- Existing-Profile Index Discovery MCP Tool (Issue #95, M7.5) ---
@@ -2656,21 +2709,13 @@ if index_profile_component_action:
             )
 
         try:
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
         except Exception as e:
             return _wrapper_error("SDK_INIT_FAILED", f"Failed to initialize Boomi SDK: {str(e)}")
 
         return index_profile_component_action(sdk, component_id, include_raw_xml)
 
-    print("[INFO] index_profile_component tool registered successfully")
+    _startup_info("index_profile_component tool registered successfully")
 
 
 # --- Existing Integration Import MCP Tool (Issue #48) ---
@@ -2721,7 +2766,7 @@ if import_integration_draft_action:
         """
         return import_integration_draft_action(source_type, artifact, options=options)
 
-    print("[INFO] import_integration_draft tool registered successfully")
+    _startup_info("import_integration_draft tool registered successfully")
 
 
 # --- Schema/Spec Discovery MCP Tools (Issue #13, M7) ---
@@ -2786,10 +2831,10 @@ if discover_openapi_spec_action:
             return discover_openapi_spec_action(spec_url=spec_url, artifact=artifact, options=options)
         except Exception as e:
             etype = type(e).__name__
-            print(f"[ERROR] discover_openapi_spec failed: unexpected {etype}")
+            _log.error("discover_openapi_spec failed: unexpected %s", etype)
             return _discovery_wrapper_error("OPENAPI_DISCOVERY_FAILED", etype)
 
-    print("[INFO] discover_openapi_spec tool registered successfully")
+    _startup_info("discover_openapi_spec tool registered successfully")
 
 
 if discover_soap_wsdl_action:
@@ -2838,10 +2883,10 @@ if discover_soap_wsdl_action:
             return discover_soap_wsdl_action(wsdl_url=wsdl_url, artifact=artifact, options=options)
         except Exception as e:
             etype = type(e).__name__
-            print(f"[ERROR] discover_soap_wsdl failed: unexpected {etype}")
+            _log.error("discover_soap_wsdl failed: unexpected %s", etype)
             return _discovery_wrapper_error("WSDL_DISCOVERY_FAILED", etype)
 
-    print("[INFO] discover_soap_wsdl tool registered successfully")
+    _startup_info("discover_soap_wsdl tool registered successfully")
 
 
 if discover_odata_metadata_action:
@@ -2887,10 +2932,10 @@ if discover_odata_metadata_action:
             return discover_odata_metadata_action(metadata_url=metadata_url, options=options)
         except Exception as e:
             etype = type(e).__name__
-            print(f"[ERROR] discover_odata_metadata failed: unexpected {etype}")
+            _log.error("discover_odata_metadata failed: unexpected %s", etype)
             return _discovery_wrapper_error("ODATA_DISCOVERY_FAILED", etype)
 
-    print("[INFO] discover_odata_metadata tool registered successfully")
+    _startup_info("discover_odata_metadata tool registered successfully")
 
 
 if discover_db_schema_action:
@@ -2940,10 +2985,10 @@ if discover_db_schema_action:
             return discover_db_schema_action(artifact, options=options)
         except Exception as e:
             etype = type(e).__name__
-            print(f"[ERROR] discover_db_schema failed: unexpected {etype}")
+            _log.error("discover_db_schema failed: unexpected %s", etype)
             return _discovery_wrapper_error("DB_SCHEMA_DISCOVERY_FAILED", etype)
 
-    print("[INFO] discover_db_schema tool registered successfully")
+    _startup_info("discover_db_schema tool registered successfully")
 
 
 # --- Folder Management MCP Tools ---
@@ -2998,27 +3043,19 @@ if manage_folders_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_folders called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_folders called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if folder_id:
@@ -3027,12 +3064,10 @@ if manage_folders_action:
             return manage_folders_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_folders: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_folders", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Folder management tool registered successfully (1 consolidated tool)")
+    _startup_info("Folder management tool registered successfully (1 consolidated tool)")
 
 
 # --- Schema Template MCP Tool ---
@@ -3085,7 +3120,7 @@ if get_schema_template_action:
             schema_name=schema_name,
         )
 
-    print("[INFO] Schema template tool registered successfully")
+    _startup_info("Schema template tool registered successfully")
 
 
 # --- Generic API Invoker MCP Tool ---
@@ -3193,16 +3228,7 @@ if invoke_api:
             subject = get_current_user()
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return invoke_api(
                 boomi_client=sdk,
@@ -3219,7 +3245,7 @@ if invoke_api:
         except Exception as e:
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] Generic API invoker tool registered successfully")
+    _startup_info("Generic API invoker tool registered successfully")
 
 
 # --- List Capabilities ---
@@ -3249,7 +3275,7 @@ if list_capabilities_action:
         except Exception as e:
             return {"_success": False, "error": str(e)}
 
-    print("[INFO] List capabilities tool registered successfully")
+    _startup_info("List capabilities tool registered successfully")
 
 
 # --- Plan Integration Design MCP Tool ---
@@ -3296,7 +3322,7 @@ if plan_integration_design_action:
         )
         return ToolResult(content=payload["text"], structured_content=payload)
 
-    print("[INFO] Plan integration design tool registered successfully")
+    _startup_info("Plan integration design tool registered successfully")
 
 
 # --- Environment Management MCP Tools ---
@@ -3429,27 +3455,19 @@ if manage_environments_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_environments called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_environments called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -3458,12 +3476,10 @@ if manage_environments_action:
             return manage_environments_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_environments: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_environments", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Environment management tool registered successfully (1 consolidated tool)")
+    _startup_info("Environment management tool registered successfully (1 consolidated tool)")
 
 
 # --- Runtime Management MCP Tools ---
@@ -3578,27 +3594,19 @@ if manage_runtimes_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_runtimes called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_runtimes called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -3609,12 +3617,10 @@ if manage_runtimes_action:
             return manage_runtimes_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_runtimes: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_runtimes", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Runtime management tool registered successfully (1 consolidated tool)")
+    _startup_info("Runtime management tool registered successfully (1 consolidated tool)")
 
 
 # --- Deployment Management MCP Tools ---
@@ -3710,27 +3716,19 @@ if manage_deployment_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_deployment called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_deployment called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if package_id:
@@ -3743,12 +3741,10 @@ if manage_deployment_action:
             return manage_deployment_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] manage_deployment {action} failed: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("manage_deployment %s failed", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Deployment management tool registered successfully")
+    _startup_info("Deployment management tool registered successfully")
 
 
 # ============================================================
@@ -3946,8 +3942,8 @@ if orchestrate_deploy_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {
                     "_success": False,
                     "error": f"Invalid config (must be a JSON string): {e}",
@@ -4099,19 +4095,11 @@ if orchestrate_deploy_action:
         # 5. Only the Boomi client is missing — read credentials and run for real.
         try:
             subject = get_current_user()
-            print(f"[INFO] orchestrate_deploy called by user: {subject}, profile: {profile}")
+            _log.info("orchestrate_deploy called by user: %s, profile: %s", subject, profile)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             result = orchestrate_deploy_action(
                 boomi_client=sdk, profile=profile, creds=creds, **call_kwargs
@@ -4119,12 +4107,10 @@ if orchestrate_deploy_action:
             return _normalize_orchestrate_response(result, environment_id, runtime_id)
 
         except Exception as e:
-            print(f"[ERROR] orchestrate_deploy failed: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("orchestrate_deploy failed")
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Deployment orchestration tool registered successfully")
+    _startup_info("Deployment orchestration tool registered successfully")
 
 
 # ============================================================
@@ -4192,26 +4178,18 @@ if execute_process_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] execute_process called by user: {subject}, profile: {profile}")
+            _log.info("execute_process called by user: %s, profile: %s", subject, profile)
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return execute_process_action(
                 sdk, profile, process_id, environment_id,
@@ -4219,12 +4197,10 @@ if execute_process_action:
             )
 
         except Exception as e:
-            print(f"[ERROR] execute_process failed: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("execute_process failed")
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Execute process tool registered successfully")
+    _startup_info("Execute process tool registered successfully")
 
 
 # ============================================================
@@ -4291,26 +4267,18 @@ if troubleshoot_execution_action:
         cfg = {}
         if config:
             try:
-                cfg = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                cfg = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(cfg, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] troubleshoot_execution called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("troubleshoot_execution called by user: %s, profile: %s, action: %s", subject, profile, action)
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             return troubleshoot_execution_action(
                 sdk, action,
@@ -4322,12 +4290,10 @@ if troubleshoot_execution_action:
             )
 
         except Exception as e:
-            print(f"[ERROR] troubleshoot_execution failed: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("troubleshoot_execution failed")
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Troubleshoot execution tool registered successfully")
+    _startup_info("Troubleshoot execution tool registered successfully")
 
 
 # --- Shared Resources Management MCP Tools ---
@@ -4399,27 +4365,19 @@ if manage_shared_resources_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_shared_resources called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_shared_resources called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4428,12 +4386,10 @@ if manage_shared_resources_action:
             return manage_shared_resources_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_shared_resources: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_shared_resources", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Shared resources management tool registered successfully")
+    _startup_info("Shared resources management tool registered successfully")
 
 
 # --- Account Administration MCP Tools ---
@@ -4504,27 +4460,19 @@ if manage_account_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config (must be a JSON string): {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object, not " + type(config_data).__name__}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_account called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_account called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4533,12 +4481,10 @@ if manage_account_action:
             return manage_account_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_account: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_account", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Account management tool registered successfully (1 consolidated tool)")
+    _startup_info("Account management tool registered successfully (1 consolidated tool)")
 
 
 
@@ -4612,27 +4558,19 @@ if manage_schedules_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_schedules called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_schedules called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4641,12 +4579,10 @@ if manage_schedules_action:
             return manage_schedules_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_schedules: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_schedules", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Schedule management tool registered successfully")
+    _startup_info("Schedule management tool registered successfully")
 
 
 # --- Listener Management MCP Tools ---
@@ -4688,27 +4624,19 @@ if manage_listeners_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_listeners called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_listeners called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4717,12 +4645,10 @@ if manage_listeners_action:
             return manage_listeners_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_listeners: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_listeners", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Listener management tool registered successfully")
+    _startup_info("Listener management tool registered successfully")
 
 
 # --- Integration Pack Management MCP Tools ---
@@ -4764,27 +4690,19 @@ if manage_integration_packs_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_integration_packs called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_integration_packs called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4793,12 +4711,10 @@ if manage_integration_packs_action:
             return manage_integration_packs_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_integration_packs: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_integration_packs", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Integration pack management tool registered successfully")
+    _startup_info("Integration pack management tool registered successfully")
 
 
 # --- Account Group Management MCP Tools ---
@@ -4836,27 +4752,19 @@ if manage_account_groups_action:
         config_data = {}
         if config:
             try:
-                config_data = json.loads(config)
-            except (json.JSONDecodeError, TypeError) as e:
+                config_data = _json_loads(config)
+            except (ValueError, TypeError) as e:
                 return {"_success": False, "error": f"Invalid config JSON: {e}"}
             if not isinstance(config_data, dict):
                 return {"_success": False, "error": "config must be a JSON object"}
 
         try:
             subject = get_current_user()
-            print(f"[INFO] manage_account_groups called by user: {subject}, profile: {profile}, action: {action}")
+            _log.info("manage_account_groups called by user: %s, profile: %s, action: %s", subject, profile, action)
 
             creds = get_secret(subject, profile)
 
-            sdk_params = {
-                "account_id": creds["account_id"],
-                "username": creds["username"],
-                "password": creds["password"],
-                "timeout": 30000,
-            }
-            if creds.get("base_url"):
-                sdk_params["base_url"] = creds["base_url"]
-            sdk = Boomi(**sdk_params)
+            sdk = _sdk_for(creds)
 
             params = {}
             if resource_id:
@@ -4865,16 +4773,83 @@ if manage_account_groups_action:
             return manage_account_groups_action(sdk, profile, action, config_data=config_data, **params)
 
         except Exception as e:
-            print(f"[ERROR] Failed to {action} manage_account_groups: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Failed to %s manage_account_groups", action)
             return {"_success": False, "error": str(e), "exception_type": type(e).__name__}
 
-    print("[INFO] Account group management tool registered successfully")
+    _startup_info("Account group management tool registered successfully")
 
 
 # --- Credential Management Tools (local dev only) ---
 if LOCAL_MODE:
+    # Boomi account IDs: alphanumeric, hyphens, underscores
+    _ACCOUNT_ID_RE = re.compile(r'[A-Za-z0-9_-]+')
+    # Concurrent credential validations in bulk_set_boomi_credentials.
+    _BULK_VALIDATE_WORKERS = 4
+
+    def _check_local_credentials(profile, account_id, username, password):
+        """Validate one credential set for local storage.
+
+        Checks the parameters, then makes a test API call with them.
+
+        Returns:
+            ``(entry, None)`` with entry keys ``profile``, ``payload`` (the
+            dict to store) and ``warning`` (or None); or ``(None, error)``
+            where ``error`` is the tool error response.
+        """
+        # Validate required parameters are not empty/whitespace
+        validation_errors = []
+        for param_name, param_val in [("profile", profile), ("account_id", account_id), ("username", username), ("password", password)]:
+            if not isinstance(param_val, str) or not param_val.strip():
+                validation_errors.append(param_name)
+        if validation_errors:
+            return None, {
+                "_success": False,
+                "error": f"Required parameter(s) cannot be empty: {', '.join(validation_errors)}",
+            }
+        # Strip whitespace from all params
+        profile = profile.strip()
+        account_id = account_id.strip()
+        username = username.strip()
+        password = password.strip()
+
+        # Validate account_id format (alphanumeric, hyphens, underscores)
+        if not _ACCOUNT_ID_RE.fullmatch(account_id):
+            return None, {
+                "_success": False,
+                "error": "account_id contains invalid characters. Expected alphanumeric, hyphens, or underscores only.",
+            }
+
+        # Warn (not error) if username doesn't follow BOOMI_TOKEN. convention
+        username_warning = None
+        if not username.startswith("BOOMI_TOKEN."):
+            username_warning = "Username does not start with 'BOOMI_TOKEN.' — Boomi API tokens typically use this prefix."
+
+        # Validate credentials by making a test API call
+        payload = {
+            "username": username,
+            "password": password,
+            "account_id": account_id,
+        }
+        try:
+            _get_account_cached(payload, timeout=10000)
+            _log.info("Credentials validated successfully for %s", account_id)
+        except ApiError as e:
+            _log.error("Credential validation failed: %s", e)
+            return None, {
+                "_success": False,
+                "error": f"Credential validation failed: {_extract_api_error_msg(e)}",
+                "_note": "Please check your account_id, username, and password"
+            }
+        except Exception as e:
+            _log.error("Credential validation failed: %s", e)
+            return None, {
+                "_success": False,
+                "error": f"Credential validation failed: {_sanitize_error_msg(str(e))}",
+                "_note": "Please check your account_id, username, and password"
+            }
+
+        return {"profile": profile, "payload": payload, "warning": username_warning}, None
+
     @mcp.tool()
     def set_boomi_credentials(
         profile: str,
@@ -4899,68 +4874,15 @@ if LOCAL_MODE:
         """
         try:
             subject = get_current_user()
-            print(f"[INFO] set_boomi_credentials called for profile: {profile}")
-
-            # Validate required parameters are not empty/whitespace
-            validation_errors = []
-            for param_name, param_val in [("profile", profile), ("account_id", account_id), ("username", username), ("password", password)]:
-                if not param_val or not param_val.strip():
-                    validation_errors.append(param_name)
-            if validation_errors:
-                return {
-                    "_success": False,
-                    "error": f"Required parameter(s) cannot be empty: {', '.join(validation_errors)}",
-                }
-            # Strip whitespace from all params
-            profile = profile.strip()
-            account_id = account_id.strip()
-            username = username.strip()
-            password = password.strip()
-
-            # Validate account_id format (alphanumeric, hyphens, underscores)
-            import re as _re
-            if not _re.fullmatch(r'[A-Za-z0-9_-]+', account_id):
-                return {
-                    "_success": False,
-                    "error": "account_id contains invalid characters. Expected alphanumeric, hyphens, or underscores only.",
-                }
-
-            # Warn (not error) if username doesn't follow BOOMI_TOKEN. convention
-            _username_warning = None
-            if not username.startswith("BOOMI_TOKEN."):
-                _username_warning = "Username does not start with 'BOOMI_TOKEN.' — Boomi API tokens typically use this prefix."
+            _log.info("set_boomi_credentials called for profile: %s", profile)
 
-            # Validate credentials by making a test API call
-            try:
-                test_sdk = Boomi(
-                    account_id=account_id,
-                    username=username,
-                    password=password,
-                    timeout=10000,
-                )
-                test_sdk.account.get_account(id_=account_id)
-                print(f"[INFO] Credentials validated successfully for {account_id}")
-            except ApiError as e:
-                print(f"[ERROR] Credential validation failed: {e}")
-                return {
-                    "_success": False,
-                    "error": f"Credential validation failed: {_extract_api_error_msg(e)}",
-                    "_note": "Please check your account_id, username, and password"
-                }
-            except Exception as e:
-                print(f"[ERROR] Credential validation failed: {e}")
-                return {
-                    "_success": False,
-                    "error": f"Credential validation failed: {_sanitize_error_msg(str(e))}",
-                    "_note": "Please check your account_id, username, and password"
-                }
+            entry, error = _check_local_credentials(profile, account_id, username, password)
+            if error:
+                return error
+            profile = entry["profile"]
 
             # Store credentials
-            put_secret(subject, profile, {
-                "username": username,
-                "password": password,
-                "account_id": account_id,
-            })
+            put_secret(subject, profile, entry["payload"])
 
             result = {
                 "_success": True,
@@ -4968,11 +4890,109 @@ if LOCAL_MODE:
                 "profile": profile,
                 "_note": "Credentials stored locally in ~/.boomi_mcp_local_secrets.json"
             }
-            if _username_warning:
-                result["_warning"] = _username_warning
+            if entry["warning"]:
+                result["_warning"] = entry["warning"]
             return result
         except Exception as e:
-            print(f"[ERROR] Failed to set credentials: {e}")
+            _log.error("Failed to set credentials: %s", e)
+            return {
+                "_success": False,
+                "error": _sanitize_error_msg(str(e))
+            }
+
+    @mcp.tool()
+    def bulk_set_boomi_credentials(profiles_json: str):
+        """
+        Store several Boomi credential profiles in one call (local testing).
+
+        Each entry is validated exactly like set_boomi_credentials (including
+        a test API call); all valid entries are then saved with a single write
+        to the local secrets file. Invalid entries are reported and skipped.
+
+        This tool is only available in the local development version.
+
+        Args:
+            profiles_json: JSON array of objects with profile, account_id,
+                username and password, e.g.
+                '[{"profile": "dev", "account_id": "...", "username": "BOOMI_TOKEN...", "password": "..."}]'
+
+        Returns:
+            One {"profile", "status", "error"?, "_warning"?} record per input
+            entry, in order
+        """
+        try:
+            subject = get_current_user()
+            try:
+                items = _json_loads(profiles_json)
+            except (ValueError, TypeError) as e:
+                return {"_success": False, "error": f"Invalid profiles_json (must be a JSON string): {e}"}
+            if not isinstance(items, list):
+                return {"_success": False, "error": "profiles_json must be a JSON array, not " + type(items).__name__}
+            _log.info("bulk_set_boomi_credentials called with %d profiles", len(items))
+
+            # Each entry's validation is a test API call (10s SDK timeout, plus
+            # the SDK's retries), so validate concurrently: the tool's wall
+            # time tracks the slowest entry rather than the sum, keeping large
+            # batches inside MCP client timeouts. Entries that are not objects
+            # are rejected up front and make no API call.
+            outcomes = [None] * len(items)
+            pending = []
+            for i, item in enumerate(items):
+                if not isinstance(item, dict):
+                    outcomes[i] = "Each entry must be a JSON object"
+                    continue
+                pending.append(i)
+
+            if pending:
+                def _check(i):
+                    item = items[i]
+                    return _check_local_credentials(
+                        item.get("profile"), item.get("account_id"),
+                        item.get("username"), item.get("password"),
+                    )
+
+                with ThreadPoolExecutor(max_workers=min(_BULK_VALIDATE_WORKERS, len(pending))) as pool:
+                    for i, outcome in zip(pending, pool.map(_check, pending)):
+                        outcomes[i] = outcome
+
+            # Duplicates are resolved after validation, so a profile name is
+            # claimed by its first valid entry, not by an earlier invalid one.
+            results = []
+            ops = []
+            seen = set()
+            for item, outcome in zip(items, outcomes):
+                if isinstance(outcome, str):
+                    results.append({"profile": item.get("profile") if isinstance(item, dict) else None,
+                                    "status": "error", "error": outcome})
+                    continue
+                entry, error = outcome
+                if error:
+                    results.append({"profile": item.get("profile"), "status": "error", "error": error["error"]})
+                    continue
+                if entry["profile"] in seen:
+                    results.append({"profile": item.get("profile"), "status": "error",
+                                    "error": "Duplicate profile in request"})
+                    continue
+                seen.add(entry["profile"])
+                ops.append(("put", subject, entry["profile"], entry["payload"]))
+                record = {"profile": entry["profile"], "status": "ok"}
+                if entry["warning"]:
+                    record["_warning"] = entry["warning"]
+                results.append(record)
+
+            # One file write for the whole batch.
+            if ops:
+                secrets_backend.apply_batch(ops)
+                _log.info("Stored %d profiles for %s", len(ops), subject)
+
+            return {
+                "_success": all(r["status"] == "ok" for r in results),
+                "saved": len(ops),
+                "results": results,
+                "_note": "Credentials stored locally in ~/.boomi_mcp_local_secrets.json"
+            }
+        except Exception as e:
+            _log.error("Failed to bulk set credentials: %s", e)
             return {
                 "_success": False,
                 "error": _sanitize_error_msg(str(e))
@@ -4994,7 +5014,7 @@ if LOCAL_MODE:
         """
         try:
             subject = get_current_user()
-            print(f"[INFO] delete_boomi_profile called for profile: {profile}")
+            _log.info("delete_boomi_profile called for profile: %s", profile)
 
             delete_profile(subject, profile)
 
@@ -5003,7 +5023,7 @@ if LOCAL_MODE:
                 "message": f"Profile '{profile}' deleted successfully",
             }
         except Exception as e:
-            print(f"[ERROR] Failed to delete profile: {e}")
+            _log.error("Failed to delete profile: %s", e)
             return {
                 "_success": False,
                 "error": str(e)
@@ -5014,19 +5034,130 @@ if LOCAL_MODE:
 if not LOCAL_MODE:
     from starlette.responses import HTMLResponse, JSONResponse, RedirectResponse
     from starlette.requests import Request
+    from starlette.concurrency import run_in_threadpool
+    import asyncio
     import urllib.parse
     import httpx
+    import jwt
+
+    # Without orjson (see top of module), fall back to the stdlib-backed
+    # JSONResponse / request.json().
+    if orjson is not None:
+        class ORJSONResponse(JSONResponse):
+            """JSONResponse rendered with orjson (C serializer, emits bytes directly)."""
+
+            def render(self, content: Any) -> bytes:
+                return orjson.dumps(content)
+
+        async def read_json_body(request: Request) -> Any:
+            """Parse the request body as JSON with orjson."""
+            return orjson.loads(await request.body())
+    else:
+        ORJSONResponse = JSONResponse
+
+        async def read_json_body(request: Request) -> Any:
+            """Parse the request body as JSON."""
+            return await request.json()
+
+    # Google's ID-token signing keys. PyJWKClient caches the JWK set (refetched
+    # hourly, or early when an unknown kid shows up after a key rotation), so
+    # logins don't fetch the certs endpoint each time.
+    _GOOGLE_ISSUERS = ["https://accounts.google.com", "accounts.google.com"]
+    # Tolerated clock skew against Google's iat/exp when verifying ID tokens.
+    _ID_TOKEN_LEEWAY_SECONDS = 30
+    _google_jwks_client = jwt.PyJWKClient(
+        "https://www.googleapis.com/oauth2/v3/certs",
+        cache_keys=True,
+        lifespan=3600,
+    )
+
+    # Per-subject list_profiles results for the read-only GET /api/profiles
+    # listing. Profile writes made through the routes below drop the subject's
+    # entry; the TTL bounds how long a write served by another instance can go
+    # unseen. The 10-profile limit on save is checked against a fresh listing,
+    # never this cache.
+    _profiles_cache = TTLCache(max_size=1024, ttl_seconds=30)
+
+    async def list_profiles_cached(subject: str):
+        """list_profiles(subject), served from the per-subject cache when fresh."""
+        profiles = _profiles_cache.get(subject)
+        if profiles is None:
+            profiles = await run_in_threadpool(list_profiles, subject)
+            _profiles_cache.set(subject, profiles)
+        return profiles
+
+    # Public base URL, resolved once. Unset means "derive from the request".
+    _OIDC_BASE_URL = os.getenv("OIDC_BASE_URL") or None
+    _SERVER_URL = f"{_OIDC_BASE_URL}/mcp" if _OIDC_BASE_URL else None
+
+    # Fixed fields of the Google token-exchange form. redirect_uri is only
+    # fixed when OIDC_BASE_URL is set; otherwise the callback derives it.
+    _GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+    _OIDC_CLIENT_ID = os.getenv("OIDC_CLIENT_ID")
+    _TOKEN_REQUEST_BASE = {
+        "client_id": _OIDC_CLIENT_ID,
+        "client_secret": os.getenv("OIDC_CLIENT_SECRET"),
+        "grant_type": "authorization_code",
+    }
+    if _OIDC_BASE_URL:
+        _TOKEN_REQUEST_BASE["redirect_uri"] = f"{_OIDC_BASE_URL}/web/callback"
+
+    # Static page templates, read once at import instead of on every request.
+    _TEMPLATES_DIR = Path(__file__).parent / "templates"
+    _LOGIN_HTML = (_TEMPLATES_DIR / "login.html").read_text()
+    # credentials.html pre-split around its {{ user_email }} / {{ server_url }}
+    # placeholders: even indexes are literal text, odd indexes placeholder names.
+    _CREDENTIALS_SEGMENTS = tuple(re.split(
+        r"\{\{\s*(user_email|server_url)\s*\}\}",
+        (_TEMPLATES_DIR / "credentials.html").read_text(),
+    ))
+    _PRIVACY_HTML = (_TEMPLATES_DIR / "privacy.html").read_text()
+
+    def render_template_segments(segments, values) -> str:
+        """Join pre-split template *segments*, filling placeholders from *values*."""
+        parts = list(segments)
+        parts[1::2] = [values[name] for name in segments[1::2]]
+        return "".join(parts)
 
     def generate_pkce_pair():
         """Generate PKCE code_verifier and code_challenge."""
-        code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+        # Both inputs are exactly 32 bytes (token_bytes(32), SHA-256 digest), which
+        # base64-encodes to 44 chars ending in a single '=', so drop it by slicing.
+        code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32))[:-1].decode('ascii')
         code_challenge = base64.urlsafe_b64encode(
-            hashlib.sha256(code_verifier.encode('utf-8')).digest()
-        ).decode('utf-8').rstrip('=')
+            hashlib.sha256(code_verifier.encode('ascii')).digest()
+        )[:-1].decode('ascii')
         return code_verifier, code_challenge
 
+    def get_web_http_client() -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+
+        Reusing one pooled client keeps the TLS connection to Google's token
+        endpoint warm across callbacks instead of handshaking per login.
+        """
+        global _web_http_client
+        if _web_http_client is None or _web_http_client.is_closed:
+            _web_http_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return _web_http_client
+
+    _AUTH_SUBJECT_UNSET = object()
+
     def get_authenticated_user(request: Request) -> Optional[str]:
-        """Extract authenticated user from request (works with OAuth middleware and sessions)."""
+        """Extract authenticated user from request (works with OAuth middleware and sessions).
+
+        Resolved once per request and memoized on ``request.state``.
+        """
+        subject = getattr(request.state, "auth_subject", _AUTH_SUBJECT_UNSET)
+        if subject is _AUTH_SUBJECT_UNSET:
+            subject = _resolve_authenticated_user(request)
+            request.state.auth_subject = subject
+        return subject
+
+    def _resolve_authenticated_user(request: Request) -> Optional[str]:
+        """Resolve the subject from the web session or the OAuth request state."""
         # Try session first (web portal authentication)
         # Use 'sub' (Google user ID) for consistency with MCP OAuth
         if hasattr(request, "session") and request.session.get("user_sub"):
@@ -5050,11 +5181,11 @@ if not LOCAL_MODE:
     async def web_login(request: Request):
         """Initiate OAuth login with PKCE for web portal."""
         # Get Google OAuth configuration
-        client_id = os.getenv("OIDC_CLIENT_ID")
-        base_url = os.getenv("OIDC_BASE_URL", str(request.base_url).rstrip('/'))
+        client_id = _OIDC_CLIENT_ID
+        base_url = _OIDC_BASE_URL or str(request.base_url).rstrip('/')
 
         if not client_id:
-            return JSONResponse({"error": "OAuth not configured"}, status_code=500)
+            return ORJSONResponse({"error": "OAuth not configured"}, status_code=500)
 
         # Generate PKCE parameters
         code_verifier, code_challenge = generate_pkce_pair()
@@ -5064,8 +5195,9 @@ if not LOCAL_MODE:
         request.session["oauth_state"] = state
         request.session["code_verifier"] = code_verifier
 
-        print(f"[DEBUG] Stored in session: oauth_state={state[:20]}..., code_verifier={code_verifier[:20]}...")
-        print(f"[DEBUG] Session after store: {dict(request.session)}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Stored in session: oauth_state=%s..., code_verifier=%s...", state[:20], code_verifier[:20])
+            _log.debug("Session after store: %s", dict(request.session))
 
         # Build Google OAuth authorization URL with PKCE
         redirect_uri = f"{base_url}/web/callback"
@@ -5085,8 +5217,8 @@ if not LOCAL_MODE:
 
         auth_url = "https://accounts.google.com/o/oauth2/v2/auth?" + urllib.parse.urlencode(auth_params)
 
-        print(f"[INFO] Initiating OAuth login for web portal")
-        print(f"[INFO] Redirect URI: {redirect_uri}")
+        _log.info("Initiating OAuth login for web portal")
+        _log.info("Redirect URI: %s", redirect_uri)
 
         return RedirectResponse(auth_url)
 
@@ -5098,10 +5230,11 @@ if not LOCAL_MODE:
         state = request.query_params.get("state")
         error = request.query_params.get("error")
 
-        print(f"[DEBUG] Callback received - state from URL: {state[:20] if state else 'None'}...")
-        print(f"[DEBUG] Session contents: {dict(request.session)}")
-        print(f"[DEBUG] Session ID: {id(request.session)}")
-        print(f"[DEBUG] Has session attr: {hasattr(request, 'session')}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Callback received - state from URL: %s...", state[:20] if state else None)
+            _log.debug("Session contents: %s", dict(request.session))
+            _log.debug("Session ID: %s", id(request.session))
+            _log.debug("Has session attr: %s", hasattr(request, "session"))
 
         if error:
             return HTMLResponse(f"<html><body><h1>OAuth Error</h1><p>{error}</p></body></html>", status_code=400)
@@ -5111,8 +5244,9 @@ if not LOCAL_MODE:
 
         # Verify state
         stored_state = request.session.get("oauth_state")
-        print(f"[DEBUG] Stored state from session: {stored_state[:20] if stored_state else 'None'}...")
-        print(f"[DEBUG] State match: {state == stored_state}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Stored state from session: %s...", stored_state[:20] if stored_state else None)
+            _log.debug("State match: %s", state == stored_state)
 
         if not stored_state or state != stored_state:
             return HTMLResponse(
@@ -5130,31 +5264,30 @@ if not LOCAL_MODE:
             return HTMLResponse("<html><body><h1>OAuth Error</h1><p>Missing code_verifier</p></body></html>", status_code=400)
 
         # Exchange code for tokens
-        client_id = os.getenv("OIDC_CLIENT_ID")
-        client_secret = os.getenv("OIDC_CLIENT_SECRET")
-        base_url = os.getenv("OIDC_BASE_URL", str(request.base_url).rstrip('/'))
-        redirect_uri = f"{base_url}/web/callback"
-
-        token_url = "https://oauth2.googleapis.com/token"
-        token_data = {
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "code": code,
-            "code_verifier": code_verifier,
-            "grant_type": "authorization_code",
-            "redirect_uri": redirect_uri,
-        }
+        token_data = {**_TOKEN_REQUEST_BASE, "code": code, "code_verifier": code_verifier}
+        if "redirect_uri" not in token_data:
+            token_data["redirect_uri"] = f"{str(request.base_url).rstrip('/')}/web/callback"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=token_data)
-                response.raise_for_status()
-                tokens = response.json()
+            response = await get_web_http_client().post(_GOOGLE_TOKEN_URL, data=token_data)
+            response.raise_for_status()
+            tokens = response.json()
 
-            # Decode ID token to get user info (we don't verify signature here since we got it directly from Google)
-            import jwt
+            # Verify the ID token against Google's cached signing keys and decode
+            # it once. The key lookup may hit the network on a cache miss.
             id_token = tokens.get("id_token")
-            user_info = jwt.decode(id_token, options={"verify_signature": False})
+            signing_key = await run_in_threadpool(
+                _google_jwks_client.get_signing_key_from_jwt, id_token
+            )
+            user_info = jwt.decode(
+                id_token,
+                signing_key.key,
+                algorithms=["RS256"],
+                audience=_OIDC_CLIENT_ID,
+                issuer=_GOOGLE_ISSUERS,
+                leeway=_ID_TOKEN_LEEWAY_SECONDS,
+                options={"require": ["sub", "aud", "iss", "exp"]},
+            )
 
             # Store user info in session
             request.session["user_email"] = user_info.get("email")
@@ -5164,13 +5297,13 @@ if not LOCAL_MODE:
             request.session.pop("oauth_state", None)
             request.session.pop("code_verifier", None)
 
-            print(f"[INFO] Web portal login successful for {user_info.get('email')}")
+            _log.info("Web portal login successful for %s", user_info.get('email'))
 
             # Redirect to main page
             return RedirectResponse("/")
 
         except Exception as e:
-            print(f"[ERROR] OAuth token exchange failed: {e}")
+            _log.error("OAuth token exchange failed: %s", e)
             return HTMLResponse(f"<html><body><h1>OAuth Error</h1><p>Token exchange failed: {str(e)}</p></body></html>", status_code=500)
 
     @mcp.custom_route("/", methods=["GET"])
@@ -5180,21 +5313,10 @@ if not LOCAL_MODE:
         subject = get_authenticated_user(request)
         if not subject:
             # Show login page (no template variables needed - uses /web/login endpoint)
-            template_path = Path(__file__).parent / "templates" / "login.html"
-            html = template_path.read_text()
-            return HTMLResponse(html)
+            return HTMLResponse(_LOGIN_HTML)
 
-        # Read and render template
-        template_path = Path(__file__).parent / "templates" / "credentials.html"
-        html = template_path.read_text()
-
-        # Get server URL from environment or request
-        base_url = os.getenv("OIDC_BASE_URL")
-        if not base_url:
-            # Fallback to request base URL
-            base_url = str(request.base_url).rstrip('/')
-
-        server_url = f"{base_url}/mcp"
+        # Server URL from OIDC_BASE_URL, falling back to the request base URL
+        server_url = _SERVER_URL or f"{str(request.base_url).rstrip('/')}/mcp"
 
         # Replace template variables. `subject` is the Google `sub` (used for
         # auth + per-user secret scoping); for display, prefer the human-readable
@@ -5203,10 +5325,12 @@ if not LOCAL_MODE:
         if hasattr(request, "session"):
             display_email = request.session.get("user_email") or subject
         # Escape for the HTML context the value is rendered into (the
-        # "Signed in as" chip). The email originates from the OIDC token, which
-        # is decoded without signature verification, so never interpolate it raw.
-        html = html.replace("{{ user_email }}", html_escape(display_email))
-        html = html.replace("{{ server_url }}", server_url)
+        # "Signed in as" chip). The email originates from the OIDC token and is
+        # user-controlled, so never interpolate it raw.
+        html = render_template_segments(_CREDENTIALS_SEGMENTS, {
+            "user_email": html_escape(display_email),
+            "server_url": server_url,
+        })
 
         return HTMLResponse(html)
 
@@ -5220,48 +5344,60 @@ if not LOCAL_MODE:
     @mcp.custom_route("/privacy", methods=["GET"])
     async def privacy_page(request: Request):
         """Serve the public privacy / data-processing notice (no auth required)."""
-        template_path = Path(__file__).parent / "templates" / "privacy.html"
-        html = template_path.read_text()
-        return HTMLResponse(html)
+        return HTMLResponse(_PRIVACY_HTML)
+
+    def _validation_sdk(account_id: str, username: str, password: str):
+        """Return a (possibly cached) Boomi client for these credentials.
+
+        The UI often validates the same credentials repeatedly; _sdk_for keys
+        its cache by a digest of the password, never the password itself.
+        """
+        creds = {"account_id": account_id, "username": username, "password": password}
+        return _sdk_for(creds, timeout=10000)
+
+    def _validate_boomi_credentials(account_id: str, username: str, password: str):
+        """Fetch the account with the given credentials (blocking).
+
+        Raises on invalid credentials; returns the account on success.
+        """
+        test_sdk = _validation_sdk(account_id, username, password)
+        return test_sdk.account.get_account(id_=account_id)
 
     @mcp.custom_route("/api/credentials/validate", methods=["POST"])
     async def api_validate_credentials(request: Request):
         """API endpoint to validate Boomi credentials before saving."""
         subject = get_authenticated_user(request)
         if not subject:
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
         try:
-            data = await request.json()
+            data = await read_json_body(request)
 
-            print(f"[DEBUG] Validating credentials for account_id: {data['account_id']}, username: {data['username'][:30]}...")
-
-            # Test credentials by attempting to initialize Boomi SDK and make a simple API call
-            test_sdk = Boomi(
-                account_id=data["account_id"],
-                username=data["username"],
-                password=data["password"],
-                timeout=10000,
+            _log.debug(
+                "Validating credentials for account_id=%s username=%.30s",
+                data["account_id"], data["username"],
             )
 
-            # Try to get account info - this will fail if credentials are invalid
-            print(f"[DEBUG] Calling Boomi API: account.get_account(id_={data['account_id']})")
-            result = test_sdk.account.get_account(id_=data["account_id"])
+            # The SDK call is blocking network I/O; run it off the event loop.
+            _log.debug("Calling Boomi API: account.get_account(id_=%s)", data["account_id"])
+            result = await run_in_threadpool(
+                _validate_boomi_credentials,
+                data["account_id"], data["username"], data["password"],
+            )
 
             if result:
-                print(f"[DEBUG] Validation successful for {data['account_id']}")
-                return JSONResponse({
+                _log.debug("Validation successful for %s", data["account_id"])
+                return ORJSONResponse({
                     "success": True,
                     "message": "Credentials validated successfully"
                 })
             else:
-                print(f"[ERROR] Validation returned no result for {data['account_id']}")
-                return JSONResponse({"error": "Failed to validate credentials"}, status_code=400)
+                _log.error("Validation returned no result for %s", data["account_id"])
+                return ORJSONResponse({"error": "Failed to validate credentials"}, status_code=400)
 
         except Exception as e:
             error_msg = str(e)
-            print(f"[ERROR] Validation exception: {error_msg}")
-            print(f"[ERROR] Exception type: {type(e).__name__}")
+            _log.error("Validation exception (%s): %s", type(e).__name__, error_msg)
 
             # Provide user-friendly error messages
             if "401" in error_msg or "Unauthorized" in error_msg:
@@ -5273,76 +5409,165 @@ if not LOCAL_MODE:
             elif "timeout" in error_msg.lower():
                 error_msg = "Connection timeout - please try again"
 
-            return JSONResponse({"error": f"Validation failed: {error_msg}"}, status_code=400)
+            return ORJSONResponse({"error": f"Validation failed: {error_msg}"}, status_code=400)
 
     @mcp.custom_route("/api/credentials", methods=["POST"])
     async def api_set_credentials(request: Request):
         """API endpoint to save credentials."""
         subject = get_authenticated_user(request)
         if not subject:
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
         try:
-            data = await request.json()
+            # Body parse and the profile listing are independent; overlap them.
+            data, existing_profiles = await asyncio.gather(
+                read_json_body(request), run_in_threadpool(list_profiles, subject)
+            )
 
             # Check profile limit (10 profiles per user)
-            existing_profiles = list_profiles(subject)
             profile_name = data["profile"]
 
             # Allow updating existing profile, but limit new profiles to 10
-            is_new_profile = profile_name not in [p["profile"] for p in existing_profiles]
+            is_new_profile = all(p["profile"] != profile_name for p in existing_profiles)
             if is_new_profile and len(existing_profiles) >= 10:
-                return JSONResponse({
+                return ORJSONResponse({
                     "error": "Profile limit reached. You can store up to 10 Boomi account profiles. Please delete an existing profile before adding a new one."
                 }, status_code=400)
 
-            put_secret(subject, profile_name, {
+            await run_in_threadpool(put_secret, subject, profile_name, {
                 "username": data["username"],
                 "password": data["password"],
                 "account_id": data["account_id"],
             })
+            _profiles_cache.pop(subject)
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": True,
                 "message": f"Credentials saved for profile '{profile_name}'"
             })
         except Exception as e:
-            return JSONResponse({"error": str(e)}, status_code=400)
+            return ORJSONResponse({"error": str(e)}, status_code=400)
+
+    # Max concurrent secret-store writes per bulk save request.
+    _BULK_PUT_CONCURRENCY = 10
+
+    @mcp.custom_route("/api/credentials/bulk", methods=["POST"])
+    async def api_set_credentials_bulk(request: Request):
+        """API endpoint to save several profiles in one request.
+
+        Body: {"profiles": [{"profile", "username", "password", "account_id"}, ...]}.
+        Each profile is saved independently; the response carries one
+        {"profile", "status", "error"?} record per input item, in order.
+        """
+        subject = get_authenticated_user(request)
+        if not subject:
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
+
+        try:
+            body, existing_profiles = await asyncio.gather(
+                read_json_body(request), run_in_threadpool(list_profiles, subject)
+            )
+            items = body["profiles"]
+            if not isinstance(items, list):
+                raise ValueError("profiles must be a list")
+        except Exception as e:
+            return ORJSONResponse({"error": str(e)}, status_code=400)
+
+        # Same 10-profile limit as /api/credentials, applied across the batch.
+        known = {p["profile"] for p in existing_profiles}
+        seen = set()
+        plan = []  # (profile_name, payload, error); payload is None on error
+        for item in items:
+            if not isinstance(item, dict):
+                plan.append((None, None, "Each entry must be a JSON object"))
+                continue
+            name = item.get("profile")
+            if not isinstance(name, str) or not name:
+                plan.append((None, None, "profile must be a non-empty string"))
+                continue
+            bad_field = next((
+                field for field in ("username", "password", "account_id")
+                if not isinstance(item.get(field), str) or not item[field]
+            ), None)
+            if bad_field:
+                plan.append((name, None, f"{bad_field} must be a non-empty string"))
+                continue
+            payload = {
+                "username": item["username"],
+                "password": item["password"],
+                "account_id": item["account_id"],
+            }
+            if name in seen:
+                plan.append((name, None, "Duplicate profile in request"))
+                continue
+            seen.add(name)
+            if name not in known:
+                if len(known) >= 10:
+                    plan.append((name, None, "Profile limit reached (10 profiles per user)"))
+                    continue
+                known.add(name)
+            plan.append((name, payload, None))
+
+        sem = asyncio.Semaphore(_BULK_PUT_CONCURRENCY)
+
+        async def _save(name, payload, error):
+            if error is not None:
+                return {"profile": name, "status": "error", "error": error}
+            async with sem:
+                try:
+                    await run_in_threadpool(put_secret, subject, name, payload)
+                except Exception as e:
+                    return {"profile": name, "status": "error", "error": str(e)}
+            return {"profile": name, "status": "ok"}
+
+        results = await asyncio.gather(*(_save(*entry) for entry in plan))
+        _profiles_cache.pop(subject)
+
+        return ORJSONResponse({
+            "success": all(r["status"] == "ok" for r in results),
+            "results": results,
+        })
 
     @mcp.custom_route("/api/profiles", methods=["GET"])
     async def api_list_profiles(request: Request):
         """API endpoint to list profiles."""
         subject = get_authenticated_user(request)
         if not subject:
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
-        profiles_data = list_profiles(subject)
+        profiles_data = await list_profiles_cached(subject)
         # Web UI sees ALL profiles, each annotated with its disabled state
-        # (unlike the LLM tool, which hides disabled profiles entirely).
+        # (unlike the LLM tool, which hides disabled profiles entirely). Each
+        # flag is a separate secret read, so fetch them concurrently.
+        names = [p["profile"] for p in profiles_data]
+        disabled_flags = await asyncio.gather(*(
+            run_in_threadpool(_is_profile_disabled, subject, name) for name in names
+        ))
         profiles = [
-            {"name": p["profile"], "disabled": _is_profile_disabled(subject, p["profile"])}
-            for p in profiles_data
+            {"name": name, "disabled": disabled}
+            for name, disabled in zip(names, disabled_flags)
         ]
 
-        return JSONResponse({"profiles": profiles})
+        return ORJSONResponse({"profiles": profiles})
 
     @mcp.custom_route("/api/profiles/{profile}", methods=["DELETE"])
     async def api_delete_profile(request: Request):
         """API endpoint to delete a profile."""
         subject = get_authenticated_user(request)
         if not subject:
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
         profile = request.path_params["profile"]
 
         try:
-            delete_profile(subject, profile)
-            return JSONResponse({
+            await run_in_threadpool(delete_profile, subject, profile)
+            _profiles_cache.pop(subject)
+            return ORJSONResponse({
                 "success": True,
                 "message": f"Profile '{profile}' deleted"
             })
         except Exception as e:
-            return JSONResponse({"error": str(e)}, status_code=400)
+            return ORJSONResponse({"error": str(e)}, status_code=400)
 
     @mcp.custom_route("/api/profiles/{profile}/disabled", methods=["POST"])
     async def api_set_profile_disabled(request: Request):
@@ -5353,23 +5578,25 @@ if not LOCAL_MODE:
         """
         subject = get_authenticated_user(request)
         if not subject:
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
         profile = request.path_params["profile"]
 
         try:
-            body = await request.json()
+            body = await read_json_body(request)
             disabled = bool(body.get("disabled"))
             # Read even when currently disabled so an enable can read it back.
-            creds = dict(get_secret(subject, profile, allow_disabled=True))
+            creds = dict(await run_in_threadpool(
+                get_secret, subject, profile, allow_disabled=True
+            ))
             creds["disabled"] = disabled
-            put_secret(subject, profile, creds)
-            return JSONResponse({
+            await run_in_threadpool(put_secret, subject, profile, creds)
+            return ORJSONResponse({
                 "success": True,
                 "message": f"Profile '{profile}' {'disabled' if disabled else 'enabled'}",
             })
         except Exception as e:
-            return JSONResponse({"error": _sanitize_error_msg(str(e))}, status_code=400)
+            return ORJSONResponse({"error": _sanitize_error_msg(str(e))}, status_code=400)
 
 
 # --- Boomi Docs KB (optional) ---
@@ -5484,7 +5711,7 @@ if BOOMI_DOCS_ENABLED:
         except Exception as e:
             # Sanitize: full detail server-side only; client gets a generic
             # message + coarse category (KbQueryError text can embed internals).
-            print(f"[ERROR] search_boomi_docs query failed: {e}")
+            _log.error("search_boomi_docs query failed: %s", e)
             return {
                 "_success": False,
                 "error": "kb_query_error",
@@ -5518,7 +5745,7 @@ if BOOMI_DOCS_ENABLED:
         try:
             return res.service.read_page(page_key, max_chunks, start_chunk_index)
         except Exception as e:
-            print(f"[ERROR] read_boomi_doc_page failed: {e}")
+            _log.error("read_boomi_doc_page failed: %s", e)
             return {
                 "_success": False,
                 "error": "kb_query_error",
@@ -5589,82 +5816,97 @@ if BOOMI_GOTCHAS_ENABLED:
           "(stdlib-only, no ML deps)")
 
 
+def _local_banner() -> str:
+    """Startup banner for local (stdio) mode, listing the registered tools."""
+    bar = "=" * 60
+    banner = []
+    out = banner.append
+    out("\n" + bar)
+    out("Boomi MCP Server - LOCAL DEVELOPMENT MODE")
+    out(bar)
+    out("  WARNING: This is for LOCAL TESTING ONLY")
+    out("  No OAuth authentication - DO NOT use in production")
+    out(bar)
+    out(f"Auth Mode:     None (local dev)")
+    out(f"Storage:       Local file (~/.boomi_mcp_local_secrets.json)")
+    out(f"Test User:     local-dev-user")
+    out(bar)
+    out("\nMCP Tools available:")
+    out("  list_boomi_profiles - List saved credential profiles")
+    out("  set_boomi_credentials - Store Boomi credentials")
+    out("  bulk_set_boomi_credentials - Store several credential profiles at once")
+    out("  delete_boomi_profile - Delete a credential profile")
+    out("  boomi_account_info - Get account information from Boomi API")
+    if manage_trading_partner_action:
+        out("\n  Trading Partner & Organization Management:")
+        tp_desc = "trading partners and organizations" if manage_organization_action else "trading partners"
+        out(f"  manage_trading_partner - Unified tool for {tp_desc}")
+        out("    Actions: list, get, create, update, delete, analyze_usage")
+        if manage_organization_action:
+            out("    Org actions: org_list, org_get, org_create, org_update, org_delete")
+        out("    Standards: X12, EDIFACT, HL7, RosettaNet, Custom, Tradacoms, Odette")
+    if manage_process_action:
+        out("\n  Process Management:")
+        out("  manage_process - Read-only process inspection (list/get)")
+    if build_integration_action:
+        out("\n  Integration Builder:")
+        out("  build_integration - Plan/apply/verify full integration builds")
+        out("    Actions: plan, apply, verify")
+    if query_components_action:
+        out("\n  Component Discovery:")
+        out("  query_components - List, get, search, bulk_get components")
+        out("    Actions: list, get, search, bulk_get")
+    if manage_component_action:
+        out("\n  Component Management:")
+        out("  manage_component - Create, update, clone, delete components")
+        out("    Actions: create, update, clone, delete")
+    if analyze_component_action:
+        out("\n  Component Analysis:")
+        out("  analyze_component - Dependencies, version comparison, and merge")
+        out("    Actions: where_used, dependencies, compare_versions, merge")
+    if monitor_platform_action:
+        out("\n  Platform Monitoring:")
+        out("  monitor_platform - Logs, artifacts, audit trail, and events")
+        out("    Actions: execution_logs, execution_artifacts, audit_logs, events")
+    if manage_runtimes_action:
+        out("\n  Runtime Management:")
+        out("  manage_runtimes - Manage runtimes, attachments, restart, Java, tokens")
+        out("    Actions: list, get, update, delete, attach, detach, list_attachments,")
+        out("             restart, configure_java, create_installer_token")
+    if manage_deployment_action:
+        out("\n  Deployment Management:")
+        out("  manage_deployment - Packages and deployment lifecycle")
+        out("    Actions: list_packages, get_package, create_package, delete_package,")
+        out("             deploy, undeploy, list_deployments, get_deployment")
+    if orchestrate_deploy_action:
+        out("  orchestrate_deploy - One-call package -> deploy -> bind runtime -> optional schedule/test")
+        out("    dry_run=true previews; dry_run=false executes. Order: package/deploy, then runtime, then schedule/test")
+    if execute_process_action:
+        out("\n  Process Execution:")
+        out("  execute_process - Execute a process on a runtime")
+        out("    Returns request_id for polling via monitor_platform(action='execution_records')")
+    if manage_shared_resources_action:
+        out("\n  Shared Resources:")
+        out("  manage_shared_resources - Web servers, communication channels, and server info")
+        out("    Actions: list_web_servers, get_web_server, update_web_server, list_channels,")
+        out("             get_channel, create_channel, update_channel, delete_channel,")
+        out("             get_server_info, update_server_info")
+    if invoke_api:
+        out("\n  Generic API Access:")
+        out("  invoke_boomi_api - Direct access to any Boomi REST API endpoint")
+        out("    Covers: Roles, Branches, Folders, Packages, Deployments, etc.")
+    out(bar + "\n")
+    return "\n".join(banner) + "\n"
+
+
 if __name__ == "__main__":
     if LOCAL_MODE:
-        print("\n" + "=" * 60)
-        print("Boomi MCP Server - LOCAL DEVELOPMENT MODE")
-        print("=" * 60)
-        print("  WARNING: This is for LOCAL TESTING ONLY")
-        print("  No OAuth authentication - DO NOT use in production")
-        print("=" * 60)
-        print(f"Auth Mode:     None (local dev)")
-        print(f"Storage:       Local file (~/.boomi_mcp_local_secrets.json)")
-        print(f"Test User:     local-dev-user")
-        print("=" * 60)
-        print("\nMCP Tools available:")
-        print("  list_boomi_profiles - List saved credential profiles")
-        print("  set_boomi_credentials - Store Boomi credentials")
-        print("  delete_boomi_profile - Delete a credential profile")
-        print("  boomi_account_info - Get account information from Boomi API")
-        if manage_trading_partner_action:
-            print("\n  Trading Partner & Organization Management:")
-            tp_desc = "trading partners and organizations" if manage_organization_action else "trading partners"
-            print(f"  manage_trading_partner - Unified tool for {tp_desc}")
-            print("    Actions: list, get, create, update, delete, analyze_usage")
-            if manage_organization_action:
-                print("    Org actions: org_list, org_get, org_create, org_update, org_delete")
-            print("    Standards: X12, EDIFACT, HL7, RosettaNet, Custom, Tradacoms, Odette")
-        if manage_process_action:
-            print("\n  Process Management:")
-            print("  manage_process - Read-only process inspection (list/get)")
-        if build_integration_action:
-            print("\n  Integration Builder:")
-            print("  build_integration - Plan/apply/verify full integration builds")
-            print("    Actions: plan, apply, verify")
-        if query_components_action:
-            print("\n  Component Discovery:")
-            print("  query_components - List, get, search, bulk_get components")
-            print("    Actions: list, get, search, bulk_get")
-        if manage_component_action:
-            print("\n  Component Management:")
-            print("  manage_component - Create, update, clone, delete components")
-            print("    Actions: create, update, clone, delete")
-        if analyze_component_action:
-            print("\n  Component Analysis:")
-            print("  analyze_component - Dependencies, version comparison, and merge")
-            print("    Actions: where_used, dependencies, compare_versions, merge")
-        if monitor_platform_action:
-            print("\n  Platform Monitoring:")
-            print("  monitor_platform - Logs, artifacts, audit trail, and events")
-            print("    Actions: execution_logs, execution_artifacts, audit_logs, events")
-        if manage_runtimes_action:
-            print("\n  Runtime Management:")
-            print("  manage_runtimes - Manage runtimes, attachments, restart, Java, tokens")
-            print("    Actions: list, get, update, delete, attach, detach, list_attachments,")
-            print("             restart, configure_java, create_installer_token")
-        if manage_deployment_action:
-            print("\n  Deployment Management:")
-            print("  manage_deployment - Packages and deployment lifecycle")
-            print("    Actions: list_packages, get_package, create_package, delete_package,")
-            print("             deploy, undeploy, list_deployments, get_deployment")
-        if orchestrate_deploy_action:
-            print("  orchestrate_deploy - One-call package -> deploy -> bind runtime -> optional schedule/test")
-            print("    dry_run=true previews; dry_run=false executes. Order: package/deploy, then runtime, then schedule/test")
-        if execute_process_action:
-            print("\n  Process Execution:")
-            print("  execute_process - Execute a process on a runtime")
-            print("    Returns request_id for polling via monitor_platform(action='execution_records')")
-        if manage_shared_resources_action:
-            print("\n  Shared Resources:")
-            print("  manage_shared_resources - Web servers, communication channels, and server info")
-            print("    Actions: list_web_servers, get_web_server, update_web_server, list_channels,")
-            print("             get_channel, create_channel, update_channel, delete_channel,")
-            print("             get_server_info, update_server_info")
-        if invoke_api:
-            print("\n  Generic API Access:")
-            print("  invoke_boomi_api - Direct access to any Boomi REST API endpoint")
-            print("    Covers: Roles, Branches, Folders, Packages, Deployments, etc.")
-        print("=" * 60 + "\n")
+        # stdout is the MCP stdio wire, so the banner goes to stderr -- and only
+        # when a human is watching. MCP hosts spawn the server with stderr on a
+        # pipe, where the banner is just noise written on every spawn.
+        if sys.stderr.isatty():
+            sys.stderr.write(_local_banner())
+            sys.stderr.flush()
 
         mcp.run(transport="stdio")
     else:
@@ -8,6 +8,8 @@ This properly exposes OAuth routes at root level alongside MCP endpoint.
 import contextlib
 import os
 import secrets
+
+import anyio.to_thread
 import uvicorn
 from starlette.middleware import Middleware
 from starlette.middleware.sessions import SessionMiddleware
@@ -111,6 +113,25 @@ def _stream_guard_env_present():
     return [n for n in _STREAM_GUARD_ENV_VARS if os.getenv(n, "").strip()]
 
 
+# Sync MCP tools and Starlette's run_in_threadpool share anyio's default worker
+# limiter (40 threads). Every Boomi tool is a blocking sync function, so past
+# 40 in-flight calls requests queue even while the instance has capacity. Size
+# it to Cloud Run's default per-instance concurrency instead; override with
+# BOOMI_TOOL_THREADS.
+DEFAULT_TOOL_THREADS = 80
+
+
+def _tool_thread_count():
+    """Worker-thread budget for blocking tool calls (BOOMI_TOOL_THREADS, else
+    ``DEFAULT_TOOL_THREADS``). Invalid or non-positive values fall back to the
+    default."""
+    try:
+        value = int(os.getenv("BOOMI_TOOL_THREADS", "").strip() or DEFAULT_TOOL_THREADS)
+    except ValueError:
+        return DEFAULT_TOOL_THREADS
+    return value if value > 0 else DEFAULT_TOOL_THREADS
+
+
 def _compose_strict_probe_lifespan(app):
     """Wrap the app's lifespan so ``server.run_strict_startup_probes()`` runs on
     the serving loop at startup, before the app's normal lifespan.
@@ -119,8 +140,10 @@ def _compose_strict_probe_lifespan(app):
     reach their Mongo collections; a probe failure raises here, which aborts
     uvicorn startup (fail fast) rather than booting with a silently-degraded
     protection. No-op when the probe hook is unavailable (local mode) or no
-    probes are registered. Mirrors ``install_reaper_lifespan``'s wrapping of
-    ``app.router.lifespan_context``."""
+    probes are registered. At startup it also sizes anyio's default worker
+    limiter (see ``_tool_thread_count``); on shutdown it closes the web portal's
+    shared httpx client (``server.close_web_http_client``). Mirrors
+    ``install_reaper_lifespan``'s wrapping of ``app.router.lifespan_context``."""
     router = getattr(app, "router", None)
     original = getattr(router, "lifespan_context", None)
     if router is None or original is None:
@@ -138,10 +161,18 @@ def _compose_strict_probe_lifespan(app):
 
         _server = sys.modules.get("server")
         probe = getattr(_server, "run_strict_startup_probes", None) if _server else None
+        close_client = getattr(_server, "close_web_http_client", None) if _server else None
+        # The limiter is per event loop, so it can only be sized from here.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = _tool_thread_count()
         if probe is not None:
             await probe()
-        async with original(app_):
-            yield
+        try:
+            async with original(app_):
+                yield
+        finally:
+            # Release the web portal's pooled OAuth client on shutdown.
+            if close_client is not None:
+                await close_client()
 
     router.lifespan_context = wrapped
 
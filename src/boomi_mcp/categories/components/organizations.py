@@ -56,6 +56,22 @@ def _json_to_wire_dict(value) -> Dict[str, Any]:
     return {}
 
 
+# Flat contact_* config key -> OrganizationContactInfo wire (JSON) key.
+_CONTACT_WIRE_KEYS = {
+    'contact_name': 'contactName',
+    'contact_email': 'email',
+    'contact_phone': 'phone',
+    'contact_fax': 'fax',
+    'contact_url': 'contactUrl',
+    'contact_address': 'address1',
+    'contact_address2': 'address2',
+    'contact_city': 'city',
+    'contact_state': 'state',
+    'contact_country': 'country',
+    'contact_postalcode': 'postalcode',
+}
+
+
 def build_organization_contact_info(**kwargs) -> OrganizationContactInfo:
     """
     Build OrganizationContactInfo model from flat parameters.
@@ -194,23 +210,12 @@ def get_organization(boomi_client, profile: str, organization_id: str) -> Dict[s
 
         contact = result.get("OrganizationContactInfo") or {}
         if isinstance(contact, dict) and contact:
-            contact_fields = {
-                "contact_name": contact.get("contactName"),
-                "contact_email": contact.get("email"),
-                "contact_phone": contact.get("phone"),
-                "contact_fax": contact.get("fax"),
-                "contact_url": contact.get("contactUrl"),
-                "contact_address": contact.get("address1"),
-                "contact_address2": contact.get("address2"),
-                "contact_city": contact.get("city"),
-                "contact_state": contact.get("state"),
-                "contact_country": contact.get("country"),
-                "contact_postalcode": contact.get("postalcode"),
-            }
             # Flatten into org_data, skip empty values
-            for k, v in contact_fields.items():
-                if v:
-                    org_data[k] = v
+            org_data.update(
+                (flat, contact[wire])
+                for flat, wire in _CONTACT_WIRE_KEYS.items()
+                if contact.get(wire)
+            )
 
         return {
             "_success": True,
@@ -246,9 +251,7 @@ def list_organizations(boomi_client, profile: str, filters: Optional[Dict[str, A
     """
     try:
         # Build query body
-        name_pattern = '%'
-        if filters and "name_pattern" in filters:
-            name_pattern = filters["name_pattern"]
+        name_pattern = (filters or {}).get("name_pattern", '%')
 
         # OrganizationComponent query via the SDK typed query (SDK 3.0.1). The
         # response is Union[QueryResponse, dict, str]; normalize it to the wire
@@ -362,27 +365,11 @@ def update_organization(boomi_client, profile: str, organization_id: str, update
         # mapped to their wire keys.
         existing_contact = existing_org.get("OrganizationContactInfo") or {}
         contact_params = {
-            'contactName': existing_contact.get('contactName', ''),
-            'email': existing_contact.get('email', ''),
-            'phone': existing_contact.get('phone', ''),
-            'fax': existing_contact.get('fax', ''),
-            'contactUrl': existing_contact.get('contactUrl', ''),
-            'address1': existing_contact.get('address1', ''),
-            'address2': existing_contact.get('address2', ''),
-            'city': existing_contact.get('city', ''),
-            'state': existing_contact.get('state', ''),
-            'country': existing_contact.get('country', ''),
-            'postalcode': existing_contact.get('postalcode', ''),
-        }
-        _contact_wire_keys = {
-            'contact_name': 'contactName', 'contact_email': 'email', 'contact_phone': 'phone',
-            'contact_fax': 'fax', 'contact_url': 'contactUrl', 'contact_address': 'address1',
-            'contact_address2': 'address2', 'contact_city': 'city', 'contact_state': 'state',
-            'contact_country': 'country', 'contact_postalcode': 'postalcode',
+            wire: existing_contact.get(wire, '') for wire in _CONTACT_WIRE_KEYS.values()
         }
-        for k, v in updates.items():
-            if k in _contact_wire_keys:
-                contact_params[_contact_wire_keys[k]] = v
+        contact_params.update(
+            (_CONTACT_WIRE_KEYS[k], v) for k, v in updates.items() if k in _CONTACT_WIRE_KEYS
+        )
         existing_org["OrganizationContactInfo"] = contact_params
 
         # Update organization via the SDK JSON method (full-document POST). The
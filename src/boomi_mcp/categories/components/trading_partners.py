@@ -119,6 +119,25 @@ def _strip_enum_prefix(val):
     return s
 
 
+# Flat protocol update keys are namespaced by these prefixes (e.g. "as2_url").
+_FLAT_PROTOCOL_PREFIXES = ("ftp_", "sftp_", "http_", "as2_", "disk_", "mllp_", "oftp_")
+
+
+def _split_flat_protocol_params(updates):
+    """Bucket flat protocol keys by prefix in a single pass over *updates*.
+
+    Returns a dict keyed by prefix (e.g. "as2_") whose values are the matching
+    ``{key: value}`` subsets; prefixes with no keys map to an empty dict.
+    """
+    buckets = {prefix: {} for prefix in _FLAT_PROTOCOL_PREFIXES}
+    for key, value in updates.items():
+        prefix = key.split('_', 1)[0] + '_'
+        bucket = buckets.get(prefix)
+        if bucket is not None:
+            bucket[key] = value
+    return buckets
+
+
 # AS2 content type: SDK enum string → human-readable display
 _AS2_CONTENT_TYPE_DISPLAY = {
     "textplain": "text/plain",
@@ -134,6 +153,32 @@ _AS2_CONTENT_TYPE_DISPLAY = {
 # Trading Partner CRUD Operations
 # ============================================================================
 
+def _pop_config_warnings(data: Dict[str, Any]) -> List[str]:
+    """Pop alias-normalization warnings from *data* and add config sanity warnings.
+
+    Shared by create and update; *data* is the output of normalize_config_aliases.
+    """
+    warnings = list(data.pop("_alias_warnings", None) or ())
+    ftp_get_action = data.get('ftp_get_action', '')
+    if ftp_get_action and ftp_get_action.lower() == 'actiongetmove':
+        if not data.get('ftp_file_to_move'):
+            warnings.append(
+                "FTP get_action 'actiongetmove' requires ftp_file_to_move (target directory). "
+                "Also consider setting ftp_move_force_override='true' if target may already exist."
+            )
+    return warnings
+
+
+# Top-level create fields passed to build_trading_partner_model by name, with defaults.
+_CREATE_MAIN_FIELDS = (
+    ("component_name", None),
+    ("standard", "x12"),
+    ("classification", "tradingpartner"),
+    ("folder_name", "Home"),
+    ("description", ""),
+)
+
+
 def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a new trading partner component in Boomi using JSON-based TradingPartnerComponent API.
@@ -188,9 +233,6 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
     """
     try:
         # Import the JSON model builder
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
         from boomi_mcp.models.trading_partner_builders import build_trading_partner_model, normalize_config_aliases
 
         # Normalize user-friendly aliases to internal field names
@@ -205,41 +247,15 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
             }
 
         # Collect warnings for potentially problematic values
-        warnings = []
-        # Collect alias normalization warnings
-        alias_warnings = request_data.pop("_alias_warnings", None)
-        if alias_warnings:
-            warnings.extend(alias_warnings)
-
-        ftp_get_action = request_data.get('ftp_get_action', '')
-        if ftp_get_action and ftp_get_action.lower() == 'actiongetmove':
-            if not request_data.get('ftp_file_to_move'):
-                warnings.append(
-                    "FTP get_action 'actiongetmove' requires ftp_file_to_move (target directory). "
-                    "Also consider setting ftp_move_force_override='true' if target may already exist."
-                )
+        warnings = _pop_config_warnings(request_data)
 
-        # Extract main fields and pass remaining fields as kwargs
-        component_name = request_data.get("component_name")
-        standard = request_data.get("standard", "x12")
-        classification = request_data.get("classification", "tradingpartner")
-        folder_name = request_data.get("folder_name", "Home")
-        description = request_data.get("description", "")
-
-        # Remove main fields from request_data to avoid duplicate kwargs
-        other_params = {k: v for k, v in request_data.items()
-                       if k not in ["component_name", "standard", "classification", "folder_name", "description"]}
+        # Extract main fields (with defaults) and pass remaining fields as kwargs
+        main_fields = {k: request_data.get(k, default) for k, default in _CREATE_MAIN_FIELDS}
+        other_params = {k: v for k, v in request_data.items() if k not in main_fields}
 
         # Use SDK models for all protocols
         try:
-            tp_model = build_trading_partner_model(
-                component_name=component_name,
-                standard=standard,
-                classification=classification,
-                folder_name=folder_name,
-                description=description,
-                **other_params  # Pass all other parameters
-            )
+            tp_model = build_trading_partner_model(**main_fields, **other_params)
         except ValueError as ve:
             return {
                 "_success": False,
@@ -268,12 +284,12 @@ def create_trading_partner(boomi_client, profile: str, request_data: Dict[str, A
             "_success": True,
             "trading_partner": {
                 "component_id": component_id,
-                "name": getattr(result, 'name', request_data.get("component_name")),
-                "standard": request_data.get("standard", "x12"),
-                "classification": request_data.get("classification", "tradingpartner"),
-                "folder_name": request_data.get("folder_name", "Home")
+                "name": getattr(result, 'name', main_fields["component_name"]),
+                "standard": main_fields["standard"],
+                "classification": main_fields["classification"],
+                "folder_name": main_fields["folder_name"]
             },
-            "message": f"Successfully created trading partner: {request_data.get('component_name')}",
+            "message": f"Successfully created trading partner: {main_fields['component_name']}",
             "warnings": warnings if warnings else None
         }
 
@@ -1055,6 +1071,17 @@ def get_trading_partner(boomi_client, profile: str, component_id: str) -> Dict[s
         }
 
 
+# list filter key -> (query operator, query property, lowercase the value?)
+_LIST_FILTER_EXPRESSIONS = (
+    ("standard", TradingPartnerComponentSimpleExpressionOperator.EQUALS,
+     TradingPartnerComponentSimpleExpressionProperty.STANDARD, True),
+    ("classification", TradingPartnerComponentSimpleExpressionOperator.EQUALS,
+     TradingPartnerComponentSimpleExpressionProperty.CLASSIFICATION, True),
+    ("name_pattern", TradingPartnerComponentSimpleExpressionOperator.LIKE,
+     TradingPartnerComponentSimpleExpressionProperty.NAME, False),
+)
+
+
 def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     List all trading partners with optional filtering using typed query models.
@@ -1080,33 +1107,15 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
         expressions = []
 
         if filters:
-            # Filter by standard
-            if "standard" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.EQUALS,
-                    property=TradingPartnerComponentSimpleExpressionProperty.STANDARD,
-                    argument=[filters["standard"].lower()]
-                )
-                expressions.append(expr)
-
-            # Filter by classification
-            if "classification" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.EQUALS,
-                    property=TradingPartnerComponentSimpleExpressionProperty.CLASSIFICATION,
-                    argument=[filters["classification"].lower()]
+            expressions = [
+                TradingPartnerComponentSimpleExpression(
+                    operator=operator,
+                    property=prop,
+                    argument=[filters[key].lower() if lower else filters[key]],
                 )
-                expressions.append(expr)
-
-            # Filter by name pattern
-            if "name_pattern" in filters:
-                expr = TradingPartnerComponentSimpleExpression(
-                    operator=TradingPartnerComponentSimpleExpressionOperator.LIKE,
-                    property=TradingPartnerComponentSimpleExpressionProperty.NAME,
-                    argument=[filters["name_pattern"]]
-                )
-                expressions.append(expr)
-
+                for key, operator, prop, lower in _LIST_FILTER_EXPRESSIONS
+                if key in filters
+            ]
             # Note: NOT_EQUALS operator not available in typed models
             # Deleted filtering would need to be done client-side if needed
 
@@ -1231,6 +1240,27 @@ def list_trading_partners(boomi_client, profile: str, filters: Optional[Dict[str
 HTTP_UPDATE_DENYLIST = {"http_cookie_scope"}
 
 
+# Flat update keys that feed the standard-specific partner_info, any standard.
+_PARTNER_INFO_UPDATE_FIELDS = frozenset((
+    # x12
+    'isa_id', 'isa_qualifier', 'gs_id', 'isa_auth_qualifier', 'isa_sec_qualifier',
+    # edifact
+    'edifact_interchange_id', 'edifact_interchange_id_qual', 'edifact_syntax_id',
+    'edifact_syntax_version', 'edifact_test_indicator',
+    # hl7
+    'hl7_application', 'hl7_facility',
+    # rosettanet
+    'rosettanet_partner_id', 'rosettanet_partner_location',
+    'rosettanet_global_usage_code', 'rosettanet_supply_chain_code',
+    'rosettanet_classification_code',
+    # tradacoms
+    'tradacoms_interchange_id', 'tradacoms_interchange_id_qualifier',
+    # odette
+    'odette_interchange_id', 'odette_interchange_id_qual', 'odette_syntax_id',
+    'odette_syntax_version', 'odette_test_indicator',
+))
+
+
 def update_trading_partner(boomi_client, profile: str, component_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
     """
     Update an existing trading partner component using JSON-based TradingPartnerComponent API.
@@ -1274,29 +1304,16 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
     """
     try:
         # Import the JSON model builder
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-        from boomi_mcp.models.trading_partner_builders import build_contact_info, normalize_config_aliases
+        from boomi_mcp.models.trading_partner_builders import (
+            CONTACT_FIELD_MAP, build_contact_info, normalize_config_aliases
+        )
         from boomi.models import ContactInfo
 
         # Normalize user-friendly aliases to internal field names
         updates = normalize_config_aliases(updates)
 
         # Collect warnings for potentially problematic values
-        warnings = []
-        # Collect alias normalization warnings
-        alias_warnings = updates.pop("_alias_warnings", None)
-        if alias_warnings:
-            warnings.extend(alias_warnings)
-
-        ftp_get_action = updates.get('ftp_get_action', '')
-        if ftp_get_action and ftp_get_action.lower() == 'actiongetmove':
-            if not updates.get('ftp_file_to_move'):
-                warnings.append(
-                    "FTP get_action 'actiongetmove' requires ftp_file_to_move (target directory). "
-                    "Also consider setting ftp_move_force_override='true' if target may already exist."
-                )
+        warnings = _pop_config_warnings(updates)
 
         # Step 1: Get the existing trading partner via the SDK JSON method (SDK
         # 3.0.1). Hydrate a dict response into a model so the merge logic below is
@@ -1322,11 +1339,8 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
         # Check if protocol updates were specified (these will REPLACE existing communications)
         # Support both nested format (*_settings) and flat format (*_host, *_url, etc.)
         from boomi_mcp.models.trading_partner_builders import PartnerCommunicationDict
-        flat_protocol_prefixes = ["ftp_", "sftp_", "http_", "as2_", "disk_", "mllp_", "oftp_"]
-        has_flat_protocol_updates = any(
-            any(key.startswith(prefix) for prefix in flat_protocol_prefixes)
-            for key in updates
-        )
+        flat_protocol_params = _split_flat_protocol_params(updates)
+        has_flat_protocol_updates = any(flat_protocol_params.values())
         has_nested_protocol_updates = any(key in updates for key in [
             "as2_settings", "http_settings", "sftp_settings", "ftp_settings", "disk_settings"
         ])
@@ -1356,15 +1370,12 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
         # Update contact information
         # Support both nested dict format and flat parameter format
         # IMPORTANT: Merge with existing contact info to preserve unchanged fields
-        contact_updates = {}
         if "contact_info" in updates:
             # Nested format
             contact_updates = updates["contact_info"]
         else:
             # Flat format - extract contact_* parameters
-            for key in updates:
-                if key.startswith('contact_'):
-                    contact_updates[key] = updates[key]
+            contact_updates = {k: v for k, v in updates.items() if k.startswith('contact_')}
 
         if contact_updates:
             # First, get existing contact info values to preserve unchanged fields
@@ -1374,17 +1385,10 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
             if existing_contact:
                 # Extract existing values
                 merged_contact = {
-                    'contact_name': _ga(existing_contact, 'contact_name', 'name') or '',
-                    'contact_email': getattr(existing_contact, 'email', '') or '',
-                    'contact_phone': getattr(existing_contact, 'phone', '') or '',
-                    'contact_fax': getattr(existing_contact, 'fax', '') or '',
-                    'contact_address': getattr(existing_contact, 'address1', '') or '',
-                    'contact_address2': getattr(existing_contact, 'address2', '') or '',
-                    'contact_city': getattr(existing_contact, 'city', '') or '',
-                    'contact_state': getattr(existing_contact, 'state', '') or '',
-                    'contact_country': getattr(existing_contact, 'country', '') or '',
-                    'contact_postalcode': getattr(existing_contact, 'postalcode', '') or '',
+                    flat: getattr(existing_contact, attr, '') or ''
+                    for flat, attr in CONTACT_FIELD_MAP
                 }
+                merged_contact['contact_name'] = _ga(existing_contact, 'contact_name', 'name') or ''
 
             # Merge updates on top of existing values
             merged_contact.update(contact_updates)
@@ -1395,20 +1399,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                 existing_tp.contact_info = contact_info
 
         # Standard-specific partner_info update
-        partner_info_fields = {
-            'x12': ['isa_id', 'isa_qualifier', 'gs_id', 'isa_auth_qualifier', 'isa_sec_qualifier'],
-            'edifact': ['edifact_interchange_id', 'edifact_interchange_id_qual', 'edifact_syntax_id',
-                        'edifact_syntax_version', 'edifact_test_indicator'],
-            'hl7': ['hl7_application', 'hl7_facility'],
-            'rosettanet': ['rosettanet_partner_id', 'rosettanet_partner_location',
-                           'rosettanet_global_usage_code', 'rosettanet_supply_chain_code',
-                           'rosettanet_classification_code'],
-            'tradacoms': ['tradacoms_interchange_id', 'tradacoms_interchange_id_qualifier'],
-            'odette': ['odette_interchange_id', 'odette_interchange_id_qual', 'odette_syntax_id',
-                       'odette_syntax_version', 'odette_test_indicator'],
-        }
-        all_pi_fields = [f for fields in partner_info_fields.values() for f in fields]
-        pi_updates = {k: v for k, v in updates.items() if k in all_pi_fields}
+        pi_updates = {k: v for k, v in updates.items() if k in _PARTNER_INFO_UPDATE_FIELDS}
 
         if pi_updates:
             from boomi_mcp.models.trading_partner_builders import build_partner_info
@@ -1540,9 +1531,9 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
             # Handle flat parameters (preferred format from server.py)
             # These will UPDATE or ADD protocols on top of preserved ones
             if has_flat_protocol_updates:
-                # Extract flat params by prefix
-                as2_params = {k: v for k, v in updates.items() if k.startswith('as2_')}
-                http_params = {k: v for k, v in updates.items() if k.startswith('http_')}
+                # Flat params were bucketed by prefix above
+                as2_params = flat_protocol_params['as2_']
+                http_params = flat_protocol_params['http_']
                 # Strip create-only HTTP fields to prevent Boomi 400 errors
                 for field in HTTP_UPDATE_DENYLIST:
                     if field in http_params:
@@ -1550,9 +1541,9 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                         warnings.append(
                             f"{field} is not supported on update and was ignored to prevent Boomi 400 error"
                         )
-                sftp_params = {k: v for k, v in updates.items() if k.startswith('sftp_')}
-                ftp_params = {k: v for k, v in updates.items() if k.startswith('ftp_')}
-                disk_params = {k: v for k, v in updates.items() if k.startswith('disk_')}
+                sftp_params = flat_protocol_params['sftp_']
+                ftp_params = flat_protocol_params['ftp_']
+                disk_params = flat_protocol_params['disk_']
 
                 if as2_params:
                     # For updates, merge with existing AS2 values for partial updates
@@ -1663,7 +1654,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                             as2_params['as2_multiple_attachments'] = str(existing_multi).lower()
                                     if 'as2_max_document_count' not in as2_params:
                                         existing_max = _ga(existing_msg_opts, 'max_document_count', 'maxDocumentCount')
-                                        if existing_max:
+                                        if existing_max is not None:
                                             as2_params['as2_max_document_count'] = existing_max
 
                                 # MDN options (under AS2MDNOptions)
@@ -1894,11 +1885,11 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                 # Timeout settings
                                 if 'http_connect_timeout' not in http_params:
                                     existing_timeout = _ga(existing_settings, 'connect_timeout', 'connectTimeout')
-                                    if existing_timeout:
+                                    if existing_timeout is not None:
                                         http_params['http_connect_timeout'] = str(existing_timeout)
                                 if 'http_read_timeout' not in http_params:
                                     existing_timeout = _ga(existing_settings, 'read_timeout', 'readTimeout')
-                                    if existing_timeout:
+                                    if existing_timeout is not None:
                                         http_params['http_read_timeout'] = str(existing_timeout)
                                 # SSL settings (nested under HTTPSSLOptions)
                                 existing_ssl_opts = _ga(existing_settings, 'httpssl_options', 'HTTPSSLOptions')
@@ -2048,13 +2039,12 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                     if existing_val:
                                         http_params['http_listen_username'] = existing_val
                             # Helpers for serializing SDK header/element objects
-                            import json as _json
                             def _serialize_headers(items):
                                 """Serialize SDK Header objects using _header_to_dict."""
-                                return _json.dumps([_header_to_dict(h) for h in items])
+                                return json.dumps([_header_to_dict(h) for h in items])
                             def _serialize_elements(items):
                                 """Serialize SDK Element objects using _element_to_dict."""
-                                return _json.dumps([_element_to_dict(e) for e in items])
+                                return json.dumps([_element_to_dict(e) for e in items])
                             # Preserve Send options headers/path elements
                             existing_send = _ga(existing_http, 'http_send_options', 'HTTPSendOptions')
                             if existing_send:
@@ -2257,7 +2247,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                         sftp_params['sftp_get_action'] = existing_action
                                 if 'sftp_max_file_count' not in sftp_params:
                                     existing_count = _ga(existing_get_opts, 'max_file_count', 'maxFileCount')
-                                    if existing_count:
+                                    if existing_count is not None:
                                         sftp_params['sftp_max_file_count'] = str(existing_count)
                                 if 'sftp_file_to_move' not in sftp_params:
                                     existing_file = _ga(existing_get_opts, 'file_to_move', 'fileToMove')
@@ -2357,7 +2347,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                         ftp_params['ftp_get_action'] = existing_action
                                 if 'ftp_max_file_count' not in ftp_params:
                                     existing_count = _ga(existing_get_opts, 'max_file_count', 'maxFileCount')
-                                    if existing_count:
+                                    if existing_count is not None:
                                         ftp_params['ftp_max_file_count'] = str(existing_count)
                                 if 'ftp_file_to_move' not in ftp_params:
                                     existing_file = _ga(existing_get_opts, 'file_to_move', 'fileToMove')
@@ -2453,7 +2443,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                         comm_dict["DiskCommunicationOptions"] = disk_opts
 
                 # MLLP protocol
-                mllp_params = {k: v for k, v in updates.items() if k.startswith('mllp_')}
+                mllp_params = flat_protocol_params['mllp_']
                 if mllp_params:
                     # Merge with existing MLLP values for partial updates
                     existing_comm = getattr(existing_tp, 'partner_communication', None)
@@ -2478,11 +2468,11 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                 # Timeout settings
                                 if 'mllp_send_timeout' not in mllp_params:
                                     existing_timeout = _ga(existing_settings, 'send_timeout', 'sendTimeout')
-                                    if existing_timeout:
+                                    if existing_timeout is not None:
                                         mllp_params['mllp_send_timeout'] = str(existing_timeout)
                                 if 'mllp_receive_timeout' not in mllp_params:
                                     existing_timeout = _ga(existing_settings, 'receive_timeout', 'receiveTimeout')
-                                    if existing_timeout:
+                                    if existing_timeout is not None:
                                         mllp_params['mllp_receive_timeout'] = str(existing_timeout)
                                 if 'mllp_halt_timeout' not in mllp_params:
                                     existing_timeout = _ga(existing_settings, 'halt_timeout', 'haltTimeout')
@@ -2499,7 +2489,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                                         mllp_params['mllp_max_retry'] = existing_retry
                                 if 'mllp_inactivity_timeout' not in mllp_params:
                                     existing_inactivity = _ga(existing_settings, 'inactivity_timeout', 'inactivityTimeout')
-                                    if existing_inactivity:
+                                    if existing_inactivity is not None:
                                         mllp_params['mllp_inactivity_timeout'] = existing_inactivity
                                 # SSL settings
                                 if 'mllp_use_ssl' not in mllp_params:
@@ -2527,7 +2517,7 @@ def update_trading_partner(boomi_client, profile: str, component_id: str, update
                         comm_dict["MLLPCommunicationOptions"] = mllp_opts
 
                 # OFTP protocol
-                oftp_params = {k: v for k, v in updates.items() if k.startswith('oftp_')}
+                oftp_params = flat_protocol_params['oftp_']
                 if oftp_params:
                     # Merge with existing OFTP values for partial updates
                     existing_comm = getattr(existing_tp, 'partner_communication', None)
@@ -3168,6 +3158,172 @@ def _action_pg_delete(sdk, profile: str, **kwargs) -> Dict[str, Any]:
     }
 
 
+def _action_list(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """List trading partners with optional filters."""
+    return list_trading_partners(sdk, profile, kwargs.get("filters", None))
+
+
+def _action_get(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Get a trading partner by ID."""
+    partner_id = kwargs.get("partner_id")
+    if not partner_id:
+        return {
+            "_success": False,
+            "error": "partner_id is required for 'get' action",
+            "hint": "Provide the trading partner component ID to retrieve"
+        }
+    return get_trading_partner(sdk, profile, partner_id)
+
+
+def _action_create(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Create a trading partner from request_data."""
+    request_data = kwargs.get("request_data")
+    if request_data is None:
+        return {
+            "_success": False,
+            "error": "config is required for 'create' action",
+            "hint": "config must include at least component_name and standard. Use action='list_options' to see valid values."
+        }
+    if isinstance(request_data, dict) and not request_data:
+        return {
+            "_success": False,
+            "error": "config is empty — component_name and standard are required",
+            "hint": "Provide at minimum: {\"component_name\": \"...\", \"standard\": \"x12|edifact|hl7|custom|...\"}. Use action='list_options' to see valid values."
+        }
+    return create_trading_partner(sdk, profile, request_data)
+
+
+def _action_update(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Apply updates to an existing trading partner."""
+    partner_id = kwargs.get("partner_id")
+    updates = kwargs.get("updates")
+    if not partner_id:
+        return {
+            "_success": False,
+            "error": "partner_id is required for 'update' action",
+            "hint": "Provide the trading partner component ID to update"
+        }
+    if not updates:
+        return {
+            "_success": False,
+            "error": "updates dict is required for 'update' action",
+            "hint": "Provide the fields to update in the trading partner configuration"
+        }
+    return update_trading_partner(sdk, profile, partner_id, updates)
+
+
+def _action_delete(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Delete a trading partner by ID."""
+    partner_id = kwargs.get("partner_id")
+    if not partner_id:
+        return {
+            "_success": False,
+            "error": "partner_id is required for 'delete' action",
+            "hint": "Provide the trading partner component ID to delete"
+        }
+    return delete_trading_partner(sdk, profile, partner_id)
+
+
+def _action_analyze_usage(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Analyze where a trading partner is used."""
+    partner_id = kwargs.get("partner_id")
+    if not partner_id:
+        return {
+            "_success": False,
+            "error": "partner_id is required for 'analyze_usage' action",
+            "hint": "Provide the trading partner component ID to analyze"
+        }
+    return analyze_trading_partner_usage(sdk, profile, partner_id)
+
+
+def _action_list_options(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Return the static option catalog (no API call)."""
+    return list_options()
+
+
+def _action_org_list(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """List organizations with optional filters."""
+    return list_organizations(sdk, profile, kwargs.get("filters", None))
+
+
+def _action_org_get(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Get an organization by ID."""
+    organization_id = kwargs.get("organization_id") or kwargs.get("resource_id")
+    if not organization_id:
+        return {
+            "_success": False,
+            "error": "organization_id is required for 'org_get' action",
+            "hint": "Provide the organization component ID to retrieve"
+        }
+    return get_organization(sdk, profile, organization_id)
+
+
+def _action_org_create(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Create an organization from request_data."""
+    request_data = kwargs.get("request_data") or kwargs.get("config")
+    if not request_data:
+        return {
+            "_success": False,
+            "error": "config is required for 'org_create' action",
+            "hint": "config must include at least component_name"
+        }
+    return create_organization(sdk, profile, request_data)
+
+
+def _action_org_update(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Apply updates to an existing organization."""
+    organization_id = kwargs.get("organization_id") or kwargs.get("resource_id")
+    updates = kwargs.get("updates") or kwargs.get("config")
+    if not organization_id:
+        return {
+            "_success": False,
+            "error": "organization_id is required for 'org_update' action",
+            "hint": "Provide the organization component ID to update"
+        }
+    if not updates:
+        return {
+            "_success": False,
+            "error": "updates dict is required for 'org_update' action",
+            "hint": "Provide the fields to update"
+        }
+    return update_organization(sdk, profile, organization_id, updates)
+
+
+def _action_org_delete(sdk, profile: str, **kwargs) -> Dict[str, Any]:
+    """Delete an organization by ID."""
+    organization_id = kwargs.get("organization_id") or kwargs.get("resource_id")
+    if not organization_id:
+        return {
+            "_success": False,
+            "error": "organization_id is required for 'org_delete' action",
+            "hint": "Provide the organization component ID to delete"
+        }
+    return delete_organization(sdk, profile, organization_id)
+
+
+# action -> handler(sdk, profile, **params). Insertion order is the order
+# reported in the "Valid actions" hint for unknown actions.
+_TP_ACTION_DISPATCH = {
+    "list": _action_list,
+    "get": _action_get,
+    "create": _action_create,
+    "update": _action_update,
+    "delete": _action_delete,
+    "analyze_usage": _action_analyze_usage,
+    "list_options": _action_list_options,
+    "pg_list": _action_pg_list,
+    "pg_get": _action_pg_get,
+    "pg_create": _action_pg_create,
+    "pg_update": _action_pg_update,
+    "pg_delete": _action_pg_delete,
+    "org_list": _action_org_list,
+    "org_get": _action_org_get,
+    "org_create": _action_org_create,
+    "org_update": _action_org_update,
+    "org_delete": _action_org_delete,
+}
+
+
 def manage_trading_partner_action(
     boomi_client,
     profile: str,
@@ -3209,150 +3365,14 @@ def manage_trading_partner_action(
         Action result dict with success status and data/error
     """
     try:
-        if action == "list":
-            filters = params.get("filters", None)
-            return list_trading_partners(boomi_client, profile, filters)
-
-        elif action == "get":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'get' action",
-                    "hint": "Provide the trading partner component ID to retrieve"
-                }
-            return get_trading_partner(boomi_client, profile, partner_id)
-
-        elif action == "create":
-            request_data = params.get("request_data")
-            if request_data is None:
-                return {
-                    "_success": False,
-                    "error": "config is required for 'create' action",
-                    "hint": "config must include at least component_name and standard. Use action='list_options' to see valid values."
-                }
-            if isinstance(request_data, dict) and not request_data:
-                return {
-                    "_success": False,
-                    "error": "config is empty — component_name and standard are required",
-                    "hint": "Provide at minimum: {\"component_name\": \"...\", \"standard\": \"x12|edifact|hl7|custom|...\"}. Use action='list_options' to see valid values."
-                }
-            return create_trading_partner(boomi_client, profile, request_data)
-
-        elif action == "update":
-            partner_id = params.get("partner_id")
-            updates = params.get("updates")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'update' action",
-                    "hint": "Provide the trading partner component ID to update"
-                }
-            if not updates:
-                return {
-                    "_success": False,
-                    "error": "updates dict is required for 'update' action",
-                    "hint": "Provide the fields to update in the trading partner configuration"
-                }
-            return update_trading_partner(boomi_client, profile, partner_id, updates)
-
-        elif action == "delete":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'delete' action",
-                    "hint": "Provide the trading partner component ID to delete"
-                }
-            return delete_trading_partner(boomi_client, profile, partner_id)
-
-        elif action == "analyze_usage":
-            partner_id = params.get("partner_id")
-            if not partner_id:
-                return {
-                    "_success": False,
-                    "error": "partner_id is required for 'analyze_usage' action",
-                    "hint": "Provide the trading partner component ID to analyze"
-                }
-            return analyze_trading_partner_usage(boomi_client, profile, partner_id)
-
-        elif action == "list_options":
-            return list_options()
-
-        elif action == "pg_list":
-            return _action_pg_list(boomi_client, profile, **params)
-
-        elif action == "pg_get":
-            return _action_pg_get(boomi_client, profile, **params)
-
-        elif action == "pg_create":
-            return _action_pg_create(boomi_client, profile, **params)
-
-        elif action == "pg_update":
-            return _action_pg_update(boomi_client, profile, **params)
-
-        elif action == "pg_delete":
-            return _action_pg_delete(boomi_client, profile, **params)
-
-        elif action == "org_list":
-            filters = params.get("filters", None)
-            return list_organizations(boomi_client, profile, filters)
-
-        elif action == "org_get":
-            organization_id = params.get("organization_id") or params.get("resource_id")
-            if not organization_id:
-                return {
-                    "_success": False,
-                    "error": "organization_id is required for 'org_get' action",
-                    "hint": "Provide the organization component ID to retrieve"
-                }
-            return get_organization(boomi_client, profile, organization_id)
-
-        elif action == "org_create":
-            request_data = params.get("request_data") or params.get("config")
-            if not request_data:
-                return {
-                    "_success": False,
-                    "error": "config is required for 'org_create' action",
-                    "hint": "config must include at least component_name"
-                }
-            return create_organization(boomi_client, profile, request_data)
-
-        elif action == "org_update":
-            organization_id = params.get("organization_id") or params.get("resource_id")
-            updates = params.get("updates") or params.get("config")
-            if not organization_id:
-                return {
-                    "_success": False,
-                    "error": "organization_id is required for 'org_update' action",
-                    "hint": "Provide the organization component ID to update"
-                }
-            if not updates:
-                return {
-                    "_success": False,
-                    "error": "updates dict is required for 'org_update' action",
-                    "hint": "Provide the fields to update"
-                }
-            return update_organization(boomi_client, profile, organization_id, updates)
-
-        elif action == "org_delete":
-            organization_id = params.get("organization_id") or params.get("resource_id")
-            if not organization_id:
-                return {
-                    "_success": False,
-                    "error": "organization_id is required for 'org_delete' action",
-                    "hint": "Provide the organization component ID to delete"
-                }
-            return delete_organization(boomi_client, profile, organization_id)
-
-        else:
+        handler = _TP_ACTION_DISPATCH.get(action)
+        if handler is None:
             return {
                 "_success": False,
                 "error": f"Unknown action: {action}",
-                "hint": "Valid actions are: list, get, create, update, delete, analyze_usage, list_options, "
-                        "pg_list, pg_get, pg_create, pg_update, pg_delete, "
-                        "org_list, org_get, org_create, org_update, org_delete"
+                "hint": "Valid actions are: " + ", ".join(_TP_ACTION_DISPATCH)
             }
+        return handler(boomi_client, profile, **params)
 
     except ApiError as e:
         return {
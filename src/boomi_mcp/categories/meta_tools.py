@@ -5,6 +5,7 @@ Meta tools — schema templates and generic API invoker.
 - invoke_api: generic escape-hatch for any Boomi REST API endpoint
 """
 
+import json
 from typing import Dict, Any, Optional
 
 from boomi import Boomi
@@ -5535,7 +5536,6 @@ def _truncate_json_response(parsed, max_size):
     way.  For any other shape that still exceeds max_size, the serialized JSON
     is hard-truncated as a last resort.  Returns (truncated_obj, metadata_dict).
     """
-    import json as _json
     meta = {}
 
     # --- Root-level list ---
@@ -5544,7 +5544,7 @@ def _truncate_json_response(parsed, max_size):
         lo, hi = 0, total_items
         while lo < hi:
             mid = (lo + hi + 1) // 2
-            if len(_json.dumps(parsed[:mid])) <= max_size:
+            if len(json.dumps(parsed[:mid])) <= max_size:
                 lo = mid
             else:
                 hi = mid - 1
@@ -5567,7 +5567,7 @@ def _truncate_json_response(parsed, max_size):
             while lo < hi:
                 mid = (lo + hi + 1) // 2
                 parsed[list_key] = items[:mid]
-                if len(_json.dumps(parsed)) <= max_size:
+                if len(json.dumps(parsed)) <= max_size:
                     lo = mid
                 else:
                     hi = mid - 1
@@ -5577,7 +5577,7 @@ def _truncate_json_response(parsed, max_size):
             return parsed, meta
 
     # --- Fallback: hard-truncate serialized JSON ---
-    serialized = _json.dumps(parsed)
+    serialized = json.dumps(parsed)
     if len(serialized) <= max_size:
         return parsed, meta
     meta["note"] = "Response too large to truncate cleanly; data may be incomplete"
@@ -5747,8 +5747,6 @@ def invoke_api(
     Mutating POST/PUT calls require confirm_write=True; DELETE keeps its
     separate confirm_delete gate.
     """
-    import json as json_mod
-
     # --- Validate method ---
     method = method.upper()
     if method not in ("GET", "POST", "PUT", "DELETE"):
@@ -5804,8 +5802,8 @@ def invoke_api(
     if method in ("POST", "PUT") and payload:
         if content_type == "json":
             try:
-                body = json_mod.loads(payload)
-            except (json_mod.JSONDecodeError, TypeError):
+                body = json.loads(payload)
+            except (json.JSONDecodeError, TypeError):
                 return {
                     "_success": False,
                     "error": "Invalid JSON payload",
@@ -5853,7 +5851,7 @@ def invoke_api(
 
     # --- Parse response ---
     if isinstance(response, dict):
-        raw = json_mod.dumps(response)
+        raw = json.dumps(response)
     elif isinstance(response, bytes):
         raw = response.decode("utf-8", errors="replace")
     elif isinstance(response, str):
@@ -5876,7 +5874,7 @@ def invoke_api(
 
     if accept == "json":
         try:
-            parsed = json_mod.loads(raw)
+            parsed = json.loads(raw)
             if truncated:
                 parsed, trunc_meta = _truncate_json_response(parsed, MAX_RESPONSE_SIZE)
                 result["truncated"] = True
@@ -5887,7 +5885,7 @@ def invoke_api(
                 result["raw_response"] = parsed + "... [TRUNCATED]"
             else:
                 result["data"] = parsed
-        except (json_mod.JSONDecodeError, TypeError):
+        except (json.JSONDecodeError, TypeError):
             if truncated:
                 result["truncated"] = True
                 result["total_size"] = len(raw)
@@ -49,6 +49,7 @@ Provides 45 runtime management actions:
 - update_account_cloud_attachment_defaults: Update account cloud attachment property defaults
 """
 
+import json
 import re
 import time
 from typing import Dict, Any, Optional, List
@@ -1313,15 +1314,13 @@ def _normalize_observability_result(result) -> Optional[List[Dict[str, Any]]]:
     hydration fallback), or ``None`` when the result is not ready yet. Returns the
     settings rows on success, or ``None`` to keep polling.
     """
-    import json as json_mod
-
     if result is None:
         return None
     if isinstance(result, (bytes, bytearray)):
         result = result.decode("utf-8", errors="replace")
     if isinstance(result, str):
         try:
-            result = json_mod.loads(result)
+            result = json.loads(result)
         except Exception:
             return None
     # Typed RuntimeObservabilitySettingsAsyncResponse: prefer its typed result
@@ -5,8 +5,9 @@ Stores credentials in a local JSON file instead of cloud secret manager.
 
 import json
 import os
+import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class LocalSecretsBackend:
@@ -23,6 +24,10 @@ class LocalSecretsBackend:
             storage_file = os.path.expanduser("~/.boomi_mcp_local_secrets.json")
 
         self.storage_file = Path(storage_file)
+        # Parsed file contents plus the (mtime_ns, size) they were read at, so
+        # repeated reads skip the JSON parse until the file changes on disk.
+        self._cache_stamp = None
+        self._cache_data: Dict = {}
         self._ensure_storage_exists()
 
     def _ensure_storage_exists(self):
@@ -31,18 +36,61 @@ class LocalSecretsBackend:
             self.storage_file.parent.mkdir(parents=True, exist_ok=True)
             self._write_data({})
 
+    def _file_stamp(self):
+        """Return (mtime_ns, size) of the storage file, or None if missing."""
+        try:
+            st = os.stat(self.storage_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _read_data(self) -> Dict:
-        """Read all data from storage file."""
+        """Read all data from storage file.
+
+        Served from memory while the file's mtime and size are unchanged, so
+        an external edit is still picked up on the next read. Callers must
+        not mutate the returned dict; use _copy_data() before modifying.
+        """
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._cache_stamp:
+            return self._cache_data
         try:
             with open(self.storage_file, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except (json.JSONDecodeError, FileNotFoundError):
-            return {}
+            data = {}
+        self._cache_stamp = stamp
+        self._cache_data = data
+        return data
+
+    def _copy_data(self) -> Dict:
+        """Return a copy of the stored data that is safe to modify."""
+        return {subject: dict(profiles) for subject, profiles in self._read_data().items()}
 
     def _write_data(self, data: Dict):
-        """Write all data to storage file."""
-        with open(self.storage_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Write all data to storage file.
+
+        Writes a temp file in the same directory and renames it over the
+        storage file, so readers never see a half-written file and a failed
+        write leaves the previous contents intact. A symlinked storage file is
+        resolved first, so the link is kept and its target is replaced.
+        """
+        target = Path(self.storage_file).resolve()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._cache_stamp = self._file_stamp()
+        self._cache_data = data
 
     def put_secret(self, subject: str, profile: str, payload: Dict[str, str]):
         """Store credentials for a user profile.
@@ -52,14 +100,34 @@ class LocalSecretsBackend:
             profile: Profile name
             payload: Credentials dictionary with username, password, account_id
         """
-        data = self._read_data()
+        self.apply_batch([("put", subject, profile, payload)])
 
-        # Create user entry if doesn't exist
-        if subject not in data:
-            data[subject] = {}
+    def apply_batch(self, ops: List[Tuple]):
+        """Apply several put/delete operations with a single file write.
 
-        # Store profile credentials
-        data[subject][profile] = payload
+        Args:
+            ops: ``("put", subject, profile, payload)`` and
+                 ``("delete", subject, profile)`` tuples, applied in order
+
+        Raises:
+            ValueError: On an unknown operation or a delete of a missing
+                profile. Nothing is written in that case.
+        """
+        data = self._copy_data()
+        for op in ops:
+            kind, subject, profile = op[0], op[1], op[2]
+            if kind == "put":
+                # Create user entry if doesn't exist
+                data.setdefault(subject, {})[profile] = dict(op[3])
+            elif kind == "delete":
+                if subject not in data or profile not in data[subject]:
+                    raise ValueError(f"Profile '{profile}' not found for user {subject}")
+                del data[subject][profile]
+                # Remove user entry if no profiles left
+                if not data[subject]:
+                    del data[subject]
+            else:
+                raise ValueError(f"Unknown secrets operation: {kind!r}")
         self._write_data(data)
 
     def get_secret(self, subject: str, profile: str) -> Dict[str, str]:
@@ -87,7 +155,7 @@ class LocalSecretsBackend:
                 f"Available profiles: {available}"
             )
 
-        return data[subject][profile]
+        return dict(data[subject][profile])
 
     def list_profiles(self, subject: str) -> List[Dict]:
         """List all profiles for a user.
@@ -96,14 +164,19 @@ class LocalSecretsBackend:
             subject: User identifier
 
         Returns:
-            List of profile dictionaries with 'profile' name
+            List of profile dictionaries with 'profile' name and its
+            'disabled' flag (read from the same file load, so callers
+            filtering disabled profiles need no per-profile lookup)
         """
         data = self._read_data()
 
         if subject not in data:
             return []
 
-        return [{"profile": profile} for profile in data[subject].keys()]
+        return [
+            {"profile": profile, "disabled": bool(creds.get("disabled"))}
+            for profile, creds in data[subject].items()
+        ]
 
     def delete_profile(self, subject: str, profile: str):
         """Delete a user profile.
@@ -115,15 +188,4 @@ class LocalSecretsBackend:
         Raises:
             ValueError: If profile not found
         """
-        data = self._read_data()
-
-        if subject not in data or profile not in data[subject]:
-            raise ValueError(f"Profile '{profile}' not found for user {subject}")
-
-        del data[subject][profile]
-
-        # Remove user entry if no profiles left
-        if not data[subject]:
-            del data[subject]
-
-        self._write_data(data)
+        self.apply_batch([("delete", subject, profile)])
@@ -22,7 +22,10 @@ Usage:
     )
 """
 
+import functools
+import json
 import logging
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from boomi.models import (
     TradingPartnerComponent,
@@ -140,6 +143,21 @@ def normalize_config_aliases(config: dict) -> dict:
 # Contact Information Builder
 # ============================================================================
 
+# Flat contact_* parameter -> ContactInfo attribute.
+CONTACT_FIELD_MAP = (
+    ('contact_address', 'address1'),
+    ('contact_address2', 'address2'),
+    ('contact_city', 'city'),
+    ('contact_name', 'contact_name'),
+    ('contact_country', 'country'),
+    ('contact_email', 'email'),
+    ('contact_fax', 'fax'),
+    ('contact_phone', 'phone'),
+    ('contact_postalcode', 'postalcode'),
+    ('contact_state', 'state'),
+)
+
+
 def build_contact_info(**kwargs) -> Optional[ContactInfo]:
     """
     Build ContactInfo model from flat parameters.
@@ -159,24 +177,13 @@ def build_contact_info(**kwargs) -> Optional[ContactInfo]:
     Returns:
         ContactInfo object if any contact fields provided, None otherwise
     """
-    # Extract contact fields from kwargs
-    contact_fields = {
-        'address1': kwargs.get('contact_address', ''),
-        'address2': kwargs.get('contact_address2', ''),
-        'city': kwargs.get('contact_city', ''),
-        'contact_name': kwargs.get('contact_name', ''),
-        'country': kwargs.get('contact_country', ''),
-        'email': kwargs.get('contact_email', ''),
-        'fax': kwargs.get('contact_fax', ''),
-        'phone': kwargs.get('contact_phone', ''),
-        'postalcode': kwargs.get('contact_postalcode', ''),
-        'state': kwargs.get('contact_state', '')
-    }
-
-    # Return None if all fields are empty
-    if not any(contact_fields.values()):
+    # Return None if all fields are empty (the common case); any() stops at
+    # the first set field, so no dict is built for partners without contacts.
+    if not any(kwargs.get(flat) for flat, _ in CONTACT_FIELD_MAP):
         return None
 
+    # Extract contact fields from kwargs
+    contact_fields = {attr: kwargs.get(flat, '') for flat, attr in CONTACT_FIELD_MAP}
     return ContactInfo(**contact_fields)
 
 
@@ -325,7 +332,7 @@ def build_ftp_communication_options(**kwargs):
         get_options['transferType'] = transfer_type.lower()  # 'ascii' or 'binary'
     if get_action:
         get_options['ftpAction'] = get_action.lower()  # 'actionget', 'actiongetdelete', 'actiongetmove'
-    if max_file_count:
+    if max_file_count not in (None, ''):
         get_options['maxFileCount'] = int(max_file_count)
     if file_to_move:
         get_options['fileToMove'] = file_to_move
@@ -447,7 +454,7 @@ def build_sftp_communication_options(**kwargs):
             proxy_settings['proxyEnabled'] = str(proxy_enabled).lower() == 'true'
         if proxy_host:
             proxy_settings['host'] = proxy_host
-        if proxy_port:
+        if proxy_port not in (None, ''):
             proxy_settings['port'] = int(proxy_port)
         if proxy_user:
             proxy_settings['user'] = proxy_user
@@ -465,7 +472,7 @@ def build_sftp_communication_options(**kwargs):
         get_options['remoteDirectory'] = remote_directory
     if get_action:
         get_options['ftpAction'] = get_action.lower()
-    if max_file_count:
+    if max_file_count not in (None, ''):
         get_options['maxFileCount'] = int(max_file_count)
     if file_to_move:
         get_options['fileToMove'] = file_to_move
@@ -523,6 +530,13 @@ def _normalize_response_header(h):
     return {'@type': 'Header', 'headerFieldName': field, 'targetPropertyName': target}
 
 
+# Wire keys for HTTPOAuthSettings, in the order the builder emits them
+_OAUTH1_SETTING_KEYS = (
+    'consumerKey', 'consumerSecret', 'accessToken', 'tokenSecret', 'realm',
+    'signatureMethod', 'requestTokenURL', 'accessTokenURL', 'authorizationURL',
+)
+
+
 def build_http_communication_options(**kwargs):
     """Build HTTP protocol communication options.
 
@@ -592,8 +606,6 @@ def build_http_communication_options(**kwargs):
 
     Returns dict (not SDK model) - API accepts minimal structure
     """
-    import json as _json
-
     url = kwargs.get('http_url')
     if not url:
         return None
@@ -678,7 +690,7 @@ def build_http_communication_options(**kwargs):
         if not raw:
             return None
         try:
-            return _json.loads(raw)
+            return json.loads(raw)
         except (ValueError, TypeError):
             return None
 
@@ -699,10 +711,10 @@ def build_http_communication_options(**kwargs):
         'authenticationType': normalized_auth
     }
 
-    # Add timeouts if specified
-    if connect_timeout:
+    # Add timeouts if specified (an explicit 0 is kept)
+    if connect_timeout not in (None, ''):
         http_settings['connectTimeout'] = int(connect_timeout)
-    if read_timeout:
+    if read_timeout not in (None, ''):
         http_settings['readTimeout'] = int(read_timeout)
 
     # Add cookie scope if specified
@@ -726,25 +738,18 @@ def build_http_communication_options(**kwargs):
 
     # Add OAuth 1.0 settings if auth type is OAUTH
     if normalized_auth == 'OAUTH':
-        oauth1_settings = {}
-        if oauth1_consumer_key:
-            oauth1_settings['consumerKey'] = oauth1_consumer_key
-        if oauth1_consumer_secret:
-            oauth1_settings['consumerSecret'] = oauth1_consumer_secret
-        if oauth1_access_token:
-            oauth1_settings['accessToken'] = oauth1_access_token
-        if oauth1_token_secret:
-            oauth1_settings['tokenSecret'] = oauth1_token_secret
-        if oauth1_realm:
-            oauth1_settings['realm'] = oauth1_realm
-        if oauth1_signature_method:
-            oauth1_settings['signatureMethod'] = oauth1_signature_method.upper()
-        if oauth1_request_token_url:
-            oauth1_settings['requestTokenURL'] = oauth1_request_token_url
-        if oauth1_access_token_url:
-            oauth1_settings['accessTokenURL'] = oauth1_access_token_url
-        if oauth1_authorization_url:
-            oauth1_settings['authorizationURL'] = oauth1_authorization_url
+        # Keep only the truthy values, in _OAUTH1_SETTING_KEYS order
+        oauth1_settings = dict(filter(itemgetter(1), zip(_OAUTH1_SETTING_KEYS, (
+            oauth1_consumer_key,
+            oauth1_consumer_secret,
+            oauth1_access_token,
+            oauth1_token_secret,
+            oauth1_realm,
+            oauth1_signature_method and oauth1_signature_method.upper(),
+            oauth1_request_token_url,
+            oauth1_access_token_url,
+            oauth1_authorization_url,
+        ))))
         if oauth1_suppress_blank is not None:
             oauth1_settings['suppressBlankAccessToken'] = str(oauth1_suppress_blank).lower() == 'true'
         if oauth1_settings:
@@ -763,13 +768,10 @@ def build_http_communication_options(**kwargs):
                 'url': oauth2_auth_token_url,
                 'sslOptions': {}
             }
-        credentials = {}
-        if oauth_client_id:
-            credentials['clientId'] = oauth_client_id
-        if oauth_client_secret:
-            credentials['clientSecret'] = oauth_client_secret
-        if oauth2_access_token:
-            credentials['accessToken'] = oauth2_access_token
+        credentials = dict(filter(itemgetter(1), zip(
+            ('clientId', 'clientSecret', 'accessToken'),
+            (oauth_client_id, oauth_client_secret, oauth2_access_token),
+        )))
         if oauth2_use_refresh_token is not None:
             credentials['useRefreshToken'] = str(oauth2_use_refresh_token).lower() == 'true'
         if credentials:
@@ -1044,7 +1046,7 @@ def build_as2_communication_options(**kwargs):
         message_options['subject'] = subject
     if multiple_attachments is not None:
         message_options['multipleAttachments'] = str(multiple_attachments).lower() == 'true'
-    if max_document_count:
+    if max_document_count not in (None, ''):
         message_options['maxDocumentCount'] = int(max_document_count)
     if attachment_option:
         message_options['attachmentOption'] = attachment_option.upper()  # BATCH or DOCUMENT_CACHE
@@ -1156,7 +1158,7 @@ def build_as2_communication_options(**kwargs):
         partner_info['as2Id'] = as2_partner_id
     if reject_duplicates is not None:
         partner_info['rejectDuplicateMessages'] = str(reject_duplicates).lower() == 'true'
-    if duplicate_check_count:
+    if duplicate_check_count not in (None, ''):
         partner_info['messagesToCheckForDuplicates'] = int(duplicate_check_count)
     if legacy_smime is not None:
         partner_info['enabledLegacySMIME'] = str(legacy_smime).lower() == 'true'
@@ -1248,19 +1250,19 @@ def build_mllp_communication_options(**kwargs):
 
     if persistent is not None:
         mllp_settings['persistent'] = str(persistent).lower() == 'true'
-    if receive_timeout:
+    if receive_timeout not in (None, ''):
         mllp_settings['receiveTimeout'] = int(receive_timeout)
-    if send_timeout:
+    if send_timeout not in (None, ''):
         mllp_settings['sendTimeout'] = int(send_timeout)
     if max_connections is not None:
         mllp_settings['maxConnections'] = int(max_connections)
-    if inactivity_timeout:
+    if inactivity_timeout not in (None, ''):
         mllp_settings['inactivityTimeout'] = int(inactivity_timeout)
     if halt_timeout is not None:
         mllp_settings['haltTimeout'] = str(halt_timeout).lower() == 'true'
 
     # Max retry must be between 1-5 per Boomi API (default to 1)
-    if max_retry:
+    if max_retry not in (None, ''):
         mllp_settings['maxRetry'] = min(max(int(max_retry), 1), 5)
     else:
         mllp_settings['maxRetry'] = 1  # API requires 1-5, default to 1
@@ -1377,6 +1379,12 @@ class PartnerCommunicationDict(dict):
         return self._data
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_protocols(protocols: str) -> frozenset:
+    """Parse a comma-separated protocol string ("ftp, AS2") into a frozenset."""
+    return frozenset(p.strip().lower() for p in protocols.split(',') if p.strip())
+
+
 def build_partner_communication(**kwargs):
     """
     Build PartnerCommunication from flat protocol parameters.
@@ -1392,13 +1400,15 @@ def build_partner_communication(**kwargs):
     # Parse communication protocols
     protocols = kwargs.get('communication_protocols', [])
     if isinstance(protocols, str):
-        protocols = [p.strip().lower() for p in protocols.split(',') if p.strip()]
+        protocols = _parse_protocols(protocols)
+    else:
+        protocols = frozenset(protocols or ())
 
     if not protocols:
         return None
 
     # Check if only using Disk
-    only_disk = protocols == ['disk']
+    only_disk = protocols == {'disk'}
 
     if only_disk:
         disk_opts = build_disk_communication_options(**kwargs)
@@ -2,9 +2,12 @@
 
 import re
 
+_URL_RE = re.compile(r'https?://[^\s\'")\]}>]+')
+_PATH_RE = re.compile(r'(/[a-zA-Z0-9_./-]{3,})')
+
 
 def sanitize_error_msg(msg: str) -> str:
     """Strip URLs and file paths from error messages."""
-    msg = re.sub(r'https?://[^\s\'")\]}>]+', '<redacted-url>', msg)
-    msg = re.sub(r'(/[a-zA-Z0-9_./-]{3,})', '<redacted-path>', msg)
+    msg = _URL_RE.sub('<redacted-url>', msg)
+    msg = _PATH_RE.sub('<redacted-path>', msg)
     return msg
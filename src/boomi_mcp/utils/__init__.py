@@ -2,4 +2,5 @@
 Boomi MCP Tools - Utility Modules
 
 - async_polling: Shared polling helper for asynchronous Boomi API operations.
+- ttl_cache: Thread-safe bounded TTL cache for short-lived reuse of fetched values.
 """
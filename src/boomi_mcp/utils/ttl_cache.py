@@ -0,0 +1,60 @@
+"""
+Thread-safe bounded TTL cache.
+
+Small in-process cache for values that are expensive to fetch but safe to
+reuse for a short while (secret-store listings, SDK clients).  Entries expire
+after a fixed TTL and the least-recently-used entry is evicted once the cache
+is full.  Sync callers only -- guarded by a ``threading.Lock`` so it can be
+shared between request handlers running in a threadpool.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded LRU dict with a fixed per-entry TTL. Single lock; O(1)."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._max_size = max_size
+        self._ttl = float(ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store *value* under *key*, evicting the oldest entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Drop *key* and return its value (None if it was not cached)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,40 @@
+"""Tests for list_trading_partners query filter construction."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+_src = str(Path(__file__).resolve().parent.parent / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from boomi_mcp.categories.components import trading_partners as tp  # noqa: E402
+
+
+def _queried_expression(filters):
+    client = MagicMock()
+    client.trading_partner_component.query_trading_partner_component.return_value = MagicMock(
+        result=[], query_token=None
+    )
+    result = tp.list_trading_partners(client, "dev", filters)
+    assert result["_success"] is True
+    call = client.trading_partner_component.query_trading_partner_component.call_args
+    return call.kwargs["request_body"].query_filter.expression
+
+
+def test_no_filters_lists_everything():
+    expr = _queried_expression(None)
+    assert expr.property == tp.TradingPartnerComponentSimpleExpressionProperty.NAME
+    assert expr.argument == ["%"]
+
+
+def test_standard_filter_is_lowercased():
+    expr = _queried_expression({"standard": "X12", "name_pattern": "%Acme%"})
+    assert expr.property == tp.TradingPartnerComponentSimpleExpressionProperty.STANDARD
+    assert expr.argument == ["x12"]
+
+
+def test_name_pattern_keeps_case():
+    expr = _queried_expression({"name_pattern": "%Acme%", "folder_name": "Partners"})
+    assert expr.operator == tp.TradingPartnerComponentSimpleExpressionOperator.LIKE
+    assert expr.argument == ["%Acme%"]
@@ -0,0 +1,160 @@
+"""Tests for LocalSecretsBackend's in-memory read cache.
+
+Reads are served from memory while the storage file's (mtime_ns, size) stamp is
+unchanged; writes through the backend refresh the cache, and an external edit
+to the file is picked up on the next read.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+_src_root = str(Path(__file__).resolve().parent.parent / "src")
+if _src_root not in sys.path:
+    sys.path.insert(0, _src_root)
+
+from boomi_mcp import local_secrets  # noqa: E402
+from boomi_mcp.local_secrets import LocalSecretsBackend  # noqa: E402
+
+_CREDS = {"username": "BOOMI_TOKEN.u", "password": "p", "account_id": "acct-1"}
+
+
+def _count_json_loads(monkeypatch):
+    calls = []
+    real = local_secrets.json.load
+
+    def counting(f):
+        calls.append(1)
+        return real(f)
+
+    monkeypatch.setattr(local_secrets.json, "load", counting)
+    return calls
+
+
+def test_repeated_reads_parse_file_once(tmp_path, monkeypatch):
+    backend = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    backend.put_secret("user", "dev", _CREDS)
+    calls = _count_json_loads(monkeypatch)
+
+    for _ in range(5):
+        assert backend.get_secret("user", "dev") == _CREDS
+        assert backend.list_profiles("user") == [{"profile": "dev", "disabled": False}]
+
+    assert calls == []
+
+
+def test_external_edit_is_picked_up(tmp_path):
+    path = tmp_path / "secrets.json"
+    backend = LocalSecretsBackend(str(path))
+    backend.put_secret("user", "dev", _CREDS)
+    assert backend.get_secret("user", "dev")["account_id"] == "acct-1"
+
+    edited = {"user": {"dev": {**_CREDS, "account_id": "acct-edited"}}}
+    path.write_text(json.dumps(edited))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert backend.get_secret("user", "dev")["account_id"] == "acct-edited"
+
+
+def test_returned_credentials_do_not_alias_cache(tmp_path):
+    backend = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    payload = dict(_CREDS)
+    backend.put_secret("user", "dev", payload)
+    payload["password"] = "mutated-by-caller"
+
+    creds = backend.get_secret("user", "dev")
+    creds["disabled"] = True
+
+    assert backend.get_secret("user", "dev") == _CREDS
+
+
+def test_delete_updates_cached_view(tmp_path):
+    path = tmp_path / "secrets.json"
+    backend = LocalSecretsBackend(str(path))
+    backend.put_secret("user", "dev", _CREDS)
+    backend.put_secret("user", "prod", _CREDS)
+    backend.delete_profile("user", "dev")
+
+    assert backend.list_profiles("user") == [{"profile": "prod", "disabled": False}]
+    assert json.loads(path.read_text()) == {"user": {"prod": _CREDS}}
+
+
+def test_apply_batch_writes_once(tmp_path, monkeypatch):
+    backend = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    backend.put_secret("user", "old", _CREDS)
+    writes = []
+    real_write = backend._write_data
+    monkeypatch.setattr(backend, "_write_data", lambda data: (writes.append(1), real_write(data)))
+
+    backend.apply_batch([
+        ("put", "user", "dev", _CREDS),
+        ("put", "user", "prod", {**_CREDS, "account_id": "acct-2"}),
+        ("delete", "user", "old"),
+    ])
+
+    assert len(writes) == 1
+    assert [p["profile"] for p in backend.list_profiles("user")] == ["dev", "prod"]
+    assert backend.get_secret("user", "prod")["account_id"] == "acct-2"
+
+
+def test_apply_batch_failure_writes_nothing(tmp_path):
+    backend = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    backend.put_secret("user", "dev", _CREDS)
+    try:
+        backend.apply_batch([("put", "user", "prod", _CREDS), ("delete", "user", "missing")])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    assert [p["profile"] for p in backend.list_profiles("user")] == ["dev"]
+
+
+def test_list_profiles_carries_disabled_flag(tmp_path):
+    backend = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    backend.apply_batch([
+        ("put", "user", "dev", _CREDS),
+        ("put", "user", "old", {**_CREDS, "disabled": True}),
+    ])
+    assert backend.list_profiles("user") == [
+        {"profile": "dev", "disabled": False},
+        {"profile": "old", "disabled": True},
+    ]
+
+
+def test_failed_write_keeps_previous_file_and_no_temp(tmp_path, monkeypatch):
+    path = tmp_path / "secrets.json"
+    backend = LocalSecretsBackend(str(path))
+    backend.put_secret("user", "dev", _CREDS)
+    before = path.read_text()
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(local_secrets.json, "dump", boom)
+    try:
+        backend.put_secret("user", "prod", _CREDS)
+    except OSError:
+        pass
+    else:
+        raise AssertionError("expected OSError")
+
+    assert path.read_text() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["secrets.json"]
+
+
+def test_write_through_symlink_keeps_link(tmp_path):
+    real_dir = tmp_path / "vault"
+    real_dir.mkdir()
+    target = real_dir / "secrets.json"
+    target.write_text("{}")
+    link = tmp_path / "secrets.json"
+    link.symlink_to(target)
+
+    backend = LocalSecretsBackend(str(link))
+    backend.put_secret("user", "dev", _CREDS)
+
+    assert link.is_symlink()
+    assert "dev" in json.loads(target.read_text())["user"]
+    assert sorted(p.name for p in real_dir.iterdir()) == ["secrets.json"]
@@ -6,6 +6,7 @@ that mirrors ``component_id``.  Tests exercise the contract at both layers:
 - server.manage_process.fn() (public MCP entrypoint)
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -258,3 +259,27 @@ def test_wrapper_legacy_config_arg_reaches_action_unsupported(action, _mock_auth
     assert result["_success"] is False
     assert result["error_code"] == "ACTION_UNSUPPORTED"
     assert result["valid_actions"] == ["list", "get"]
+
+
+def test_wrapper_forwards_parsed_list_filters(_mock_auth):
+    mock_action = MagicMock(return_value={"_success": True})
+    with patch.object(server, "manage_process_action", mock_action):
+        _call_wrapper(profile="dev", action="list", filters='{"folder_name": "X"}')
+    assert mock_action.call_args.kwargs == {"filters": {"folder_name": "X"}}
+
+
+def test_wrapper_rejects_non_object_filters_without_credentials():
+    get_secret = MagicMock()
+    with patch.object(server, "get_secret", get_secret):
+        result = _call_wrapper(profile="dev", action="list", filters="[1]")
+    assert result["_success"] is False
+    assert "JSON object" in result["error"]
+    get_secret.assert_not_called()
+
+
+def test_wrapper_call_is_logged_not_printed(_mock_auth, caplog, capsys):
+    with patch.object(server, "manage_process_action", MagicMock(return_value={"_success": True})), \
+            caplog.at_level(logging.INFO, logger="boomi.server"):
+        _call_wrapper(profile="dev", action="list")
+    assert "manage_process called by user: test-user" in caplog.text
+    assert "called by user" not in capsys.readouterr().out
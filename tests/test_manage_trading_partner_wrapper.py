@@ -0,0 +1,111 @@
+"""Regression tests for the manage_trading_partner MCP wrapper in server.py.
+
+Verifies the per-action parameter builders forward resource_id/config to
+manage_trading_partner_action, and that unknown actions fail fast without a
+credential lookup.
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+
+# Ensure project root is on sys.path so we can import server
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+# Force local mode before importing server
+os.environ["BOOMI_LOCAL"] = "true"
+
+import server  # noqa: E402
+
+
+FAKE_CREDS = {
+    "account_id": "acct-test",
+    "username": "user",
+    "password": "pass",
+}
+
+
+@pytest.fixture(autouse=True)
+def _mock_auth_and_sdk():
+    """Patch auth helpers and SDK so the wrapper never hits real services."""
+    with (
+        patch.object(server, "get_current_user", return_value="test-user"),
+        patch.object(server, "get_secret", return_value=FAKE_CREDS),
+        patch.object(server, "Boomi", return_value=MagicMock()),
+    ):
+        yield
+
+
+def _forwarded_kwargs(**kwargs):
+    mock_action = MagicMock(return_value={"_success": True})
+    with patch.object(server, "manage_trading_partner_action", mock_action):
+        server.manage_trading_partner(profile="dev", **kwargs)
+    mock_action.assert_called_once()
+    return mock_action.call_args.kwargs
+
+
+def test_update_forwards_partner_id_and_updates():
+    kwargs = _forwarded_kwargs(action="update", resource_id="tp-1", config='{"name": "x"}')
+    assert kwargs == {"partner_id": "tp-1", "updates": {"name": "x"}}
+
+
+def test_list_without_config_has_no_filters():
+    assert _forwarded_kwargs(action="list") == {}
+
+
+def test_create_without_config_passes_none():
+    assert _forwarded_kwargs(action="create") == {"request_data": None}
+
+
+def test_pg_action_merges_config_and_resource_id():
+    kwargs = _forwarded_kwargs(action="pg_update", resource_id="pg-1", config='{"name": "g"}')
+    assert kwargs == {"resource_id": "pg-1", "name": "g"}
+
+
+def test_unknown_action_fails_fast_without_credentials():
+    get_secret = MagicMock()
+    with patch.object(server, "get_secret", get_secret):
+        result = server.manage_trading_partner(profile="dev", action="bogus")
+    assert result["_success"] is False
+    assert "Unknown action" in result["error"]
+    assert "pg_list" in result["hint"]
+    get_secret.assert_not_called()
+
+
+def _forwarded_org_call(**kwargs):
+    mock_action = MagicMock(return_value={"_success": True})
+    with patch.object(server, "manage_organization_action", mock_action):
+        server.manage_trading_partner(profile="dev", **kwargs)
+    mock_action.assert_called_once()
+    return mock_action.call_args
+
+
+def test_org_update_strips_prefix_and_forwards_params():
+    call = _forwarded_org_call(action="org_update", resource_id="org-1", config='{"name": "o"}')
+    assert call.args[2] == "update"
+    assert call.kwargs == {"organization_id": "org-1", "updates": {"name": "o"}}
+
+
+def test_org_list_without_config_has_no_filters():
+    call = _forwarded_org_call(action="org_list")
+    assert call.args[2] == "list"
+    assert call.kwargs == {}
+
+
+def test_unknown_org_action_fails_fast_without_credentials():
+    get_secret = MagicMock()
+    with patch.object(server, "get_secret", get_secret):
+        result = server.manage_trading_partner(profile="dev", action="org_bogus")
+    assert result["_success"] is False
+    assert "Unknown action: bogus" in result["error"]
+    get_secret.assert_not_called()
+
+
+def test_unknown_org_action_without_org_module_reports_module_unavailable():
+    with patch.object(server, "manage_organization_action", None):
+        result = server.manage_trading_partner(profile="dev", action="org_bogus")
+    assert result == {"_success": False, "error": "Organization module not available"}
@@ -103,3 +103,17 @@ def test_update_organization_does_get_then_post():
     posted = client.organization_component.update_organization_component_json.call_args[0][1]
     assert posted["componentName"] == "Acme2"
     assert posted["OrganizationContactInfo"]["email"] == "jane@acme.com"
+
+
+def test_update_organization_merges_flat_contact_fields():
+    client = MagicMock()
+    client.organization_component.get_organization_component_json.return_value = dict(_ORG_JSON)
+    client.organization_component.update_organization_component_json.return_value = dict(_ORG_JSON)
+
+    orgs.update_organization(client, "work", "org-1", {"contact_phone": "555-0000"})
+
+    posted = client.organization_component.update_organization_component_json.call_args[0][1]
+    contact = posted["OrganizationContactInfo"]
+    assert contact["phone"] == "555-0000"
+    assert contact["contactName"] == "Jane"
+    assert contact["postalcode"] == ""
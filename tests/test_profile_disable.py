@@ -142,3 +142,13 @@ def test_account_info_notfound_hides_disabled_from_suggestions():
     assert result["_success"] is False
     assert result["available_profiles"] == ["enabledP"]
     assert "disabledP" not in result["available_profiles"]
+
+
+def test_list_tool_uses_listing_disabled_flag_without_secret_reads():
+    listing = [{"profile": "on", "disabled": False}, {"profile": "off", "disabled": True}]
+    with patch.object(server, "get_current_user", return_value="sub"), \
+         patch.object(server, "list_profiles", return_value=listing), \
+         patch.object(server.secrets_backend, "get_secret") as backend_get:
+        result = _call_tool(server.list_boomi_profiles)
+    assert result["profiles"] == ["on"]
+    backend_get.assert_not_called()
@@ -0,0 +1,76 @@
+"""Tests for the shared Boomi SDK HTTP session patch."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+import requests  # noqa: E402
+from boomi.net.request_chain.handlers import http_handler  # noqa: E402
+
+import sdk_http_session_patch  # noqa: E402
+from sdk_http_session_patch import apply_sdk_http_session_patch, get_shared_session  # noqa: E402
+
+
+def test_patch_routes_handler_through_shared_session():
+    apply_sdk_http_session_patch()
+    session = get_shared_session()
+    with patch.object(session, "request", return_value=MagicMock()) as mock_request:
+        http_handler.requests.request("GET", "https://api.example.test/x", timeout=5)
+    mock_request.assert_called_once_with("GET", "https://api.example.test/x", timeout=5)
+    # The global requests module is left alone.
+    assert requests.request is not http_handler.requests.request
+
+
+def test_patch_is_idempotent():
+    apply_sdk_http_session_patch()
+    shim = http_handler.requests
+    apply_sdk_http_session_patch()
+    assert http_handler.requests is shim
+
+
+def test_shared_session_is_singleton_and_drops_cookies():
+    session = get_shared_session()
+    assert get_shared_session() is session
+    req = requests.cookies.MockRequest(requests.Request("GET", "https://api.boomi.com/x").prepare())
+    cookie = requests.cookies.create_cookie("sid", "secret", domain="api.boomi.com")
+    session.cookies.set_cookie_if_ok(cookie, req)
+    assert len(session.cookies) == 0
+    adapter = session.get_adapter("https://api.boomi.com")
+    assert adapter._pool_maxsize == sdk_http_session_patch.POOL_MAXSIZE
+
+
+def test_json_body_is_pre_encoded_with_orjson():
+    orjson = pytest.importorskip("orjson")
+    apply_sdk_http_session_patch()
+    session = get_shared_session()
+    body = {"name": "Acme", "ids": [1, 2]}
+    with patch.object(session, "request", return_value=MagicMock()) as mock_request:
+        http_handler.requests.request(
+            "POST", "https://api.example.test/x", headers={"Accept": "application/json"}, json=body
+        )
+    kwargs = mock_request.call_args.kwargs
+    assert "json" not in kwargs
+    assert orjson.loads(kwargs["data"]) == body
+    assert kwargs["headers"]["content-type"] == "application/json"
+    assert kwargs["headers"]["Accept"] == "application/json"
+
+
+def test_unencodable_json_body_falls_back_to_requests():
+    body = {1: object()}
+    kwargs = {"json": body}
+    assert sdk_http_session_patch._encode_json_body(kwargs) is kwargs
+
+
+def test_existing_content_type_is_kept():
+    pytest.importorskip("orjson")
+    out = sdk_http_session_patch._encode_json_body(
+        {"json": {}, "headers": {"content-type": "application/vnd.boomi+json"}}
+    )
+    assert out["data"] == b"{}"
+    assert out["headers"]["Content-Type"] == "application/vnd.boomi+json"
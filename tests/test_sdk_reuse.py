@@ -0,0 +1,107 @@
+"""Tests for Boomi SDK client / get_account reuse in server.py."""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+os.environ["BOOMI_LOCAL"] = "true"
+
+import server  # noqa: E402
+
+_CREDS = {"account_id": "acct-1", "username": "BOOMI_TOKEN.u", "password": "pw"}
+
+
+def test_sdk_reused_for_same_credentials():
+    with patch.object(server, "Boomi") as mock_boomi:
+        first = server._sdk_for(dict(_CREDS))
+        second = server._sdk_for(dict(_CREDS))
+    assert first is second
+    assert mock_boomi.call_count == 1
+
+
+def test_changed_password_or_timeout_builds_new_client():
+    with patch.object(server, "Boomi") as mock_boomi:
+        server._sdk_for(dict(_CREDS))
+        server._sdk_for({**_CREDS, "password": "other"})
+        server._sdk_for(dict(_CREDS), timeout=10000)
+    assert mock_boomi.call_count == 3
+
+
+def test_base_url_only_passed_when_set():
+    with patch.object(server, "Boomi") as mock_boomi:
+        server._sdk_for(dict(_CREDS))
+        assert "base_url" not in mock_boomi.call_args.kwargs
+        server._sdk_for({**_CREDS, "base_url": "https://example.test"})
+        assert mock_boomi.call_args.kwargs["base_url"] == "https://example.test"
+
+
+def test_get_account_cached_per_credential_set():
+    with patch.object(server, "Boomi"):
+        sdk = server._sdk_for(dict(_CREDS))
+        assert server._get_account_cached(_CREDS)[1] is False
+        assert server._get_account_cached(_CREDS)[1] is True
+        assert sdk.account.get_account.call_count == 1
+
+        # Changed credentials never hit the entry built from the old ones.
+        new_creds = {**_CREDS, "password": "rotated"}
+        assert server._get_account_cached(new_creds)[1] is False
+
+
+def test_failed_get_account_is_not_cached():
+    with patch.object(server, "Boomi"):
+        sdk = server._sdk_for(dict(_CREDS))
+        sdk.account.get_account.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            server._get_account_cached(_CREDS)
+    assert len(server._ACCOUNT_CACHE) == 0
+
+
+def test_boomi_account_info_marks_cached_response():
+    class _Account:
+        def __init__(self):
+            self.account_id = "acct-1"
+            self.name = "Acme"
+
+    with patch.object(server, "Boomi") as mock_boomi, \
+            patch.object(server, "get_current_user", return_value="u"), \
+            patch.object(server, "get_secret", return_value=dict(_CREDS)):
+        mock_boomi.return_value.account.get_account.return_value = _Account()
+        first = server.boomi_account_info(profile="dev")
+        second = server.boomi_account_info(profile="dev")
+
+    assert first["_success"] is True and "_cached" not in first
+    assert second["_cached"] is True
+    assert second["name"] == "Acme"
+    assert mock_boomi.return_value.account.get_account.call_count == 1
+
+
+def test_cached_account_info_is_not_mutated_by_responses():
+    class _Account:
+        def __init__(self):
+            self.name = "Acme"
+
+    with patch.object(server, "Boomi") as mock_boomi, \
+            patch.object(server, "get_current_user", return_value="u"), \
+            patch.object(server, "get_secret", return_value=dict(_CREDS)):
+        mock_boomi.return_value.account.get_account.return_value = _Account()
+        server.boomi_account_info(profile="dev")
+        server.boomi_account_info(profile="dev")
+        info, cached = server._get_account_cached(_CREDS)
+
+    assert cached is True
+    assert info == {"name": "Acme"}
+
+
+def test_account_cache_hit_builds_no_client():
+    with patch.object(server, "Boomi") as mock_boomi:
+        server._get_account_cached(_CREDS)
+        server._SDK_CACHE.clear()
+        server._get_account_cached(_CREDS)
+    assert mock_boomi.call_count == 1
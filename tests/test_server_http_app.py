@@ -255,3 +255,71 @@ def test_stateless_inert_note_printed_when_no_guard_env(monkeypatch, capsys, rec
     assert "disabled" in out
     assert "no stream-guard env vars set" in out
     assert "IGNORED in stateless mode" not in out
+
+
+# ---------------------------------------------------------------------------
+# Lifespan: the web portal's shared OAuth httpx client is closed on shutdown
+# ---------------------------------------------------------------------------
+
+
+def test_lifespan_closes_web_http_client_on_shutdown(monkeypatch):
+    import asyncio
+    import contextlib
+    import types
+
+    events = []
+
+    async def _close():
+        events.append("closed")
+
+    fake_server = types.SimpleNamespace(close_web_http_client=_close)
+    monkeypatch.setitem(sys.modules, "server", fake_server)
+
+    @contextlib.asynccontextmanager
+    async def _original(app_):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = types.SimpleNamespace(router=types.SimpleNamespace(lifespan_context=_original))
+    server_http._compose_strict_probe_lifespan(app)
+
+    async def _run():
+        async with app.router.lifespan_context(app):
+            events.append("serving")
+
+    asyncio.run(_run())
+    assert events == ["startup", "serving", "shutdown", "closed"]
+
+
+def test_lifespan_sizes_tool_threadpool(monkeypatch):
+    import asyncio
+    import contextlib
+    import types
+
+    import anyio.to_thread
+
+    monkeypatch.setitem(sys.modules, "server", types.SimpleNamespace())
+    monkeypatch.setenv("BOOMI_TOOL_THREADS", "64")
+    seen = []
+
+    @contextlib.asynccontextmanager
+    async def _original(app_):
+        seen.append(anyio.to_thread.current_default_thread_limiter().total_tokens)
+        yield
+
+    app = types.SimpleNamespace(router=types.SimpleNamespace(lifespan_context=_original))
+    server_http._compose_strict_probe_lifespan(app)
+
+    async def _run():
+        async with app.router.lifespan_context(app):
+            pass
+
+    asyncio.run(_run())
+    assert seen == [64]
+
+
+@pytest.mark.parametrize("raw", ["", "abc", "0", "-3"])
+def test_tool_thread_count_falls_back_to_default(monkeypatch, raw):
+    monkeypatch.setenv("BOOMI_TOOL_THREADS", raw)
+    assert server_http._tool_thread_count() == server_http.DEFAULT_TOOL_THREADS
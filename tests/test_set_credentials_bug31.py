@@ -7,6 +7,7 @@ set_boomi_credentials must:
 - Never leak raw URLs or file paths in error responses.
 """
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -237,3 +238,98 @@ def test_boomi_mcp_sanitize_preserves_clean_text():
     from boomi_mcp.sanitize import sanitize_error_msg
     msg = "Authentication failed for user"
     assert sanitize_error_msg(msg) == msg
+
+
+# ---------------------------------------------------------------------------
+# bulk_set_boomi_credentials
+# ---------------------------------------------------------------------------
+
+def test_bulk_set_validates_each_and_writes_once(_mock_auth):
+    mock_sdk = MagicMock()
+    entries = [
+        {"profile": "dev", "account_id": "acct-1", "username": "BOOMI_TOKEN.a", "password": "p"},
+        {"profile": "bad", "account_id": "acct/2", "username": "BOOMI_TOKEN.b", "password": "p"},
+        {"profile": "dev", "account_id": "acct-3", "username": "BOOMI_TOKEN.c", "password": "p"},
+        {"profile": "qa", "account_id": "acct-4", "username": "plain", "password": "p"},
+    ]
+    with (
+        patch.object(server, "Boomi", return_value=mock_sdk),
+        patch.object(server.secrets_backend, "apply_batch") as mock_batch,
+    ):
+        result = server.bulk_set_boomi_credentials(profiles_json=json.dumps(entries))
+
+    assert result["_success"] is False
+    assert result["saved"] == 2
+    assert [r["status"] for r in result["results"]] == ["ok", "error", "error", "ok"]
+    assert "invalid characters" in result["results"][1]["error"]
+    assert result["results"][2]["error"] == "Duplicate profile in request"
+    assert "_warning" in result["results"][3]
+    mock_batch.assert_called_once()
+    ops = mock_batch.call_args.args[0]
+    assert [(op[0], op[2]) for op in ops] == [("put", "dev"), ("put", "qa")]
+
+
+def test_bulk_set_first_valid_entry_claims_profile(_mock_auth):
+    mock_sdk = MagicMock()
+    entries = [
+        {"profile": "dev", "account_id": "acct/1", "username": "BOOMI_TOKEN.a", "password": "p"},
+        {"profile": "dev", "account_id": "acct-2", "username": "BOOMI_TOKEN.b", "password": "p"},
+        {"profile": "", "account_id": "acct-3", "username": "BOOMI_TOKEN.c", "password": "p"},
+        {"profile": "", "account_id": "acct-4", "username": "BOOMI_TOKEN.d", "password": "p"},
+    ]
+    with (
+        patch.object(server, "Boomi", return_value=mock_sdk),
+        patch.object(server.secrets_backend, "apply_batch") as mock_batch,
+    ):
+        result = server.bulk_set_boomi_credentials(profiles_json=json.dumps(entries))
+
+    assert [r["status"] for r in result["results"]] == ["error", "ok", "error", "error"]
+    assert "invalid characters" in result["results"][0]["error"]
+    assert "cannot be empty" in result["results"][2]["error"]
+    assert "cannot be empty" in result["results"][3]["error"]
+    ops = mock_batch.call_args.args[0]
+    assert [(op[2], op[3]["account_id"]) for op in ops] == [("dev", "acct-2")]
+
+
+def test_bulk_set_rejects_non_array(_mock_auth):
+    result = server.bulk_set_boomi_credentials(profiles_json='{"profile": "dev"}')
+    assert result["_success"] is False
+    assert "JSON array" in result["error"]
+
+
+def test_bulk_set_validates_entries_concurrently(_mock_auth):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    mock_sdk = MagicMock()
+    # Each validation blocks until the other one arrives; a sequential loop
+    # would break the barrier and report both entries as failed.
+    mock_sdk.account.get_account.side_effect = lambda **_: barrier.wait()
+    entries = [
+        {"profile": "a", "account_id": "acct-a", "username": "BOOMI_TOKEN.a", "password": "p"},
+        {"profile": "b", "account_id": "acct-b", "username": "BOOMI_TOKEN.b", "password": "p"},
+    ]
+    with (
+        patch.object(server, "Boomi", return_value=mock_sdk),
+        patch.object(server.secrets_backend, "apply_batch"),
+    ):
+        result = server.bulk_set_boomi_credentials(profiles_json=json.dumps(entries))
+
+    assert [r["status"] for r in result["results"]] == ["ok", "ok"]
+
+
+def test_resaving_identical_credentials_skips_validation_call(_mock_auth):
+    mock_sdk = MagicMock()
+    kwargs = dict(profile="dev", account_id="acct-1", username="BOOMI_TOKEN.a", password="p")
+    with (
+        patch.object(server, "Boomi", return_value=mock_sdk),
+        patch.object(server.secrets_backend, "put_secret") as mock_put,
+    ):
+        assert _call(**kwargs)["_success"] is True
+        assert _call(**kwargs)["_success"] is True
+        assert _call(**{**kwargs, "password": "rotated"})["_success"] is True
+
+    # The identical re-save is served by the account cache; a changed
+    # password is validated again. Every call is still stored.
+    assert mock_sdk.account.get_account.call_count == 2
+    assert mock_put.call_count == 3
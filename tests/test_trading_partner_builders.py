@@ -0,0 +1,83 @@
+"""Tests for communication protocol parsing in trading_partner_builders."""
+
+import sys
+from pathlib import Path
+
+_src = str(Path(__file__).resolve().parent.parent / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from boomi_mcp.models import trading_partner_builders as tpb  # noqa: E402
+
+
+def test_parse_protocols_normalizes_and_caches():
+    parsed = tpb._parse_protocols(" FTP, as2 ,,ftp")
+    assert parsed == frozenset({"ftp", "as2"})
+    assert tpb._parse_protocols(" FTP, as2 ,,ftp") is parsed
+
+
+def test_empty_protocols_build_nothing():
+    assert tpb.build_partner_communication(communication_protocols="") is None
+    assert tpb.build_partner_communication(communication_protocols=[]) is None
+    assert tpb.build_partner_communication() is None
+
+
+def test_string_and_list_protocols_are_equivalent(monkeypatch):
+    monkeypatch.setattr(tpb, "build_ftp_communication_options", lambda **kw: {"ftp": 1})
+    monkeypatch.setattr(tpb, "build_as2_communication_options", lambda **kw: {"as2": 1})
+    from_str = tpb.build_partner_communication(communication_protocols="as2, FTP")
+    from_list = tpb.build_partner_communication(communication_protocols=["ftp", "as2"])
+    assert from_str._map() == from_list._map() == {
+        "FTPCommunicationOptions": {"ftp": 1},
+        "AS2CommunicationOptions": {"as2": 1},
+    }
+
+
+def test_build_contact_info_maps_flat_fields():
+    assert tpb.build_contact_info(unrelated="x") is None
+    info = tpb.build_contact_info(contact_address="1 Main St", contact_email="a@example.com")
+    assert info.address1 == "1 Main St"
+    assert info.email == "a@example.com"
+    assert info.city == ""
+
+
+def test_zero_numeric_options_are_kept():
+    ftp = tpb.build_ftp_communication_options(
+        ftp_host="h", ftp_port="21", ftp_get_action="actionget", ftp_max_file_count=0
+    )
+    assert ftp["FTPGetOptions"]["maxFileCount"] == 0
+    http = tpb.build_http_communication_options(
+        http_url="https://x.test", http_connect_timeout="0", http_read_timeout=""
+    )
+    settings = http["HTTPSettings"]
+    assert settings["connectTimeout"] == 0
+    assert "readTimeout" not in settings
+
+
+def test_zero_as2_counts_are_kept():
+    as2 = tpb.build_as2_communication_options(
+        as2_url="https://x.test", as2_max_document_count=0, as2_duplicate_check_count="0"
+    )
+    send = as2["AS2SendOptions"]
+    assert send["AS2MessageOptions"]["maxDocumentCount"] == 0
+    assert send["AS2PartnerInfo"]["messagesToCheckForDuplicates"] == 0
+
+
+def test_zero_mllp_timeouts_are_kept():
+    mllp = tpb.build_mllp_communication_options(
+        mllp_host="h", mllp_port="2575", mllp_receive_timeout=0, mllp_send_timeout="0",
+        mllp_inactivity_timeout=0, mllp_max_retry=0,
+    )
+    settings = mllp["MLLPSendSettings"]
+    assert settings["receiveTimeout"] == 0
+    assert settings["sendTimeout"] == 0
+    assert settings["inactivityTimeout"] == 0
+    # An explicit 0 reaches the 1-5 clamp instead of being dropped.
+    assert settings["maxRetry"] == 1
+
+
+def test_zero_sftp_proxy_port_is_kept():
+    sftp = tpb.build_sftp_communication_options(
+        sftp_host="h", sftp_proxy_enabled="true", sftp_proxy_port=0
+    )
+    assert sftp["SFTPSettings"]["SFTPProxySettings"]["port"] == 0
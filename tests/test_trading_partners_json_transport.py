@@ -48,6 +48,21 @@ def test_create_transports_model_as_json():
     assert isinstance(create.call_args[0][0], TradingPartnerComponent)
 
 
+def test_create_applies_main_field_defaults():
+    client = MagicMock()
+    client.trading_partner_component.create_trading_partner_component_json.return_value = {"id": "tp-2"}
+
+    out = tp.create_trading_partner(client, "work", {"component_name": "TP2"})
+
+    assert out["_success"] is True, out
+    created = out["trading_partner"]
+    assert (created["standard"], created["classification"], created["folder_name"]) == (
+        "x12", "tradingpartner", "Home")
+    model = client.trading_partner_component.create_trading_partner_component_json.call_args[0][0]
+    assert model.component_name == "TP2"
+    assert model.folder_name == "Home"
+
+
 def test_create_error_maps_to_failure():
     client = MagicMock()
     client.trading_partner_component.create_trading_partner_component_json.side_effect = _api_error(400, "no B2B")
@@ -116,3 +131,58 @@ def test_analyze_uses_component_get_xml_for_parent():
     refs = out["trading_partner"]["referenced_by"] if "referenced_by" in out.get("trading_partner", {}) else out.get("referenced_by")
     # Parent resolved with name/type from component_get_xml
     assert any(r.get("name") == "ParentProc" for r in (refs or []))
+
+
+def test_config_warnings_shared_by_create_and_update():
+    data = {"_alias_warnings": ["alias"], "ftp_get_action": "ActionGetMove"}
+    warnings = tp._pop_config_warnings(data)
+    assert warnings[0] == "alias"
+    assert "ftp_file_to_move" in warnings[1]
+    assert "_alias_warnings" not in data
+    assert tp._pop_config_warnings({"ftp_get_action": "actiongetmove", "ftp_file_to_move": "/done"}) == []
+
+
+def test_create_does_not_grow_sys_path():
+    import sys
+    client = MagicMock()
+    client.trading_partner_component.create_trading_partner_component_json.return_value = {"id": "tp-3"}
+    before = len(sys.path)
+    tp.create_trading_partner(client, "work", {"component_name": "TP3"})
+    tp.create_trading_partner(client, "work", {"component_name": "TP3"})
+    assert len(sys.path) == before
+
+
+def test_update_applies_flat_contact_and_partner_info_fields():
+    client = MagicMock()
+    client.trading_partner_component.get_trading_partner_component_json.return_value = dict(_TP_JSON)
+    client.trading_partner_component.update_trading_partner_component_json.return_value = dict(_TP_JSON)
+
+    out = tp.update_trading_partner(
+        client, "work", "tp-1", {"contact_email": "a@example.com", "isa_id": "ACME"}
+    )
+
+    assert out["_success"] is True, out
+    model = client.trading_partner_component.update_trading_partner_component_json.call_args[0][-1]
+    assert model.contact_info.email == "a@example.com"
+    isa = model.partner_info.x12_partner_info.x12_control_info.isa_control_info
+    assert isa.interchange_id == "ACME"
+
+
+def test_update_mllp_keeps_existing_zero_timeout():
+    existing = dict(_TP_JSON, PartnerCommunication={
+        "MLLPCommunicationOptions": {
+            "MLLPSendSettings": {"host": "old", "port": 2575, "sendTimeout": 0, "receiveTimeout": 5000},
+        },
+    })
+    client = MagicMock()
+    client.trading_partner_component.get_trading_partner_component_json.return_value = existing
+    client.trading_partner_component.update_trading_partner_component_json.return_value = dict(_TP_JSON)
+
+    out = tp.update_trading_partner(client, "work", "tp-1", {"mllp_host": "new"})
+
+    assert out["_success"] is True, out
+    model = client.trading_partner_component.update_trading_partner_component_json.call_args[0][-1]
+    settings = model.partner_communication._map()["MLLPCommunicationOptions"]["MLLPSendSettings"]
+    assert settings["host"] == "new"
+    assert settings["sendTimeout"] == 0
+    assert settings["receiveTimeout"] == 5000
@@ -0,0 +1,71 @@
+"""Tests for boomi_mcp.utils.ttl_cache.TTLCache — expiry, LRU bound, pop."""
+
+import sys
+from pathlib import Path
+
+_src_root = str(Path(__file__).resolve().parent.parent / "src")
+if _src_root not in sys.path:
+    sys.path.insert(0, _src_root)
+
+from boomi_mcp.utils import ttl_cache  # noqa: E402
+from boomi_mcp.utils.ttl_cache import TTLCache  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(monkeypatch, max_size=3, ttl=10.0):
+    clock = _Clock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+    return TTLCache(max_size=max_size, ttl_seconds=ttl), clock
+
+
+def test_get_returns_value_until_expiry(monkeypatch):
+    cache, clock = _cache(monkeypatch)
+    cache.set("a", [1])
+    clock.now += 9.9
+    assert cache.get("a") == [1]
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_missing_key_returns_none(monkeypatch):
+    cache, _ = _cache(monkeypatch)
+    assert cache.get("nope") is None
+
+
+def test_evicts_least_recently_used_when_full(monkeypatch):
+    cache, _ = _cache(monkeypatch, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # refresh a; b is now oldest
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_overwrites_and_restarts_ttl(monkeypatch):
+    cache, clock = _cache(monkeypatch)
+    cache.set("a", 1)
+    clock.now += 8
+    cache.set("a", 2)
+    clock.now += 8
+    assert cache.get("a") == 2
+
+
+def test_pop_and_clear(monkeypatch):
+    cache, _ = _cache(monkeypatch)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+    assert len(cache) == 0
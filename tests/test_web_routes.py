@@ -0,0 +1,36 @@
+"""Runs the web portal route tests (tests/web_routes) in production mode.
+
+Those routes are only registered when BOOMI_LOCAL is false, while every other
+suite imports ``server`` in local mode, and ``server`` is import-cached per
+process. So the route tests get a fresh interpreter with a production-shaped
+environment; nothing in it is contacted (MongoDB clients are lazy and the
+secrets store is swapped for a file-backed one).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_web_routes_in_production_mode():
+    env = os.environ.copy()
+    env.update({
+        "BOOMI_LOCAL": "false",
+        "BOOMI_WEB_ROUTE_TESTS": "1",
+        "OIDC_CLIENT_ID": "test-client-id",
+        "OIDC_CLIENT_SECRET": "test-client-secret",
+        "OIDC_BASE_URL": "http://testserver",
+        "MONGODB_URI": "mongodb://127.0.0.1:1/boomi-test",
+        "JWT_SIGNING_KEY": "test-jwt-signing-key",
+        "STORAGE_ENCRYPTION_KEY": Fernet.generate_key().decode(),
+    })
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "tests/web_routes"],
+        cwd=_REPO_ROOT, env=env, capture_output=True, text=True, timeout=600,
+    )
+    assert result.returncode == 0, result.stdout[-6000:] + result.stderr[-3000:]
@@ -0,0 +1,60 @@
+"""Fixtures for the web portal route tests.
+
+The web routes are only registered in production mode (BOOMI_LOCAL=false),
+and ``server`` is import-cached per process while the rest of the suite
+imports it in local mode. This package therefore runs in its own interpreter,
+driven by tests/test_web_routes.py, which sets the production environment.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+for _path in (str(_REPO_ROOT), str(_REPO_ROOT / "src")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from boomi_mcp import cloud_secrets  # noqa: E402
+from boomi_mcp.local_secrets import LocalSecretsBackend  # noqa: E402
+
+# The cloud secret managers are not needed here: each test swaps in a
+# file-backed store below.
+with patch.object(cloud_secrets, "get_secrets_backend", return_value=None):
+    import server  # noqa: E402
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.sessions import SessionMiddleware  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+SUBJECT = "google-sub-1"
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """Per-test secrets store, with the profile listing cache emptied."""
+    store = LocalSecretsBackend(str(tmp_path / "secrets.json"))
+    monkeypatch.setattr(server, "secrets_backend", store)
+    server._profiles_cache.clear()
+    return store
+
+
+@pytest.fixture
+def client(backend):
+    """TestClient over the custom routes, with the production session cookie."""
+    app = Starlette(
+        routes=server.mcp._get_additional_http_routes(),
+        middleware=[Middleware(SessionMiddleware, secret_key="test-secret", session_cookie="boomi_session")],
+    )
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def signed_in(monkeypatch):
+    """Authenticate every request as SUBJECT."""
+    monkeypatch.setattr(server, "get_authenticated_user", lambda request: SUBJECT)
+    return SUBJECT
@@ -0,0 +1,108 @@
+"""GET /web/callback: Google ID-token verification before the session login."""
+
+import base64
+import json
+import time
+import urllib.parse
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+import server
+
+_PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _id_token(**overrides):
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": server._OIDC_CLIENT_ID,
+        "sub": "google-sub-42",
+        "email": "dev@example.com",
+        "iat": now,
+        "exp": now + 600,
+    }
+    claims.update(overrides)
+    claims = {k: v for k, v in claims.items() if v is not None}
+    return jwt.encode(claims, _PRIVATE_KEY, algorithm="RS256", headers={"kid": "test-kid"})
+
+
+class _TokenResponse:
+    def __init__(self, id_token):
+        self._id_token = id_token
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"id_token": self._id_token}
+
+
+@pytest.fixture
+def google(monkeypatch):
+    """Stub Google's token endpoint and JWKS; returns a setter for the ID token."""
+    issued = {}
+
+    class _HttpClient:
+        async def post(self, url, data):
+            return _TokenResponse(issued["id_token"])
+
+    jwks = SimpleNamespace(
+        get_signing_key_from_jwt=lambda token: SimpleNamespace(key=_PRIVATE_KEY.public_key())
+    )
+    monkeypatch.setattr(server, "get_web_http_client", lambda: _HttpClient())
+    monkeypatch.setattr(server, "_google_jwks_client", jwks)
+    return lambda token: issued.__setitem__("id_token", token)
+
+
+def _session(client):
+    cookie = client.cookies.get("boomi_session")
+    if not cookie:
+        return {}
+    payload = cookie.split(".", 1)[0]
+    return json.loads(base64.b64decode(payload + "=" * (-len(payload) % 4)))
+
+
+def _callback(client):
+    login = client.get("/web/login", follow_redirects=False)
+    state = urllib.parse.parse_qs(urllib.parse.urlparse(login.headers["location"]).query)["state"][0]
+    return client.get(f"/web/callback?code=auth-code&state={state}", follow_redirects=False)
+
+
+def test_valid_token_signs_the_user_in(client, google):
+    google(_id_token())
+
+    response = _callback(client)
+
+    assert response.status_code in (302, 307)
+    assert response.headers["location"] == "/"
+    session = _session(client)
+    assert session["user_sub"] == "google-sub-42"
+    assert session["user_email"] == "dev@example.com"
+    assert "oauth_state" not in session and "code_verifier" not in session
+
+
+def test_small_clock_skew_is_tolerated(client, google):
+    google(_id_token(iat=int(time.time()) + 10))
+
+    assert _callback(client).status_code in (302, 307)
+    assert _session(client)["user_sub"] == "google-sub-42"
+
+
+@pytest.mark.parametrize("overrides", [
+    {"aud": "someone-elses-client-id"},
+    {"iss": "https://evil.example.com"},
+    {"exp": int(time.time()) - 600, "iat": int(time.time()) - 1200},
+    {"sub": None},
+], ids=["wrong-aud", "wrong-iss", "expired", "no-sub"])
+def test_rejected_token_does_not_sign_in(client, google, overrides):
+    google(_id_token(**overrides))
+
+    response = _callback(client)
+
+    assert response.status_code == 500
+    assert "Token exchange failed" in response.text
+    assert "user_sub" not in _session(client)
@@ -0,0 +1,107 @@
+"""POST /api/credentials/bulk: per-item validation, limit, order and failures."""
+
+import server
+
+_CREDS = {"username": "BOOMI_TOKEN.u", "password": "pw", "account_id": "acct-1"}
+
+
+def _bulk(client, items):
+    response = client.post("/api/credentials/bulk", json={"profiles": items})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _stored(backend, subject):
+    return {p["profile"] for p in backend.list_profiles(subject)}
+
+
+def test_requires_authentication(client, backend):
+    response = client.post("/api/credentials/bulk", json={"profiles": []})
+    assert response.status_code == 401
+
+
+def test_limit_refuses_new_names_but_updates_existing(client, signed_in, backend):
+    for i in range(9):
+        backend.put_secret(signed_in, f"p{i}", _CREDS)
+
+    body = _bulk(client, [
+        {"profile": "p0", **_CREDS, "password": "rotated"},
+        {"profile": "new1", **_CREDS},
+        {"profile": "new2", **_CREDS},
+        {"profile": "p1", **_CREDS},
+    ])
+
+    assert body["success"] is False
+    assert body["results"] == [
+        {"profile": "p0", "status": "ok"},
+        {"profile": "new1", "status": "ok"},
+        {"profile": "new2", "status": "error", "error": "Profile limit reached (10 profiles per user)"},
+        {"profile": "p1", "status": "ok"},
+    ]
+    assert _stored(backend, signed_in) == {f"p{i}" for i in range(9)} | {"new1"}
+    assert backend.get_secret(signed_in, "p0")["password"] == "rotated"
+
+
+def test_duplicate_name_in_request(client, signed_in, backend):
+    body = _bulk(client, [
+        {"profile": "dev", **_CREDS},
+        {"profile": "dev", **_CREDS, "password": "second"},
+    ])
+
+    assert body["results"][1] == {
+        "profile": "dev", "status": "error", "error": "Duplicate profile in request",
+    }
+    assert backend.get_secret(signed_in, "dev")["password"] == "pw"
+
+
+def test_malformed_entries_get_their_own_errors(client, signed_in, backend):
+    body = _bulk(client, [
+        "dev",
+        {"profile": ["dev"], **_CREDS},
+        {"profile": "", **_CREDS},
+        {"profile": "a", "username": "", "password": "pw", "account_id": "acct-1"},
+        {"profile": "b", "username": "u", "account_id": "acct-1"},
+        {"profile": "ok", **_CREDS},
+    ])
+
+    assert [r.get("error") for r in body["results"]] == [
+        "Each entry must be a JSON object",
+        "profile must be a non-empty string",
+        "profile must be a non-empty string",
+        "username must be a non-empty string",
+        "password must be a non-empty string",
+        None,
+    ]
+    assert _stored(backend, signed_in) == {"ok"}
+
+
+def test_failed_write_does_not_fail_other_items(client, signed_in, backend, monkeypatch):
+    real_put = server.put_secret
+
+    def flaky_put(sub, profile, payload):
+        if profile == "bad":
+            raise RuntimeError("secret store unavailable")
+        real_put(sub, profile, payload)
+
+    monkeypatch.setattr(server, "put_secret", flaky_put)
+    body = _bulk(client, [{"profile": name, **_CREDS} for name in ("a", "bad", "c")])
+
+    assert body["success"] is False
+    assert body["results"] == [
+        {"profile": "a", "status": "ok"},
+        {"profile": "bad", "status": "error", "error": "secret store unavailable"},
+        {"profile": "c", "status": "ok"},
+    ]
+    assert _stored(backend, signed_in) == {"a", "c"}
+
+
+def test_results_follow_input_order_and_cache_is_dropped(client, signed_in, backend):
+    client.get("/api/profiles")
+    assert server._profiles_cache.get(signed_in) is not None
+
+    names = [f"n{i}" for i in (5, 1, 4, 2, 3)]
+    body = _bulk(client, [{"profile": name, **_CREDS} for name in names])
+
+    assert body["success"] is True
+    assert [r["profile"] for r in body["results"]] == names
+    assert server._profiles_cache.get(signed_in) is None
@@ -0,0 +1,44 @@
+"""The web API's per-subject profile listing cache."""
+
+import server
+
+_CREDS = {"username": "BOOMI_TOKEN.u", "password": "pw", "account_id": "acct-1"}
+
+
+def _save(client, name):
+    return client.post("/api/credentials", json={"profile": name, **_CREDS})
+
+
+def test_listing_is_cached_until_a_save(client, signed_in, backend):
+    backend.put_secret(signed_in, "dev", _CREDS)
+    assert [p["name"] for p in client.get("/api/profiles").json()["profiles"]] == ["dev"]
+    assert server._profiles_cache.get(signed_in) is not None
+
+    assert _save(client, "prod").status_code == 200
+    assert server._profiles_cache.get(signed_in) is None
+    names = {p["name"] for p in client.get("/api/profiles").json()["profiles"]}
+    assert names == {"dev", "prod"}
+
+
+def test_delete_drops_cached_listing(client, signed_in, backend):
+    backend.put_secret(signed_in, "dev", _CREDS)
+    client.get("/api/profiles")
+
+    assert client.delete("/api/profiles/dev").status_code == 200
+    assert server._profiles_cache.get(signed_in) is None
+    assert client.get("/api/profiles").json()["profiles"] == []
+
+
+def test_profile_limit_ignores_stale_cached_listing(client, signed_in, backend):
+    for i in range(10):
+        backend.put_secret(signed_in, f"p{i}", _CREDS)
+    # A listing cached before another instance stored those ten profiles.
+    server._profiles_cache.set(signed_in, [])
+
+    response = _save(client, "eleventh")
+    assert response.status_code == 400
+    assert "Profile limit reached" in response.json()["error"]
+    assert "eleventh" not in {p["profile"] for p in backend.list_profiles(signed_in)}
+
+    bulk = client.post("/api/credentials/bulk", json={"profiles": [{"profile": "eleventh", **_CREDS}]})
+    assert bulk.json()["results"][0]["error"] == "Profile limit reached (10 profiles per user)"